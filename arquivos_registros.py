@@ -0,0 +1,236 @@
+"""
+Leitura e escrita em streaming dos arquivos de registros
+Usado pelo coletor (escrita) e pelo importador (leitura): JSON (lista),
+JSON Lines e as versões comprimidas com gzip ou zstd. Também lê os
+arquivos anuais de dados abertos da Câmara (CSV com ';' ou JSON)
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+
+try:
+    import zstandard
+except ImportError:  # zstd é opcional: pip install zstandard
+    zstandard = None
+
+FORMATOS = ('json', 'jsonl')
+COMPRESSOES = ('gzip', 'zstd')
+EXTENSOES_COMPRESSAO = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def nome_saida(nome_arquivo, formato='json', compressao=None):
+    """Ajusta a extensão de 'votos.json' para o formato/compressão escolhidos"""
+    base = nome_arquivo[:-len('.json')] if nome_arquivo.endswith('.json') else nome_arquivo
+    return f"{base}.{formato}{EXTENSOES_COMPRESSAO.get(compressao, '')}"
+
+
+def localizar_arquivo(caminho):
+    """
+    Retorna o caminho existente para 'dados/votos.json' considerando as
+    variantes .jsonl, .json.gz, .jsonl.gz, .jsonl.zst...; None se não houver
+    """
+    base = caminho[:-len('.json')] if caminho.endswith('.json') else caminho
+    for formato in FORMATOS:
+        for sufixo in ('',) + tuple(EXTENSOES_COMPRESSAO.values()):
+            candidato = f"{base}.{formato}{sufixo}"
+            if os.path.exists(candidato):
+                return candidato
+    return caminho if os.path.exists(caminho) else None
+
+
+def _abrir_texto(caminho, modo):
+    """Abre o arquivo em modo texto, comprimindo/descomprimindo pela extensão"""
+    if caminho.endswith('.gz'):
+        return gzip.open(caminho, modo + 't', encoding='utf-8')
+    if caminho.endswith('.zst'):
+        if zstandard is None:
+            raise RuntimeError("Compressão zstd requer o pacote 'zstandard' (pip install zstandard)")
+        bruto = open(caminho, modo + 'b')
+        if modo == 'w':
+            fluxo = zstandard.ZstdCompressor().stream_writer(bruto, closefd=True)
+        else:
+            fluxo = zstandard.ZstdDecompressor().stream_reader(bruto, closefd=True)
+        return io.TextIOWrapper(fluxo, encoding='utf-8')
+    return open(caminho, modo, encoding='utf-8')
+
+
+class EscritorRegistros:
+    """
+    Escreve registros um a um, sem manter a lista em memória
+
+    Em 'jsonl' grava um objeto por linha; em 'json' produz exatamente o
+    mesmo texto que json.dump(lista, indent=2).
+    """
+
+    def __init__(self, caminho, formato='json'):
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato inválido: {formato}")
+        self.caminho = caminho
+        self.formato = formato
+        self.total = 0
+        self._arquivo = _abrir_texto(caminho, 'w')
+
+    def escrever(self, registro):
+        if self.formato == 'jsonl':
+            self._arquivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+        else:
+            texto = json.dumps(registro, ensure_ascii=False, indent=2)
+            self._arquivo.write('[\n' if self.total == 0 else ',\n')
+            self._arquivo.write('\n'.join('  ' + linha for linha in texto.split('\n')))
+        self.total += 1
+
+    def escrever_varios(self, registros):
+        for registro in registros:
+            self.escrever(registro)
+
+    def fechar(self):
+        if self.formato == 'json':
+            self._arquivo.write('\n]' if self.total else '[]')
+        self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def _iterar_array_json(arquivo, tamanho_bloco=1 << 16):
+    """
+    Decodifica incrementalmente os elementos de uma lista JSON, um de cada
+    vez: a lista pura ou o array da chave "dados" do envelope da API
+    ({"links": [...], "dados": [...]}), pulando as demais chaves
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    fim_arquivo = False
+
+    def ler_mais():
+        nonlocal buffer, pos, fim_arquivo
+        bloco = arquivo.read(tamanho_bloco)
+        if not bloco:
+            fim_arquivo = True
+        buffer = buffer[pos:] + bloco
+        pos = 0
+
+    def proximo_caractere(separadores=''):
+        """Pula espaços (e os separadores dados); None no fim do arquivo"""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n' + separadores:
+                pos += 1
+            if pos < len(buffer):
+                return buffer[pos]
+            if fim_arquivo:
+                return None
+            ler_mais()
+
+    def decodificar():
+        nonlocal pos
+        while True:
+            try:
+                valor, fim = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if fim_arquivo:
+                    raise
+                ler_mais()
+                continue
+            # Um número cortado no fim do bloco ('1', '1.', '1e') pode continuar no próximo
+            resto = buffer[fim:]
+            if not fim_arquivo and (not resto or (type(valor) in (int, float) and
+                                                  not resto.strip('0123456789.eE+-'))):
+                ler_mais()
+                continue
+            pos = fim
+            return valor
+
+    inicio = proximo_caractere()
+    if inicio == '{':
+        # Envelope: descarta chaves como "links" até achar o array "dados"
+        pos += 1
+        while True:
+            caractere = proximo_caractere(',')
+            if caractere is None:
+                raise ValueError("JSON truncado: objeto não foi fechado")
+            if caractere == '}':
+                return
+            chave = decodificar()
+            if proximo_caractere(':') == '[' and chave == 'dados':
+                break
+            decodificar()
+    elif inicio != '[':
+        return
+    pos += 1
+
+    while True:
+        caractere = proximo_caractere(',')
+        if caractere is None:
+            raise ValueError("JSON truncado: array não foi fechado")
+        if caractere == ']':
+            return
+        yield decodificar()
+        if pos > tamanho_bloco:
+            buffer = buffer[pos:]
+            pos = 0
+
+
+def iterar_registros(caminho):
+    """Itera os registros de um arquivo .json/.jsonl (comprimido ou não) em streaming"""
+    with _abrir_texto(caminho, 'r') as arquivo:
+        if '.jsonl' in os.path.basename(caminho):
+            for linha in arquivo:
+                if linha.strip():
+                    yield json.loads(linha)
+        else:
+            yield from _iterar_array_json(arquivo)
+
+
+def _achatar(registro, prefixo=''):
+    """Achata objetos aninhados: {'deputado_': {'id': 1}} -> {'deputado_id': 1}"""
+    plano = {}
+    for chave, valor in registro.items():
+        # Os CSVs da Câmara usam 'deputado_.id'; o JSON aninha em 'deputado_'
+        nome = (prefixo + chave).replace('_.', '_')
+        if isinstance(valor, dict):
+            plano.update(_achatar(valor, nome if nome.endswith('_') else nome + '_'))
+        else:
+            plano[nome] = valor
+    return plano
+
+
+def iterar_dump(caminho):
+    """
+    Itera as linhas de um arquivo de dados abertos da Câmara
+    (ex.: votacoesVotos-2023.csv ou .json) como dicionários planos
+    """
+    if caminho.endswith('.csv') or caminho.endswith('.csv.gz'):
+        with _abrir_texto(caminho, 'r') as arquivo:
+            # Os CSVs vêm com BOM e separador ';'
+            primeira = arquivo.read(1)
+            if primeira != '\ufeff':
+                arquivo = _prefixar(primeira, arquivo)
+            for linha in csv.DictReader(arquivo, delimiter=';'):
+                yield _achatar(linha)
+    else:
+        for registro in iterar_registros(caminho):
+            yield _achatar(registro)
+
+
+def _prefixar(texto, arquivo):
+    """Devolve um iterável de linhas que recoloca `texto` antes do restante do arquivo"""
+    primeira_linha = texto + arquivo.readline()
+    yield primeira_linha
+    yield from arquivo
+
+
+def localizar_dump(diretorio, nome_base):
+    """Procura nome_base.csv/.json (comprimidos ou não) no diretório dos dumps"""
+    for extensao in ('.csv', '.json', '.csv.gz', '.json.gz'):
+        caminho = os.path.join(diretorio, nome_base + extensao)
+        if os.path.exists(caminho):
+            return caminho
+    return None
@@ -0,0 +1,251 @@
+"""
+Benchmark do coletor contra uma API simulada local
+Sobe um servidor HTTP que imita os endpoints usados da API da Câmara
+(com latência artificial) e compara a coleta sequencial com a concorrente
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import deque
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, urlencode
+
+from coletor_dados import ColetorDadosCamara
+
+
+class DadosSimulados:
+    """Gera um conjunto de dados determinístico com o formato da API v2"""
+
+    def __init__(self, n_deputados=120, n_frentes=80, n_proposicoes=150, n_votacoes=40, semente=42):
+        rnd = random.Random(semente)
+        siglas = ['PT', 'PL', 'UNIÃO', 'PP', 'MDB', 'PSD', 'REPUBLICANOS', 'PDT']
+        ufs = ['SP', 'RJ', 'MG', 'BA', 'RS', 'PR', 'PE', 'CE']
+
+        self.partidos = [{'id': 1000 + i, 'sigla': s, 'nome': f'Partido {s}',
+                          'uri': f'/partidos/{1000 + i}'} for i, s in enumerate(siglas)]
+        self.deputados = [{'id': 200000 + i, 'nome': f'Deputado {i:04d}',
+                           'siglaPartido': rnd.choice(siglas), 'siglaUf': rnd.choice(ufs),
+                           'idLegislatura': 57, 'urlFoto': '', 'email': None}
+                          for i in range(n_deputados)]
+        self.frentes = [{'id': 50000 + i, 'titulo': f'Frente Parlamentar {i:04d}',
+                         'idLegislatura': 57} for i in range(n_frentes)]
+        dias = [(date(2019, 1, 1) + timedelta(days=rnd.randrange(6 * 365))).isoformat()
+                for _ in range(n_proposicoes + n_votacoes)]
+        self.proposicoes = [{'id': 2300000 + i, 'siglaTipo': rnd.choice(['PL', 'PEC', 'REQ']),
+                             'numero': i, 'ano': int(dias[i][:4]), 'data': dias[i]}
+                            for i in range(n_proposicoes)]
+        self.votacoes = [{'id': f'{2300000 + i}-{i % 90}', 'data': dias[n_proposicoes + i]}
+                         for i in range(n_votacoes)]
+        self.orgaos = [{'id': 100 + i, 'sigla': f'C{i:02d}'} for i in range(12)]
+
+        ids = [d['id'] for d in self.deputados]
+        self.membros = {f['id']: rnd.sample(ids, min(len(ids), rnd.randint(5, 40))) for f in self.frentes}
+        self.autores = {p['id']: rnd.sample(ids, rnd.randint(1, 3)) for p in self.proposicoes}
+        self.por_id = {d['id']: d for d in self.deputados}
+
+    def listas(self):
+        return {
+            'partidos': self.partidos, 'deputados': self.deputados, 'frentes': self.frentes,
+            'proposicoes': self.proposicoes, 'votacoes': self.votacoes, 'orgaos': self.orgaos,
+        }
+
+
+class ServidorApiSimulado:
+    """Servidor HTTP local (keep-alive) que responde como a API da Câmara"""
+
+    def __init__(self, dados, latencia=0.05, limite_por_segundo=None):
+        self.dados = dados
+        self.latencia = latencia
+        self.limite_por_segundo = limite_por_segundo
+        self.requisicoes = 0
+        self.recusadas = 0
+        self._janela = deque()
+        self._lock = threading.Lock()
+        self._servidor = ThreadingHTTPServer(('127.0.0.1', 0), self._criar_handler())
+        self._servidor.daemon_threads = True
+        self._thread = threading.Thread(target=self._servidor.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, porta = self._servidor.server_address[:2]
+        return f"http://{host}:{porta}/api/v2"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._servidor.shutdown()
+        self._servidor.server_close()
+
+    def _excedeu_limite(self):
+        """Janela deslizante de 1 s para simular o limite de taxa do servidor"""
+        if self.limite_por_segundo is None:
+            return False
+        agora = time.monotonic()
+        while self._janela and agora - self._janela[0] > 1.0:
+            self._janela.popleft()
+        if len(self._janela) >= self.limite_por_segundo:
+            self.recusadas += 1
+            return True
+        self._janela.append(agora)
+        return False
+
+    def responder(self, caminho, params):
+        """Resolve uma rota da API simulada, retornando (status, corpo)"""
+        partes = [p for p in caminho.split('/') if p][2:]  # remove 'api', 'v2'
+        listas = self.dados.listas()
+
+        if len(partes) == 1 and partes[0] in listas:
+            itens = int(params.get('itens', ['100'])[0])
+            pagina = int(params.get('pagina', ['1'])[0])
+            todos = listas[partes[0]]
+            if 'dataInicio' in params and partes[0] in ('proposicoes', 'votacoes'):
+                inicio, fim = params['dataInicio'][0], params.get('dataFim', ['9999'])[0]
+                todos = [item for item in todos if inicio <= item['data'] <= fim]
+            ultima = max(1, -(-len(todos) // itens))
+            base = {k: v[0] for k, v in params.items() if k != 'pagina'}
+            links = [{'rel': 'self', 'href': f"{caminho}?{urlencode({**base, 'pagina': pagina})}"},
+                     {'rel': 'last', 'href': f"{caminho}?{urlencode({**base, 'pagina': ultima})}"}]
+            if pagina < ultima:
+                links.append({'rel': 'next', 'href': f"{caminho}?{urlencode({**base, 'pagina': pagina + 1})}"})
+            return 200, {'dados': todos[(pagina - 1) * itens:pagina * itens], 'links': links}
+
+        if len(partes) == 2 and partes[0] == 'deputados':
+            dep = self.dados.por_id.get(int(partes[1]))
+            return (200, {'dados': dict(dep, detalhado=True)}) if dep else (404, {})
+
+        if len(partes) == 3:
+            recurso, id_recurso, sub = partes
+            if recurso == 'frentes' and sub == 'membros':
+                ids = self.dados.membros.get(int(id_recurso), [])
+                return 200, {'dados': [{'id': i, 'nome': self.dados.por_id[i]['nome'],
+                                        'titulo': 'Membro'} for i in ids]}
+            if recurso == 'proposicoes' and sub == 'autores':
+                ids = self.dados.autores.get(int(id_recurso), [])
+                return 200, {'dados': [{'id': i, 'nome': self.dados.por_id[i]['nome'], 'tipo': 'Deputado',
+                                        'uri': f'/deputados/{i}'} for i in ids]}
+            if recurso == 'votacoes' and sub == 'votos':
+                return 200, {'dados': [{'tipoVoto': 'Sim' if d['id'] % 3 else 'Não',
+                                        'deputado_': {k: d[k] for k in ('id', 'nome', 'siglaPartido', 'siglaUf')}}
+                                       for d in self.dados.deputados]}
+
+        return 404, {}
+
+    def _criar_handler(self):
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True  # Cabeçalho e corpo saem em writes separados
+
+            def do_GET(self):
+                with servidor._lock:
+                    servidor.requisicoes += 1
+                    recusar = servidor._excedeu_limite()
+                time.sleep(servidor.latencia)
+                url = urlparse(self.path)
+                if recusar:
+                    status, corpo = 429, {}
+                else:
+                    status, corpo = servidor.responder(url.path, parse_qs(url.query))
+                conteudo = json.dumps(corpo, ensure_ascii=False).encode('utf-8')
+                etag = '"%s"' % hashlib.md5(conteudo).hexdigest()
+                if status == 200 and self.headers.get('If-None-Match') == etag:
+                    status, conteudo = 304, b''
+                self.send_response(status)
+                if recusar:
+                    self.send_header('Retry-After', '1')
+                if status in (200, 304):
+                    self.send_header('ETag', etag)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(conteudo)))
+                self.end_headers()
+                self.wfile.write(conteudo)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def executar_coleta(base_url, concorrencia, diretorio, taxa, janela=None):
+    """Executa uma coleta completa silenciosa e retorna o tempo gasto e as métricas de conexão"""
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        coletor = ColetorDadosCamara(output_dir=diretorio, base_url=base_url,
+                                     concorrencia=concorrencia, taxa=taxa, rajada=concorrencia,
+                                     usar_cache=False)
+        coletor.coletar_dados_completos(max_proposicoes=None, max_votacoes=None, janela=janela)
+        coletor.close()
+    return time.perf_counter() - inicio, coletor.metricas_conexoes()
+
+
+def comparar_saidas(dir_a, dir_b):
+    """Confere se as duas coletas escreveram exatamente os mesmos arquivos"""
+    def listar(diretorio):
+        return sorted(n for n in os.listdir(diretorio) if os.path.isfile(os.path.join(diretorio, n)))
+
+    arquivos = listar(dir_a)
+    if arquivos != listar(dir_b):
+        return False
+    for nome in arquivos:
+        with open(os.path.join(dir_a, nome), 'rb') as fa, open(os.path.join(dir_b, nome), 'rb') as fb:
+            if fa.read() != fb.read():
+                return False
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark do coletor contra API simulada')
+    parser.add_argument('--latencia', type=float, default=0.05,
+                        help='Latência simulada por requisição (segundos)')
+    parser.add_argument('--concorrencia', type=int, nargs='+', default=[1, 4, 16],
+                        help='Níveis de concorrência a comparar')
+    parser.add_argument('--taxa', type=float, default=1000.0,
+                        help='Taxa do limitador do coletor (req/s)')
+    parser.add_argument('--limite-servidor', type=float, default=None,
+                        help='Req/s aceitas pela API simulada antes de responder 429')
+    parser.add_argument('--janela', choices=['mes', 'trimestre', 'ano'], default=None,
+                        help='Coleta proposições e votações em janelas de datas')
+    parser.add_argument('--frentes', type=int, default=80)
+    parser.add_argument('--proposicoes', type=int, default=150)
+    parser.add_argument('--votacoes', type=int, default=40)
+    args = parser.parse_args()
+
+    dados = DadosSimulados(n_frentes=args.frentes, n_proposicoes=args.proposicoes,
+                           n_votacoes=args.votacoes)
+
+    print("="*70)
+    print(f"⏱  BENCHMARK DO COLETOR (latência simulada: {args.latencia*1000:.0f} ms)")
+    print("="*70)
+
+    with ServidorApiSimulado(dados, latencia=args.latencia,
+                             limite_por_segundo=args.limite_servidor) as servidor, \
+            tempfile.TemporaryDirectory() as raiz:
+        referencia = None
+        tempo_base = None
+        for nivel in args.concorrencia:
+            servidor.requisicoes = servidor.recusadas = 0
+            diretorio = os.path.join(raiz, f'c{nivel}')
+            tempo, conexoes = executar_coleta(servidor.base_url, nivel, diretorio, args.taxa,
+                                              args.janela)
+            tempo_base = tempo_base or tempo
+            identico = comparar_saidas(referencia, diretorio) if referencia else True
+            referencia = referencia or diretorio
+            print(f"  • concorrência {nivel:>3}: {tempo:7.2f}s | {servidor.requisicoes} requisições "
+                  f"({servidor.recusadas} com 429) | "
+                  f"speedup {tempo_base / tempo:5.1f}x | saída idêntica: {'sim' if identico else 'NÃO'}")
+            print(f"      conexões abertas: {conexoes['conexoes_abertas']} | "
+                  f"reutilizadas: {conexoes['conexoes_reutilizadas']}")
+
+    print("="*70)
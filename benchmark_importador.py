@@ -0,0 +1,214 @@
+"""
+Benchmark de vazão do importador (votos e autorias)
+Gera um conjunto sintético de votações/proposições e mede as linhas/s das
+etapas VOTOU e AUTOR_DE para vários tamanhos de lote e números de workers.
+Por padrão usa um driver simulado em processo (latência por transação e
+custo por linha configuráveis); com --uri mede contra um Neo4j local.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+
+from arquivos_registros import EscritorRegistros
+from importar_aura import ImportadorNeo4jAura, TIPOS_VOTO
+
+
+class ResumoSimulado:
+    """Imita o ResultSummary do driver (só o que o importador lê)"""
+
+    class Contadores:
+        nodes_created = nodes_deleted = relationships_created = relationships_deleted = 0
+        properties_set = labels_added = 0
+
+    counters = Contadores()
+
+    def __init__(self, milissegundos=0):
+        # Tempo "de servidor" simulado, dividido como o Bolt informa
+        self.result_available_after = milissegundos
+        self.result_consumed_after = 0
+
+
+class ResultadoSimulado:
+    def __init__(self, milissegundos=0):
+        self.milissegundos = milissegundos
+
+    def consume(self):
+        return ResumoSimulado(self.milissegundos)
+
+    def single(self):
+        return {'count': 0}
+
+    def __iter__(self):
+        return iter([])
+
+
+class DriverSimulado:
+    """
+    Driver em processo que não executa Cypher: cada commit custa `latencia`
+    (ida e volta da rede) e cada linha custa `custo_linha` segundos num
+    servidor com `capacidade` núcleos. Os parâmetros são serializados para
+    medir o custo de montar os lotes no cliente.
+    """
+
+    def __init__(self, latencia=0.01, custo_linha=0.00002, capacidade=4):
+        self.latencia = latencia
+        self.custo_linha = custo_linha
+        self.transacoes = 0
+        self.linhas = 0
+        self.bytes_enviados = 0
+        self._nucleos = threading.Semaphore(capacidade)
+        self._lock = threading.Lock()
+
+    def _executar(self, query, parametros):
+        carga = json.dumps(parametros, ensure_ascii=False, default=str).encode('utf-8')
+        linhas = len(parametros.get('rows', ()))
+        with self._nucleos:
+            time.sleep(self.custo_linha * linhas)
+        with self._lock:
+            self.linhas += linhas
+            self.bytes_enviados += len(query) + len(carga)
+        return ResultadoSimulado(round(self.custo_linha * linhas * 1000))
+
+    def _commit(self):
+        time.sleep(self.latencia)
+        with self._lock:
+            self.transacoes += 1
+
+    def session(self, **kwargs):
+        return SessaoSimulada(self)
+
+    def verify_connectivity(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class SessaoSimulada:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def run(self, query, parametros=None, **kwargs):
+        resultado = self.driver._executar(query, dict(parametros or {}, **kwargs))
+        self.driver._commit()
+        return resultado
+
+    def execute_write(self, funcao, *args, **kwargs):
+        resultado = funcao(TransacaoSimulada(self.driver), *args, **kwargs)
+        self.driver._commit()
+        return resultado
+
+
+class TransacaoSimulada:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def run(self, query, parametros=None, **kwargs):
+        return self.driver._executar(query, dict(parametros or {}, **kwargs))
+
+
+def gerar_dados(diretorio, n_deputados=513, n_votacoes=60, n_proposicoes=2000, semente=42):
+    """Grava deputados, votações, votos e autorias sintéticos (JSON Lines)"""
+    rnd = random.Random(semente)
+    tipos = [t for t in TIPOS_VOTO if t != 'Outro'] + ['Presidente']
+    os.makedirs(diretorio, exist_ok=True)
+
+    def gravar(nome, registros):
+        with EscritorRegistros(os.path.join(diretorio, nome + '.jsonl'), 'jsonl') as saida:
+            saida.escrever_varios(registros)
+            return saida.total
+
+    ids = [200000 + i for i in range(n_deputados)]
+    gravar('deputados', ({'id': i, 'nome': f'Deputado {i}', 'siglaPartido': 'PT', 'siglaUf': 'SP',
+                          'idLegislatura': 57} for i in ids))
+    votacoes = [f'{2300000 + i}-{i % 90}' for i in range(n_votacoes)]
+    gravar('votacoes', ({'id': v, 'data': '2023-05-01'} for v in votacoes))
+    votos = gravar('votos', ({'idVotacao': v, 'dataVotacao': '2023-05-01', 'idDeputado': d,
+                              'voto': rnd.choice(tipos)} for v in votacoes for d in ids))
+    gravar('proposicoes', ({'id': 2400000 + i, 'siglaTipo': 'PL'} for i in range(n_proposicoes)))
+    autores = gravar('autores_proposicoes', (
+        {'idProposicao': 2400000 + i, 'tipoProposicao': 'PL', 'idAutor': d,
+         'uriAutor': f'/deputados/{d}', 'tipo': 'Deputado'}
+        for i in range(n_proposicoes) for d in rnd.sample(ids, rnd.randint(1, 4))))
+    return votos, autores
+
+
+def executar_cenario(dados, tamanho_lote, workers, driver=None, uri=None, usuario=None, senha=None):
+    """Importa deputados, votações, votos e autorias; retorna as etapas medidas (MetricasImportacao)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        importador = ImportadorNeo4jAura(uri=uri, username=usuario, password=senha,
+                                         tamanho_lote=tamanho_lote, workers=workers, driver=driver,
+                                         arquivo_estado=os.path.join(dados, '.estado_importacao.json'))
+        try:
+            if driver is None:
+                importador.limpar_banco()
+            importador.criar_constraints()
+            importador.importar_deputados(os.path.join(dados, 'deputados.json'))
+            importador.importar_votacoes(os.path.join(dados, 'votacoes.json'))
+            importador.importar_votos(os.path.join(dados, 'votos.json'))
+            importador.importar_proposicoes(os.path.join(dados, 'proposicoes.json'))
+            importador.importar_autores(os.path.join(dados, 'autores_proposicoes.json'))
+        finally:
+            importador.close()
+    return importador.metricas.relatorio()['etapas']
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark de vazão do importador (VOTOU/AUTOR_DE)')
+    parser.add_argument('--lotes', type=int, nargs='+', default=[100, 1000, 5000],
+                        help='Tamanhos de lote a comparar (1 = uma transação por linha)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4],
+                        help='Números de workers a comparar')
+    parser.add_argument('--deputados', type=int, default=513)
+    parser.add_argument('--votacoes', type=int, default=60)
+    parser.add_argument('--proposicoes', type=int, default=2000)
+    parser.add_argument('--latencia', type=float, default=0.01,
+                        help='Driver simulado: ida e volta por transação (segundos)')
+    parser.add_argument('--custo-linha', type=float, default=0.00002,
+                        help='Driver simulado: tempo de servidor por linha (segundos)')
+    parser.add_argument('--uri', default=None,
+                        help='Mede contra um Neo4j real (ex.: bolt://localhost:7687); O BANCO É LIMPO')
+    parser.add_argument('--usuario', default='neo4j')
+    parser.add_argument('--senha', default=None)
+    args = parser.parse_args()
+
+    print("="*70)
+    alvo = args.uri or f"driver simulado (latência {args.latencia*1000:.0f} ms/transação)"
+    print(f"⏱  BENCHMARK DO IMPORTADOR - {alvo}")
+    print("="*70)
+
+    with tempfile.TemporaryDirectory() as dados:
+        n_votos, n_autores = gerar_dados(dados, args.deputados, args.votacoes, args.proposicoes)
+        print(f"  Dados: {n_votos:,} votos, {n_autores:,} autorias, {args.deputados} deputados\n")
+        if not args.uri:
+            print(f"  Linha a linha seriam ~{(n_votos + n_autores) * args.latencia:,.0f}s "
+                  f"só de idas e voltas\n")
+
+        for workers in args.workers:
+            for tamanho_lote in args.lotes:
+                driver = None if args.uri else DriverSimulado(args.latencia, args.custo_linha)
+                etapas = executar_cenario(dados, tamanho_lote, workers, driver,
+                                          args.uri, args.usuario, args.senha)
+                votos, autores = etapas['votos'], etapas['autores']
+                extra = f" | {driver.transacoes:,} transações" if driver else ""
+                print(f"  • lote {tamanho_lote:>5} | {workers} workers | "
+                      f"VOTOU {votos['linhas_por_segundo'] or 0:>10,.0f} linhas/s ({votos['segundos']:.2f}s) | "
+                      f"AUTOR_DE {autores['linhas_por_segundo'] or 0:>9,.0f} linhas/s{extra}")
+                print(f"      VOTOU: servidor {votos['segundos_servidor']:.2f}s, "
+                      f"cliente/rede {votos['segundos_cliente_rede']:.2f}s, "
+                      f"leitura {votos['segundos_leitura']:.2f}s, lote p95 {votos['lote_p95_s'] or 0:.3f}s")
+
+    print("="*70)
@@ -1,21 +1,743 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
 import json
 import time
-from datetime import datetime
+import asyncio
+import hashlib
+import random
+import re
+import sqlite3
+import threading
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import List, Dict, Optional
+from urllib.parse import urlparse, parse_qs
 import os
 
+from arquivos_registros import (EscritorRegistros, iterar_registros, localizar_arquivo,
+                                nome_saida, iterar_dump, localizar_dump, FORMATOS, COMPRESSOES)
+
+
+def template_endpoint(url):
+    """
+    Reduz uma URL da API à sua família de endpoint, trocando os
+    identificadores por {id} (ex.: /frentes/{id}/membros)
+    """
+    caminho = urlparse(url).path
+    if '/api/v2' in caminho:
+        caminho = caminho.split('/api/v2', 1)[1]
+    partes = ['{id}' if re.search(r'\d', parte) else parte
+              for parte in caminho.strip('/').split('/') if parte]
+    return '/' + '/'.join(partes)
+
+
+MESES_POR_JANELA = {'mes': 1, 'trimestre': 3, 'ano': 12}
+
+
+def janelas_periodo(data_inicio, data_fim, janela='trimestre'):
+    """
+    Divide o período em janelas de calendário (mês, trimestre ou ano),
+    devolvendo pares (inicio, fim) em ISO, das mais recentes para as antigas
+    """
+    meses = MESES_POR_JANELA[janela]
+    inicio, fim = date.fromisoformat(data_inicio), date.fromisoformat(data_fim)
+    janelas = []
+    # Alinha ao início da janela de calendário que contém data_inicio
+    atual = date(inicio.year, inicio.month - (inicio.month - 1) % meses, 1)
+    while atual <= fim:
+        mes = atual.month - 1 + meses
+        proxima = date(atual.year + mes // 12, mes % 12 + 1, 1)
+        janelas.append((max(atual, inicio).isoformat(),
+                        min(proxima - timedelta(days=1), fim).isoformat()))
+        atual = proxima
+    return janelas[::-1]
+
+
+# Arquivos anuais publicados em https://dadosabertos.camara.leg.br/arquivos
+# ({ano} é substituído; frentesDeputados não é separado por ano)
+ARQUIVOS_ANUAIS = {
+    'votacoesVotos': 'votacoesVotos/csv/votacoesVotos-{ano}.csv',
+    'votacoes': 'votacoes/csv/votacoes-{ano}.csv',
+    'proposicoesAutores': 'proposicoesAutores/csv/proposicoesAutores-{ano}.csv',
+    'proposicoes': 'proposicoes/csv/proposicoes-{ano}.csv',
+    'frentesDeputados': 'frentesDeputados/csv/frentesDeputados.csv',
+}
+ANOS_PADRAO = tuple(range(2019, 2025))
+
+
+def _inteiro(valor):
+    """Converte ids vindos do CSV ('204554') para int, mantendo vazios como None"""
+    if valor is None or valor == '':
+        return None
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return valor
+
+
+class PaginasNaoColetadas(Exception):
+    """
+    Paginação que terminou com páginas faltando mesmo após as retentativas;
+    `dados` traz o que foi coletado e `paginas` o que faltou
+    """
+
+    def __init__(self, paginas, dados):
+        super().__init__(f"Páginas não coletadas: {paginas}")
+        self.paginas = paginas
+        self.dados = dados
+
+
+class LimitadorTaxa:
+    """
+    Token bucket compartilhável entre threads e tarefas asyncio
+
+    Libera `taxa` requisições por segundo com rajadas de até `rajada`.
+    Quando o servidor reclama (429/503, Retry-After ou cabeçalhos de
+    rate limit zerados) o limitador pausa com backoff + jitter e reduz a
+    taxa pela metade; a cada segundo sem recusas a taxa volta a subir até
+    o valor configurado.
+    """
+
+    STATUS_SOBRECARGA = (429, 503)
+
+    def __init__(self, taxa=8.0, rajada=16, taxa_minima=0.5, backoff_base=2.0, backoff_max=120.0):
+        self.taxa_maxima = float(taxa)
+        self.taxa = float(taxa)
+        self.rajada = max(1, rajada)
+        self.taxa_minima = min(taxa_minima, self.taxa_maxima)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.tempo_espera_total = 0.0
+
+        self._tokens = float(self.rajada)
+        self._relogio = time.monotonic()  # Pode estar no futuro durante uma pausa
+        self._recusas_seguidas = 0
+        self._ultimo_ajuste = 0.0
+        self._lock = threading.Lock()
+
+    def _reservar(self):
+        """Reserva um token e retorna quantos segundos esperar antes de usá-lo"""
+        with self._lock:
+            agora = time.monotonic()
+            if agora > self._relogio:
+                self._tokens = min(self.rajada, self._tokens + (agora - self._relogio) * self.taxa)
+                self._relogio = agora
+            self._tokens -= 1
+            espera = (self._relogio - agora) + max(0.0, -self._tokens) / self.taxa
+            self.tempo_espera_total += espera
+            return espera
+
+    def aguardar(self):
+        """Bloqueia a thread atual até haver um token disponível"""
+        espera = self._reservar()
+        if espera > 0:
+            time.sleep(espera)
+        return espera
+
+    async def aguardar_async(self):
+        """Versão para tarefas asyncio (não bloqueia o event loop)"""
+        espera = self._reservar()
+        if espera > 0:
+            await asyncio.sleep(espera)
+        return espera
+
+    def _pausar(self, segundos):
+        """Empurra a liberação de novos tokens para daqui a `segundos`"""
+        self._relogio = max(self._relogio, time.monotonic() + segundos)
+        self._tokens = min(self._tokens, 0.0)
+
+    @staticmethod
+    def _segundos_ate(valor):
+        """Interpreta um Retry-After/Reset (segundos, epoch ou data HTTP)"""
+        if valor is None:
+            return None
+        try:
+            numero = float(valor)
+        except ValueError:
+            try:
+                data = parsedate_to_datetime(valor)
+            except (TypeError, ValueError):
+                return None
+            return max(0.0, (data - datetime.now(timezone.utc)).total_seconds())
+        if numero > 1e9:  # Epoch em segundos
+            return max(0.0, numero - time.time())
+        return max(0.0, numero)
+
+    def registrar_resposta(self, status_code, headers):
+        """Ajusta o ritmo a partir do status e dos cabeçalhos de uma resposta"""
+        retry_after = self._segundos_ate(headers.get('Retry-After'))
+
+        restantes = headers.get('X-RateLimit-Remaining', headers.get('RateLimit-Remaining'))
+        reset = self._segundos_ate(headers.get('X-RateLimit-Reset', headers.get('RateLimit-Reset')))
+
+        with self._lock:
+            if status_code in self.STATUS_SOBRECARGA:
+                self._recusas_seguidas += 1
+                if self._relogio <= time.monotonic():
+                    # Reduz só uma vez por episódio, não uma vez por thread recusada
+                    self.taxa = max(self.taxa_minima, self.taxa / 2)
+                    self._ultimo_ajuste = time.monotonic()
+                if retry_after is None:
+                    retry_after = min(self.backoff_max,
+                                      self.backoff_base * 2 ** (self._recusas_seguidas - 1))
+                # Jitter evita que todas as threads voltem no mesmo instante
+                self._pausar(retry_after + random.uniform(0, retry_after * 0.25 + 0.1))
+                return
+
+            self._recusas_seguidas = 0
+            if restantes is not None and reset is not None and restantes.strip() == '0':
+                # Cota esgotada: espera o reset anunciado em vez de tomar um 429
+                self._pausar(reset + random.uniform(0, 0.5))
+            elif self.taxa < self.taxa_maxima and time.monotonic() - self._ultimo_ajuste >= 1.0:
+                # Recuperação aditiva: +5% da taxa configurada por segundo sem recusas
+                self.taxa = min(self.taxa_maxima, self.taxa + self.taxa_maxima * 0.05)
+                self._ultimo_ajuste = time.monotonic()
+
+
+class CacheRespostas:
+    """
+    Cache persistente (SQLite) das respostas da API, chaveado por URL e
+    parâmetros. Cada família de endpoint tem seu TTL; entradas vencidas
+    são revalidadas com ETag/Last-Modified e o tamanho total é limitado
+    com descarte LRU.
+    """
+
+    HORA = 3600
+    DIA = 24 * HORA
+
+    TTL_POR_ENDPOINT = {
+        '/partidos': 7 * DIA,
+        '/deputados': DIA,
+        '/deputados/{id}': 7 * DIA,
+        '/frentes': DIA,
+        '/frentes/{id}/membros': 3 * DIA,
+        '/proposicoes': 6 * HORA,
+        '/proposicoes/{id}/autores': 30 * DIA,
+        '/proposicoes/{id}/votacoes': DIA,
+        '/votacoes': 6 * HORA,
+        '/votacoes/{id}/votos': 30 * DIA,  # Votação encerrada não muda mais
+        '/orgaos': 7 * DIA,
+        '/orgaos/{id}/membros': DIA,
+    }
+    TTL_PADRAO = DIA
+    MAX_ACESSOS_PENDENTES = 1000
+
+    def __init__(self, diretorio, tamanho_max_mb=1024, ttl_por_endpoint=None):
+        os.makedirs(diretorio, exist_ok=True)
+        self.caminho = os.path.join(diretorio, 'respostas.sqlite')
+        self.tamanho_max = int(tamanho_max_mb * 1024 * 1024)
+        self.ttl_por_endpoint = dict(self.TTL_POR_ENDPOINT, **(ttl_por_endpoint or {}))
+        self.acertos = 0
+        self.revalidadas = 0
+        self.faltas = 0
+
+        # Leituras não fazem commit: o horário de acesso (para o LRU) fica aqui
+        # e é gravado em lote antes do descarte, a cada MAX_ACESSOS_PENDENTES e no close
+        self._acessos_pendentes = {}
+        self._lock = threading.Lock()
+        self._conexao = sqlite3.connect(self.caminho, check_same_thread=False)
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute("""
+            CREATE TABLE IF NOT EXISTS respostas (
+                chave TEXT PRIMARY KEY,
+                url TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                salvo_em REAL,
+                acessado_em REAL,
+                tamanho INTEGER,
+                corpo BLOB
+            )""")
+        self._conexao.execute("CREATE INDEX IF NOT EXISTS idx_acesso ON respostas (acessado_em)")
+        self._conexao.commit()
+        self._tamanho_total = self._conexao.execute(
+            "SELECT COALESCE(SUM(tamanho), 0) FROM respostas").fetchone()[0]
+
+    @staticmethod
+    def chave(url, params=None):
+        """Chave estável para a combinação URL + parâmetros"""
+        itens = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        return hashlib.sha256(json.dumps([url, itens]).encode('utf-8')).hexdigest()
+
+    def ttl(self, url):
+        return self.ttl_por_endpoint.get(template_endpoint(url), self.TTL_PADRAO)
+
+    def fresca(self, entrada, url):
+        """Indica se a entrada ainda está dentro do TTL da sua família"""
+        return time.time() - entrada['salvo_em'] < self.ttl(url)
+
+    def obter(self, chave):
+        """Retorna a entrada em cache (ou None, contada como falta), marcando o acesso para o LRU"""
+        with self._lock:
+            linha = self._conexao.execute(
+                "SELECT etag, last_modified, salvo_em, corpo FROM respostas WHERE chave = ?",
+                (chave,)).fetchone()
+            if linha is None:
+                self.faltas += 1
+                return None
+            self._acessos_pendentes[chave] = time.time()
+            if len(self._acessos_pendentes) >= self.MAX_ACESSOS_PENDENTES:
+                self._gravar_acessos()
+                self._conexao.commit()
+
+        etag, last_modified, salvo_em, corpo = linha
+        return {
+            'etag': etag,
+            'last_modified': last_modified,
+            'salvo_em': salvo_em,
+            'dados': json.loads(zlib.decompress(corpo)),
+        }
+
+    def salvar(self, chave, url, dados, etag=None, last_modified=None):
+        """Grava (ou substitui) uma resposta e aplica o limite de tamanho"""
+        corpo = zlib.compress(json.dumps(dados, ensure_ascii=False).encode('utf-8'))
+        agora = time.time()
+        with self._lock:
+            self._acessos_pendentes.pop(chave, None)
+            anterior = self._conexao.execute(
+                "SELECT tamanho FROM respostas WHERE chave = ?", (chave,)).fetchone()
+            self._conexao.execute(
+                "INSERT OR REPLACE INTO respostas VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (chave, url, etag, last_modified, agora, agora, len(corpo), corpo))
+            self._tamanho_total += len(corpo) - (anterior[0] if anterior else 0)
+            self._descartar_excesso()
+            self._conexao.commit()
+
+    def registrar_acerto(self):
+        with self._lock:
+            self.acertos += 1
+
+    def renovar(self, chave):
+        """Reinicia o TTL de uma entrada confirmada pelo servidor (304)"""
+        agora = time.time()
+        with self._lock:
+            self.revalidadas += 1
+            self._acessos_pendentes.pop(chave, None)
+            self._conexao.execute(
+                "UPDATE respostas SET salvo_em = ?, acessado_em = ? WHERE chave = ?",
+                (agora, agora, chave))
+            self._conexao.commit()
+
+    def _gravar_acessos(self):
+        """Grava de uma vez os horários de acesso acumulados (chamar com o lock)"""
+        if self._acessos_pendentes:
+            self._conexao.executemany("UPDATE respostas SET acessado_em = ? WHERE chave = ?",
+                                      [(agora, chave) for chave, agora in self._acessos_pendentes.items()])
+            self._acessos_pendentes = {}
+
+    def _descartar_excesso(self):
+        """Remove as entradas menos usadas até ficar abaixo de 90% do limite"""
+        if self._tamanho_total <= self.tamanho_max:
+            return
+        self._gravar_acessos()
+        alvo = self.tamanho_max * 0.9
+        cursor = self._conexao.execute(
+            "SELECT chave, tamanho FROM respostas ORDER BY acessado_em ASC")
+        removidas = []
+        for chave, tamanho in cursor:
+            if self._tamanho_total <= alvo:
+                break
+            removidas.append((chave,))
+            self._tamanho_total -= tamanho
+        self._conexao.executemany("DELETE FROM respostas WHERE chave = ?", removidas)
+
+    def close(self):
+        with self._lock:
+            self._gravar_acessos()
+            self._conexao.commit()
+            self._conexao.close()
+
+
+class CheckpointColeta:
+    """
+    Checkpoint de uma coleta longa, em `<saida>/.checkpoint/`
+
+    O manifesto guarda só o estado de cada fase (e os itens recusados de vez
+    pela API, como um 404 num detalhe); os registros de cada item
+    são gravados em `<fase>.jsonl` assim que chegam. Ao retomar, os IDs já
+    processados são lidos desses arquivos, guardando apenas a posição de
+    cada item, e os registros são relidos do disco quando são reescritos
+    na saída, para que --resume não repita o que já foi baixado.
+    """
+
+    def __init__(self, output_dir, retomar=False, parametros=None):
+        self.diretorio = os.path.join(output_dir, '.checkpoint')
+        self.caminho_manifesto = os.path.join(self.diretorio, 'manifesto.json')
+        self._posicoes = {}  # fase -> {id: posição da linha no .jsonl} recuperadas ao retomar
+        self._arquivos = {}
+        self._leitores = {}
+
+        if retomar and os.path.exists(self.caminho_manifesto):
+            with open(self.caminho_manifesto, 'r', encoding='utf-8') as f:
+                self.manifesto = json.load(f)
+            if parametros and self.manifesto.get('parametros') != parametros:
+                print("⚠ Parâmetros diferentes da coleta interrompida; retomando mesmo assim")
+            self._indexar_registros()
+        else:
+            if os.path.isdir(self.diretorio):
+                for nome in os.listdir(self.diretorio):
+                    os.remove(os.path.join(self.diretorio, nome))
+            os.makedirs(self.diretorio, exist_ok=True)
+            self.manifesto = {
+                'iniciado_em': datetime.now().isoformat(timespec='seconds'),
+                'parametros': parametros or {},
+                'fases': {},
+            }
+            self._salvar_manifesto()
+
+    def _caminho(self, fase):
+        return os.path.join(self.diretorio, f'{fase}.jsonl')
+
+    def _indexar_registros(self):
+        """Lê os IDs dos itens gravados antes da interrupção e a posição de cada um"""
+        for nome in os.listdir(self.diretorio):
+            if not nome.endswith('.jsonl'):
+                continue
+            fase = nome[:-len('.jsonl')]
+            posicoes = self._posicoes.setdefault(fase, {})
+            with open(self._caminho(fase), 'rb+') as f:
+                posicao = 0
+                for linha in iter(f.readline, b''):
+                    try:
+                        posicoes[json.loads(linha)['id']] = posicao
+                    except ValueError:
+                        # Linha truncada pela queda: descarta para não colar no próximo append
+                        f.truncate(posicao)
+                        break
+                    posicao += len(linha)
+            total = len(posicoes)
+            if total:
+                print(f"  ↺ {fase}: {total} itens recuperados do checkpoint")
+
+    def _fase(self, fase):
+        return self.manifesto['fases'].setdefault(fase, {'concluida': False})
+
+    def _salvar_manifesto(self):
+        """Grava o manifesto de forma atômica (arquivo temporário + rename)"""
+        self.manifesto['atualizado_em'] = datetime.now().isoformat(timespec='seconds')
+        temporario = self.caminho_manifesto + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(self.manifesto, f, ensure_ascii=False)
+        os.replace(temporario, self.caminho_manifesto)
+
+    def fase_concluida(self, fase):
+        return self.manifesto['fases'].get(fase, {}).get('concluida', False)
+
+    def falhas_definitivas(self, fase):
+        """{id: status} dos itens que a API recusou de vez (4xx) na fase"""
+        return self.manifesto['fases'].get(fase, {}).get('falhas', {})
+
+    def registrar_falha(self, fase, id_item, status):
+        """Anota no manifesto um item que não adianta pedir de novo no --resume"""
+        self._fase(fase).setdefault('falhas', {})[str(id_item)] = status
+        self._salvar_manifesto()
+
+    def concluidos(self, fase):
+        """IDs (como texto) dos itens já processados na fase"""
+        return self._posicoes.get(fase, {}).keys()
+
+    def registros_salvos(self, fase, id_item):
+        """Relê do .jsonl os registros de um item processado antes da interrupção"""
+        if fase not in self._leitores:
+            self._leitores[fase] = open(self._caminho(fase), 'rb')
+        leitor = self._leitores[fase]
+        leitor.seek(self._posicoes[fase][str(id_item)])
+        return json.loads(leitor.readline())['registros']
+
+    def registrar(self, fase, id_item, registros):
+        """Persiste imediatamente os registros de um item concluído"""
+        if fase not in self._arquivos:
+            self._arquivos[fase] = open(self._caminho(fase), 'a', encoding='utf-8')
+        arquivo = self._arquivos[fase]
+        arquivo.write(json.dumps({'id': str(id_item), 'registros': registros}, ensure_ascii=False) + '\n')
+        arquivo.flush()
+
+    def _fechar(self, fase):
+        for arquivos in (self._arquivos, self._leitores):
+            if fase in arquivos:
+                arquivos.pop(fase).close()
+
+    def concluir_fase(self, fase):
+        self._fase(fase)['concluida'] = True
+        self._fechar(fase)
+        self._posicoes.pop(fase, None)
+        self._salvar_manifesto()
+
+    def finalizar(self):
+        """Remove o checkpoint depois de uma coleta completa"""
+        for fase in list(self._arquivos) + list(self._leitores):
+            self._fechar(fase)
+        for nome in os.listdir(self.diretorio):
+            os.remove(os.path.join(self.diretorio, nome))
+        os.rmdir(self.diretorio)
+
+
+class AdaptadorHTTPContado(HTTPAdapter):
+    """
+    HTTPAdapter que registra quantas conexões TCP foram abertas, para
+    comparar com o número de requisições e medir o reuso do keep-alive
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.conexoes_abertas = 0
+        self.requisicoes_enviadas = 0
+        self._lock_metricas = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _contar_conexao(self):
+        with self._lock_metricas:
+            self.conexoes_abertas += 1
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        adaptador = self
+
+        class PoolHTTP(HTTPConnectionPool):
+            def _new_conn(self):
+                adaptador._contar_conexao()
+                return super()._new_conn()
+
+        class PoolHTTPS(HTTPSConnectionPool):
+            def _new_conn(self):
+                adaptador._contar_conexao()
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {'http': PoolHTTP, 'https': PoolHTTPS}
+
+    def send(self, request, **kwargs):
+        with self._lock_metricas:
+            self.requisicoes_enviadas += 1
+        return super().send(request, **kwargs)
+
+
+class MetricasColeta:
+    """
+    Telemetria de uma execução do coletor: histograma de latência por
+    família de endpoint, contagem de status, retentativas, bytes recebidos,
+    tempo dormindo no limitador e vazão de cada fase. Gera um relatório
+    JSON e, opcionalmente, o formato texto do Prometheus.
+    """
+
+    # Limites superiores (segundos) dos buckets do histograma de latência
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self):
+        self.inicio = time.time()
+        self.endpoints = {}
+        self.status = {}
+        self.retentativas = 0     # Refeitas pelo urllib3 (conexão e 5xx)
+        self.recusas = 0          # 429/503 repetidas após o backoff do limitador
+        self.erros = 0            # Falhas de rede após esgotar as retentativas
+        self.bytes_recebidos = 0
+        self.tempo_espera = 0.0
+        self.fases = []
+        self._lock = threading.Lock()
+
+    def _endpoint(self, template):
+        if template not in self.endpoints:
+            self.endpoints[template] = {
+                'requisicoes': 0, 'segundos': 0.0, 'bytes': 0, 'retentativas': 0,
+                'buckets': [0] * (len(self.BUCKETS) + 1),
+            }
+        return self.endpoints[template]
+
+    def registrar_requisicao(self, url, status, duracao, bytes_recebidos=0, retentativas=0):
+        """Registra uma chamada HTTP (status None quando nem houve resposta)"""
+        template = template_endpoint(url)
+        indice = next((i for i, limite in enumerate(self.BUCKETS) if duracao <= limite),
+                      len(self.BUCKETS))
+        with self._lock:
+            endpoint = self._endpoint(template)
+            endpoint['requisicoes'] += 1
+            endpoint['segundos'] += duracao
+            endpoint['bytes'] += bytes_recebidos
+            endpoint['retentativas'] += retentativas
+            endpoint['buckets'][indice] += 1
+            chave = str(status) if status is not None else 'erro'
+            self.status[chave] = self.status.get(chave, 0) + 1
+            self.bytes_recebidos += bytes_recebidos
+            self.retentativas += retentativas
+            if status is None:
+                self.erros += 1
+            elif status in LimitadorTaxa.STATUS_SOBRECARGA:
+                self.recusas += 1
+
+    def registrar_espera(self, segundos):
+        """Tempo que uma requisição dormiu esperando o limitador"""
+        if segundos > 0:
+            with self._lock:
+                self.tempo_espera += segundos
+
+    @contextmanager
+    def fase(self, nome):
+        """
+        Mede uma fase da coleta; o bloco preenche `fase['itens']` com o
+        número de registros produzidos para o cálculo da vazão
+        """
+        with self._lock:
+            requisicoes = sum(e['requisicoes'] for e in self.endpoints.values())
+            espera = self.tempo_espera
+        registro = {'fase': nome, 'itens': 0}
+        inicio = time.perf_counter()
+        try:
+            yield registro
+        finally:
+            duracao = time.perf_counter() - inicio
+            with self._lock:
+                registro['segundos'] = round(duracao, 3)
+                registro['requisicoes'] = sum(e['requisicoes'] for e in self.endpoints.values()) - requisicoes
+                registro['segundos_espera_limitador'] = round(self.tempo_espera - espera, 3)
+                registro['itens_por_segundo'] = round(registro['itens'] / duracao, 2) if duracao else None
+                registro['requisicoes_por_segundo'] = (round(registro['requisicoes'] / duracao, 2)
+                                                       if duracao else None)
+                self.fases.append(registro)
+
+    @staticmethod
+    def _quantil(buckets, total, q):
+        """Estimativa do quantil pelo limite superior do bucket que o contém"""
+        alvo = q * total
+        acumulado = 0
+        for limite, contagem in zip(MetricasColeta.BUCKETS + (float('inf'),), buckets):
+            acumulado += contagem
+            if acumulado >= alvo:
+                return limite if limite != float('inf') else None
+        return None
+
+    def relatorio(self, extras=None):
+        """Relatório da execução como dicionário serializável em JSON"""
+        with self._lock:
+            endpoints = {}
+            for template, e in sorted(self.endpoints.items()):
+                n = e['requisicoes']
+                endpoints[template] = {
+                    'requisicoes': n,
+                    'latencia_media_s': round(e['segundos'] / n, 4) if n else None,
+                    'latencia_p50_s': self._quantil(e['buckets'], n, 0.5),
+                    'latencia_p95_s': self._quantil(e['buckets'], n, 0.95),
+                    'latencia_p99_s': self._quantil(e['buckets'], n, 0.99),
+                    'bytes': e['bytes'],
+                    'retentativas': e['retentativas'],
+                    'histograma': {f"le_{limite}": contagem for limite, contagem
+                                   in zip(self.BUCKETS + ('inf',), e['buckets'])},
+                }
+            total_rede = sum(e['segundos'] for e in self.endpoints.values())
+            relatorio = {
+                'inicio': datetime.fromtimestamp(self.inicio, timezone.utc).isoformat(),
+                'duracao_s': round(time.time() - self.inicio, 3),
+                'requisicoes': sum(e['requisicoes'] for e in self.endpoints.values()),
+                'status': dict(sorted(self.status.items())),
+                'retentativas': self.retentativas,
+                'recusas_429_503': self.recusas,
+                'erros_rede': self.erros,
+                'bytes_recebidos': self.bytes_recebidos,
+                'segundos_rede': round(total_rede, 3),
+                'segundos_espera_limitador': round(self.tempo_espera, 3),
+                'endpoints': endpoints,
+                'fases': list(self.fases),
+            }
+        relatorio.update(extras or {})
+        return relatorio
+
+    def texto_prometheus(self):
+        """Métricas no formato de exposição texto do Prometheus"""
+        linhas = [
+            '# HELP camara_requisicao_segundos Latência das requisições por endpoint',
+            '# TYPE camara_requisicao_segundos histogram',
+        ]
+        with self._lock:
+            for template, e in sorted(self.endpoints.items()):
+                acumulado = 0
+                for limite, contagem in zip(self.BUCKETS + ('+Inf',), e['buckets']):
+                    acumulado += contagem
+                    linhas.append(f'camara_requisicao_segundos_bucket{{endpoint="{template}",'
+                                  f'le="{limite}"}} {acumulado}')
+                linhas.append(f'camara_requisicao_segundos_sum{{endpoint="{template}"}} {e["segundos"]:.6f}')
+                linhas.append(f'camara_requisicao_segundos_count{{endpoint="{template}"}} {e["requisicoes"]}')
+
+            linhas += ['# HELP camara_respostas_total Respostas por status HTTP',
+                       '# TYPE camara_respostas_total counter']
+            linhas += [f'camara_respostas_total{{status="{status}"}} {n}'
+                       for status, n in sorted(self.status.items())]
+
+            linhas += ['# HELP camara_retentativas_total Retentativas do urllib3 por endpoint',
+                       '# TYPE camara_retentativas_total counter']
+            linhas += [f'camara_retentativas_total{{endpoint="{template}"}} {e["retentativas"]}'
+                       for template, e in sorted(self.endpoints.items())]
+
+            linhas += ['# HELP camara_bytes_recebidos_total Bytes recebidos por endpoint',
+                       '# TYPE camara_bytes_recebidos_total counter']
+            linhas += [f'camara_bytes_recebidos_total{{endpoint="{template}"}} {e["bytes"]}'
+                       for template, e in sorted(self.endpoints.items())]
+
+            linhas += ['# HELP camara_espera_limitador_segundos_total Tempo dormindo no limitador de taxa',
+                       '# TYPE camara_espera_limitador_segundos_total counter',
+                       f'camara_espera_limitador_segundos_total {self.tempo_espera:.6f}']
+
+            linhas += ['# HELP camara_fase_itens_por_segundo Vazão de cada fase da coleta',
+                       '# TYPE camara_fase_itens_por_segundo gauge']
+            linhas += [f'camara_fase_itens_por_segundo{{fase="{f["fase"]}"}} {f["itens_por_segundo"] or 0}'
+                       for f in self.fases]
+        return '\n'.join(linhas) + '\n'
+
+
 class ColetorDadosCamara:
     """
     Classe para coletar dados da API da Câmara dos Deputados
     """
 
-    def __init__(self, output_dir='dados_camara'):
-        self.base_url = "https://dadosabertos.camara.leg.br/api/v2"
-        self.headers = {'accept': 'application/json'}
+    def __init__(self, output_dir='dados_camara', base_url=None, concorrencia=4,
+                 taxa=8.0, rajada=16, limitador=None, tamanho_pool=None, max_retries=3,
+                 usar_cache=True, offline=False, cache_max_mb=1024,
+                 formato='json', compressao=None):
+        self.base_url = base_url or "https://dadosabertos.camara.leg.br/api/v2"
+        self.arquivos_url = "https://dadosabertos.camara.leg.br/arquivos"
+        self.headers = {'accept': 'application/json', 'accept-encoding': 'gzip, deflate'}
         self.output_dir = output_dir
         self.request_count = 0
-        self.max_requests_per_minute = 100
+
+        # Formato dos arquivos de saída (json ou jsonl, opcionalmente comprimidos)
+        self.formato = formato
+        self.compressao = compressao
+
+        # Limitador pode ser compartilhado entre vários coletores
+        self.limitador = limitador or LimitadorTaxa(taxa=taxa, rajada=rajada)
+
+        # Número máximo de requisições de detalhe executadas em paralelo
+        self.concorrencia = max(1, concorrencia)
+        self._lock_contador = threading.Lock()
+        self.checkpoint = None
+        self._fases_incompletas = []
+        self.metricas = MetricasColeta()
+        self._requisicao_local = threading.local()  # Status da última resposta de cada thread
+
+        # Sessão com pool keep-alive do tamanho da concorrência. Erros de
+        # conexão e 5xx são repetidos pelo adaptador; 429/503 ficam com o limitador
+        self.max_retries = max_retries
+        self.adaptador = AdaptadorHTTPContado(
+            pool_connections=4,
+            pool_maxsize=tamanho_pool or self.concorrencia,
+            max_retries=Retry(total=max_retries, backoff_factor=1,
+                              status_forcelist=(500, 502, 504),
+                              allowed_methods=frozenset(['GET']),
+                              raise_on_status=False))
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', self.adaptador)
+        self.session.mount('http://', self.adaptador)
+
+        # Cache de respostas em disco; no modo offline só ele é consultado
+        self.offline = offline
+        self.cache = None
+        if usar_cache or offline:
+            self.cache = CacheRespostas(os.path.join(output_dir, '.cache_http'),
+                                        tamanho_max_mb=cache_max_mb)
 
         # Criar diretório de saída se não existir
         if not os.path.exists(output_dir):
@@ -24,82 +746,279 @@ class ColetorDadosCamara:
 
     def _rate_limit(self):
         """Controla rate limiting das requisições"""
-        self.request_count += 1
-        if self.request_count % self.max_requests_per_minute == 0:
-            print("⏸  Rate limit: aguardando 60 segundos...")
-            time.sleep(60)
-        else:
-            time.sleep(0.5)  # Pequeno delay entre requisições
+        with self._lock_contador:
+            self.request_count += 1
+        self.metricas.registrar_espera(self.limitador.aguardar())
+
+    def close(self):
+        """Fecha as conexões do pool e o cache"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+    @property
+    def fases_incompletas(self):
+        """Fases da última coleta completa que ficaram com itens ou páginas pendentes"""
+        return list(self._fases_incompletas)
+
+    def metricas_conexoes(self):
+        """Conexões TCP abertas versus reutilizadas nesta execução"""
+        enviadas = self.adaptador.requisicoes_enviadas
+        abertas = self.adaptador.conexoes_abertas
+        return {
+            'requisicoes': enviadas,
+            'conexoes_abertas': abertas,
+            'conexoes_reutilizadas': max(0, enviadas - abertas),
+        }
 
-    def _fazer_requisicao(self, url, params=None, max_retries=3):
-        """Faz requisição com retry automático"""
-        for tentativa in range(max_retries):
+    def salvar_relatorio(self, caminho=None, caminho_prometheus=None):
+        """
+        Grava o relatório JSON da execução (padrão: <output>/relatorio_coleta.json)
+        e, se pedido, as mesmas métricas no formato texto do Prometheus
+        """
+        extras = {
+            'concorrencia': self.concorrencia,
+            'limitador': {'taxa_configurada': self.limitador.taxa_maxima,
+                          'taxa_final': round(self.limitador.taxa, 3),
+                          'rajada': self.limitador.rajada},
+            'conexoes': self.metricas_conexoes(),
+        }
+        if self.cache:
+            extras['cache'] = {'acertos': self.cache.acertos, 'revalidadas': self.cache.revalidadas,
+                               'faltas': self.cache.faltas}
+        caminho = caminho or os.path.join(self.output_dir, 'relatorio_coleta.json')
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(self.metricas.relatorio(extras), f, ensure_ascii=False, indent=2)
+        print(f"📈 Relatório da execução salvo em {caminho}")
+        if caminho_prometheus:
+            with open(caminho_prometheus, 'w', encoding='utf-8') as f:
+                f.write(self.metricas.texto_prometheus())
+            print(f"📈 Métricas Prometheus salvas em {caminho_prometheus}")
+        return caminho
+
+    def _fazer_requisicao(self, url, params=None, max_recusas=10):
+        """Faz requisição (retry de conexão e 5xx é feito pelo adaptador da sessão)"""
+        chave = entrada = None
+        if self.cache:
+            chave = self.cache.chave(url, params)
+            entrada = self.cache.obter(chave)
+            if entrada and (self.offline or self.cache.fresca(entrada, url)):
+                self.cache.registrar_acerto()
+                return entrada['dados']
+
+        if self.offline:
+            print(f"⚠ Modo offline: resposta não está no cache - URL: {url}")
+            return None
+
+        # Entrada vencida: pede ao servidor só se mudou
+        condicionais = {}
+        if entrada and entrada['etag']:
+            condicionais['If-None-Match'] = entrada['etag']
+        if entrada and entrada['last_modified']:
+            condicionais['If-Modified-Since'] = entrada['last_modified']
+
+        for _ in range(max_recusas + 1):
+            self._rate_limit()
+            inicio = time.perf_counter()
             try:
-                self._rate_limit()
-                response = requests.get(url, headers=self.headers, params=params, timeout=30)
-
-                if response.status_code == 200:
-                    return response.json()
-                elif response.status_code == 429:  # Too many requests
-                    print(f"⚠ Rate limit atingido, aguardando 60 segundos...")
-                    time.sleep(60)
-                    continue
-                else:
-                    if tentativa == 0:  # Só mostra URL na primeira tentativa
-                        print(f"⚠ Status code {response.status_code} - URL: {response.url}")
-                    else:
-                        print(f"⚠ Status code {response.status_code} na tentativa {tentativa + 1}")
-
+                response = self.session.get(url, params=params, headers=condicionais, timeout=30)
             except requests.exceptions.RequestException as e:
-                print(f"⚠ Erro na tentativa {tentativa + 1}: {str(e)}")
-                if tentativa < max_retries - 1:
-                    time.sleep(5)
-                    continue
+                self.metricas.registrar_requisicao(url, None, time.perf_counter() - inicio,
+                                                   retentativas=self.max_retries)
+                print(f"⚠ Erro após {self.max_retries} tentativas: {str(e)}")
+                return None
+
+            # Bytes que vieram pela rede (comprimidos) e retentativas feitas pelo urllib3
+            retentativas = getattr(response.raw, 'retries', None)
+            self.metricas.registrar_requisicao(
+                url, response.status_code, time.perf_counter() - inicio,
+                bytes_recebidos=response.raw.tell() or len(response.content),
+                retentativas=len(retentativas.history) if retentativas else 0)
+            self.limitador.registrar_resposta(response.status_code, response.headers)
+            self._requisicao_local.status = response.status_code
+
+            if response.status_code == 200:
+                dados = response.json()
+                if self.cache:
+                    self.cache.salvar(chave, url, dados,
+                                      etag=response.headers.get('ETag'),
+                                      last_modified=response.headers.get('Last-Modified'))
+                return dados
+            elif response.status_code == 304 and entrada:
+                self.cache.renovar(chave)
+                return entrada['dados']
+            elif response.status_code in LimitadorTaxa.STATUS_SOBRECARGA:
+                # O limitador já agendou o backoff antes da próxima tentativa
+                print(f"⚠ Rate limit atingido, reduzindo para {self.limitador.taxa:.1f} req/s...")
+                continue
+            else:
+                print(f"⚠ Status code {response.status_code} - URL: {response.url}")
+                return None
 
         return None
 
-    def _paginar_requisicao(self, url, params=None, max_items=None):
-        """Faz paginação automática de requisições"""
-        todos_dados = []
-        pagina = 1
-
-        if params is None:
-            params = {}
-
-        params['itens'] = 100  # Tamanho da página
-
-        while True:
-            params['pagina'] = pagina
-            print(f"  → Coletando página {pagina}...", end='\r')
-
-            data = self._fazer_requisicao(url, params)
-
-            if not data or 'dados' not in data:
-                break
-
-            dados_pagina = data['dados']
+    @staticmethod
+    def _ultima_pagina(links):
+        """Número da última página, lido do link rel="last" da resposta"""
+        for link in links:
+            if link.get('rel') == 'last':
+                pagina = parse_qs(urlparse(link.get('href', '')).query).get('pagina')
+                if pagina and pagina[0].isdigit():
+                    return int(pagina[0])
+        return None
 
-            if not dados_pagina:
-                break
+    def _paginar_requisicao(self, url, params=None, max_items=None, itens_por_pagina=100,
+                            paralelo=True, silencioso=False):
+        """
+        Faz paginação automática de requisições
+        A primeira resposta traz o link "last"; as páginas restantes são
+        buscadas em paralelo e juntadas na ordem. Sem esse link (ou com
+        paralelo=False), segue os links "next" um a um.
+        Páginas que falham mesmo após as retentativas levantam
+        PaginasNaoColetadas, com os dados parciais.
+        """
+        params = dict(params or {})
+        params['itens'] = itens_por_pagina  # Tamanho da página
+        log = (lambda *a, **k: None) if silencioso else print
+
+        log(f"  → Coletando página 1...", end='\r')
+        data = self._fazer_requisicao(url, dict(params, pagina=1))
+        if data is None:
+            raise PaginasNaoColetadas([1], [])
+
+        if not data.get('dados'):
+            log(f"  ✓ 0 itens coletados" + " " * 20)
+            return []
+
+        todos_dados = list(data['dados'])
+        ultima = self._ultima_pagina(data.get('links', [])) if paralelo else None
+
+        if ultima is not None:
+            # Não busca páginas que ficariam além de max_items
+            if max_items:
+                ultima = min(ultima, -(-max_items // itens_por_pagina))
+            falhas = []
+
+            def buscar_pagina(pagina):
+                resposta = self._fazer_requisicao(url, dict(params, pagina=pagina))
+                return self._extrair_dados(resposta, [], estrito=True)
+
+            def ao_concluir(i, pagina, dados_pagina):
+                log(f"  → Coletando página {pagina}/{ultima}...", end='\r')
+                if dados_pagina is None:
+                    falhas.append(pagina)
+                else:
+                    todos_dados.extend(dados_pagina)
 
-            todos_dados.extend(dados_pagina)
+            self._executar_fan_out(range(2, ultima + 1), buscar_pagina, ao_concluir)
+            if falhas:
+                raise PaginasNaoColetadas(sorted(falhas), todos_dados)
+        else:
+            pagina = 1
+            while any(link.get('rel') == 'next' for link in data.get('links', [])):
+                if max_items and len(todos_dados) >= max_items:
+                    break
+                pagina += 1
+                log(f"  → Coletando página {pagina}...", end='\r')
+                data = self._fazer_requisicao(url, dict(params, pagina=pagina))
+                if data is None:
+                    # Sem a resposta não há link "next": o resto fica para o --resume
+                    raise PaginasNaoColetadas([pagina], todos_dados)
+                if not data.get('dados'):
+                    break
+                todos_dados.extend(data['dados'])
+
+        if max_items:
+            todos_dados = todos_dados[:max_items]
+
+        log(f"  ✓ {len(todos_dados)} itens coletados" + " " * 20)
+        return todos_dados
 
-            if max_items and len(todos_dados) >= max_items:
-                todos_dados = todos_dados[:max_items]
-                break
+    def _paginar_em_janelas(self, url, params, data_inicio, data_fim, janela, max_items=None):
+        """
+        Divide o período em janelas de datas e pagina cada uma separadamente,
+        das mais recentes para as mais antigas, sem duplicatas por id.
+        Sem limite, as janelas são buscadas em paralelo; com max_items, uma
+        por vez, cada uma pedindo só o que falta, até atingir o limite.
+        Janelas incompletas levantam PaginasNaoColetadas depois das demais.
+        """
+        janelas = janelas_periodo(data_inicio, data_fim, janela)
+        vistos = set()
+        resultado = []
+        incompletas = []
 
-            # Verificar se há mais páginas
-            links = data.get('links', [])
-            tem_proxima = any(link.get('rel') == 'next' for link in links)
+        def buscar_janela(intervalo, restante=None):
+            try:
+                return self._paginar_requisicao(
+                    url, dict(params, dataInicio=intervalo[0], dataFim=intervalo[1]),
+                    max_items=restante, paralelo=False, silencioso=True)
+            except PaginasNaoColetadas as erro:
+                incompletas.append((intervalo, erro.paginas))
+                return erro.dados
+
+        def ao_concluir(i, intervalo, itens):
+            print(f"  → Janela {intervalo[0]} a {intervalo[1]}: {len(itens)} itens" + " " * 10, end='\r')
+            for item in itens:
+                if item.get('id') not in vistos:
+                    vistos.add(item.get('id'))
+                    resultado.append(item)
+
+        if max_items:
+            # Com limite, quase sempre a janela mais recente basta
+            for i, intervalo in enumerate(janelas, 1):
+                restante = max_items - len(resultado)
+                if restante <= 0:
+                    break
+                ao_concluir(i, intervalo, buscar_janela(intervalo, restante))
+        else:
+            self._executar_fan_out(janelas, buscar_janela, ao_concluir)
 
-            if not tem_proxima:
-                break
+        if max_items:
+            resultado = resultado[:max_items]
+        if incompletas:
+            raise PaginasNaoColetadas(incompletas, resultado)
+        print(f"  ✓ {len(resultado)} itens coletados em {len(janelas)} janelas ({janela})" + " " * 20)
+        return resultado
 
-            pagina += 1
+    async def _fan_out(self, itens, tarefa, ao_concluir, executor):
+        """
+        Executa `tarefa(item)` para cada item com no máximo `self.concorrencia`
+        chamadas simultâneas, entregando os resultados a `ao_concluir` na
+        mesma ordem dos itens (a saída não depende da ordem de término)
+        """
+        loop = asyncio.get_running_loop()
+        pendentes = deque()
+        janela = self.concorrencia * 4  # Limita os resultados retidos em memória
+
+        try:
+            for i, item in enumerate(itens, 1):
+                pendentes.append((i, item, loop.run_in_executor(executor, tarefa, item)))
+                if len(pendentes) >= janela:
+                    j, item_pronto, futuro = pendentes.popleft()
+                    ao_concluir(j, item_pronto, await futuro)
+
+            while pendentes:
+                j, item_pronto, futuro = pendentes.popleft()
+                ao_concluir(j, item_pronto, await futuro)
+        finally:
+            # Em caso de erro, descarta o que ainda está na janela
+            futuros = [futuro for _, _, futuro in pendentes]
+            for futuro in futuros:
+                futuro.cancel()
+            await asyncio.gather(*futuros, return_exceptions=True)
+
+    def _executar_fan_out(self, itens, tarefa, ao_concluir):
+        """Ponto de entrada síncrono para o fan-out assíncrono das chamadas de detalhe"""
+        with ThreadPoolExecutor(max_workers=self.concorrencia) as executor:
+            asyncio.run(self._fan_out(itens, tarefa, ao_concluir, executor))
+
+    @staticmethod
+    def _extrair_dados(data, padrao, estrito=False):
+        """Campo 'dados' da resposta; com estrito=True, falhas viram None"""
+        if data:
+            return data.get('dados', padrao)
+        return None if estrito else padrao
 
-        print(f"  ✓ {len(todos_dados)} itens coletados" + " " * 20)
-        return todos_dados
-        
     def get_partidos(self, data_inicio="2019-01-01", data_fim="2024-12-31"):
         """
         Coleta dados de partidos
@@ -134,13 +1053,13 @@ class ColetorDadosCamara:
         print(f"✓ {len(deputados)} deputados coletados")
         return deputados
 
-    def get_detalhes_deputado(self, id_deputado):
+    def get_detalhes_deputado(self, id_deputado, estrito=False):
         """
         Coleta informações detalhadas de um deputado específico
         """
         url = f"{self.base_url}/deputados/{id_deputado}"
         data = self._fazer_requisicao(url)
-        return data.get('dados', {}) if data else {}
+        return self._extrair_dados(data, {}, estrito)
     
     def get_frentes(self, legislatura=None):
         """
@@ -162,19 +1081,22 @@ class ColetorDadosCamara:
 
         return frentes
 
-    def get_membros_frente(self, id_frente):
+    def get_membros_frente(self, id_frente, estrito=False):
         """
         Coleta membros de uma frente específica
         """
         url = f"{self.base_url}/frentes/{id_frente}/membros"
         data = self._fazer_requisicao(url)
-        return data.get('dados', []) if data else []
+        return self._extrair_dados(data, [], estrito)
     
-    def get_proposicoes(self, data_inicio="2019-01-01", data_fim="2024-12-31", max_items=5000):
+    def get_proposicoes(self, data_inicio="2019-01-01", data_fim="2024-12-31", max_items=5000,
+                        janela=None):
         """
         Coleta dados de proposições (limitado para não sobrecarregar)
+        Com `janela` ('mes', 'trimestre' ou 'ano') o período é dividido em
+        janelas coletadas em paralelo; max_items=None coleta o período todo
         """
-        print(f"\n📜 Coletando proposições (max: {max_items})...")
+        print(f"\n📜 Coletando proposições (max: {max_items or 'sem limite'})...")
         url = f"{self.base_url}/proposicoes"
         params = {
             'dataInicio': data_inicio,
@@ -183,17 +1105,21 @@ class ColetorDadosCamara:
             'ordenarPor': 'id'
         }
 
-        proposicoes = self._paginar_requisicao(url, params, max_items=max_items)
+        if janela:
+            proposicoes = self._paginar_em_janelas(url, params, data_inicio, data_fim, janela,
+                                                   max_items=max_items)
+        else:
+            proposicoes = self._paginar_requisicao(url, params, max_items=max_items)
         print(f"✓ {len(proposicoes)} proposições coletadas")
         return proposicoes
 
-    def get_autores_proposicao(self, id_proposicao):
+    def get_autores_proposicao(self, id_proposicao, estrito=False):
         """
         Coleta autores de uma proposição específica
         """
         url = f"{self.base_url}/proposicoes/{id_proposicao}/autores"
         data = self._fazer_requisicao(url)
-        return data.get('dados', []) if data else []
+        return self._extrair_dados(data, [], estrito)
 
     def get_votacoes_proposicao(self, id_proposicao):
         """
@@ -203,11 +1129,14 @@ class ColetorDadosCamara:
         data = self._fazer_requisicao(url)
         return data.get('dados', []) if data else []
 
-    def get_votacoes(self, data_inicio="2019-01-01", data_fim="2024-12-31", max_items=1000):
+    def get_votacoes(self, data_inicio="2019-01-01", data_fim="2024-12-31", max_items=1000,
+                     janela=None):
         """
         Coleta votações diretamente
+        Com `janela` ('mes', 'trimestre' ou 'ano') o período é dividido em
+        janelas coletadas em paralelo; max_items=None coleta o período todo
         """
-        print(f"\n🗳️  Coletando votações (max: {max_items})...")
+        print(f"\n🗳️  Coletando votações (max: {max_items or 'sem limite'})...")
         url = f"{self.base_url}/votacoes"
         params = {
             'dataInicio': data_inicio,
@@ -216,17 +1145,21 @@ class ColetorDadosCamara:
             'ordenarPor': 'dataHoraRegistro'
         }
 
-        votacoes = self._paginar_requisicao(url, params, max_items=max_items)
+        if janela:
+            votacoes = self._paginar_em_janelas(url, params, data_inicio, data_fim, janela,
+                                                max_items=max_items)
+        else:
+            votacoes = self._paginar_requisicao(url, params, max_items=max_items)
         print(f"✓ {len(votacoes)} votações coletadas")
         return votacoes
 
-    def get_votos_votacao(self, id_votacao):
+    def get_votos_votacao(self, id_votacao, estrito=False):
         """
         Coleta votos de uma votação específica
         """
         url = f"{self.base_url}/votacoes/{id_votacao}/votos"
         data = self._fazer_requisicao(url)
-        return data.get('dados', []) if data else []
+        return self._extrair_dados(data, [], estrito)
     
     def get_orgaos(self):
         """
@@ -251,151 +1184,429 @@ class ColetorDadosCamara:
         data = self._fazer_requisicao(url)
         return data.get('dados', []) if data else []
 
+    def baixar_arquivos_anuais(self, diretorio, anos=ANOS_PADRAO):
+        """
+        Baixa os arquivos anuais de votos, autores e frentes para `diretorio`
+        em streaming. Arquivos já presentes não são baixados de novo.
+        """
+        os.makedirs(diretorio, exist_ok=True)
+        caminhos = []
+        for nome, modelo in ARQUIVOS_ANUAIS.items():
+            for ano in (anos if '{ano}' in modelo else [None]):
+                relativo = modelo.format(ano=ano)
+                destino = os.path.join(diretorio, os.path.basename(relativo))
+                if os.path.exists(destino):
+                    print(f"  ↺ {os.path.basename(destino)} já existe")
+                    caminhos.append(destino)
+                    continue
+
+                url = f"{self.arquivos_url}/{relativo}"
+                self._rate_limit()
+                inicio = time.perf_counter()
+                baixados = 0
+                try:
+                    with self.session.get(url, stream=True, timeout=60) as response:
+                        if response.status_code != 200:
+                            self.metricas.registrar_requisicao(url, response.status_code,
+                                                               time.perf_counter() - inicio)
+                            print(f"  ⚠ Status {response.status_code} para {url}")
+                            continue
+                        with open(destino + '.parcial', 'wb') as arquivo:
+                            for bloco in response.iter_content(chunk_size=1 << 20):
+                                arquivo.write(bloco)
+                                baixados += len(bloco)
+                                print(f"  → {os.path.basename(destino)}: {baixados / 1e6:.1f} MB", end='\r')
+                except requests.exceptions.RequestException as e:
+                    self.metricas.registrar_requisicao(url, None, time.perf_counter() - inicio, baixados)
+                    print(f"  ✗ Erro ao baixar {url}: {e}")
+                    continue
+                self.metricas.registrar_requisicao(url, 200, time.perf_counter() - inicio, baixados)
+                os.replace(destino + '.parcial', destino)
+                print(f"  ✓ {os.path.basename(destino)} ({baixados / 1e6:.1f} MB)" + " "*20)
+                caminhos.append(destino)
+        return caminhos
+
+    @staticmethod
+    def _mapa_dump(diretorio, nome_base, chave, valor):
+        """Lê um arquivo auxiliar (ex.: votacoes-2023) como {chave: valor}; vazio se não existir"""
+        caminho = localizar_dump(diretorio, nome_base)
+        if not caminho:
+            return {}
+        return {linha.get(chave): linha.get(valor) for linha in iterar_dump(caminho)}
+
+    def _ingerir_dump(self, diretorio, nomes_base, converter, nome_arquivo, rotulo):
+        """
+        Converte as linhas dos arquivos `nomes_base` em registros e os grava
+        em streaming em `nome_arquivo`. `converter(nome_base)` devolve a função
+        linha -> registro (ou None para descartar). Retorna quantos foram escritos.
+        """
+        fase = os.path.splitext(nome_arquivo)[0] + '_arquivos'
+        with self.abrir_saida(nome_arquivo) as saida, self.metricas.fase(fase) as medicao:
+            for nome_base in nomes_base:
+                caminho = localizar_dump(diretorio, nome_base)
+                if not caminho:
+                    print(f"  ⚠ {nome_base}.csv/.json não encontrado em {diretorio}")
+                    continue
+                montar = converter(nome_base)
+                for linha in iterar_dump(caminho):
+                    registro = montar(linha)
+                    if registro is not None:
+                        saida.escrever(registro)
+                        if saida.total % 10000 == 0:
+                            print(f"  → {rotulo}: {saida.total} registros", end='\r')
+            medicao['itens'] = saida.total
+        print(f"  ✓ Dados salvos em {saida.caminho}" + " "*30)
+        return saida.total
+
+    def ingerir_membros_frentes(self, diretorio):
+        """membros_frentes.json a partir de frentesDeputados (uma linha por membro)"""
+        def converter(_):
+            def montar(linha):
+                if linha.get('deputado_id') in (None, ''):
+                    return None
+                return {
+                    'idFrente': _inteiro(linha.get('id')),
+                    'tituloFrente': linha.get('titulo'),
+                    'idDeputado': _inteiro(linha.get('deputado_id')),
+                    'nomeDeputado': linha.get('deputado_nome'),
+                    'titulo': linha.get('deputado_titulo') or 'Membro'
+                }
+            return montar
+        return self._ingerir_dump(diretorio, ['frentesDeputados'], converter,
+                                  'membros_frentes.json', 'Membros')
+
+    def ingerir_autores_proposicoes(self, diretorio, anos=ANOS_PADRAO):
+        """autores_proposicoes.json a partir de proposicoesAutores-{ano}"""
+        def converter(nome_base):
+            # A sigla do tipo só está em proposicoes-{ano}; o mapa é de um ano por vez
+            tipos = self._mapa_dump(diretorio, nome_base.replace('proposicoesAutores', 'proposicoes'),
+                                    'id', 'siglaTipo')
+
+            def montar(linha):
+                return {
+                    'idProposicao': _inteiro(linha.get('idProposicao')),
+                    'tipoProposicao': tipos.get(linha.get('idProposicao')),
+                    'idAutor': _inteiro(linha.get('idDeputadoAutor')),
+                    'nomeAutor': linha.get('nomeAutor'),
+                    'tipo': linha.get('tipoAutor'),
+                    'uriAutor': linha.get('uriAutor')
+                }
+            return montar
+        return self._ingerir_dump(diretorio, [f'proposicoesAutores-{ano}' for ano in anos],
+                                  converter, 'autores_proposicoes.json', 'Autores')
+
+    def ingerir_votos(self, diretorio, anos=ANOS_PADRAO):
+        """votos.json a partir de votacoesVotos-{ano}"""
+        def converter(nome_base):
+            datas = self._mapa_dump(diretorio, nome_base.replace('votacoesVotos', 'votacoes'),
+                                    'id', 'data')
+
+            def montar(linha):
+                id_votacao = linha.get('idVotacao')
+                return {
+                    'idVotacao': id_votacao,
+                    'dataVotacao': datas.get(id_votacao) or (linha.get('dataHoraVoto') or '')[:10] or None,
+                    'idDeputado': _inteiro(linha.get('deputado_id')),
+                    'nomeDeputado': linha.get('deputado_nome'),
+                    'siglaPartido': linha.get('deputado_siglaPartido'),
+                    'siglaUf': linha.get('deputado_siglaUf'),
+                    'voto': linha.get('voto') or linha.get('tipoVoto')
+                }
+            return montar
+        return self._ingerir_dump(diretorio, [f'votacoesVotos-{ano}' for ano in anos],
+                                  converter, 'votos.json', 'Votos')
+
+    def abrir_saida(self, nome_arquivo):
+        """
+        Abre um escritor em streaming para o arquivo de saída, aplicando o
+        formato e a compressão configurados (ex.: votos.json -> votos.jsonl.gz)
+        """
+        caminho = os.path.join(self.output_dir, nome_saida(nome_arquivo, self.formato, self.compressao))
+        return EscritorRegistros(caminho, self.formato)
+
     def salvar_json(self, dados, nome_arquivo):
         """
-        Salva dados em arquivo JSON
+        Salva dados em arquivo JSON (ou no formato configurado)
         """
-        caminho_completo = os.path.join(self.output_dir, nome_arquivo)
-        with open(caminho_completo, 'w', encoding='utf-8') as f:
-            json.dump(dados, f, ensure_ascii=False, indent=2)
-        print(f"  ✓ Dados salvos em {caminho_completo}")
+        with self.abrir_saida(nome_arquivo) as saida:
+            saida.escrever_varios(dados)
+        print(f"  ✓ Dados salvos em {saida.caminho}")
+
+    def _fase_lista(self, fase, nome_arquivo, coletar):
+        """
+        Executa uma fase de listagem; ao retomar uma coleta, reaproveita o
+        arquivo já salvo se a fase tiver sido concluída. Se faltarem páginas,
+        salva o que veio mas deixa a fase aberta para o --resume refazê-la
+        """
+        caminho = localizar_arquivo(os.path.join(self.output_dir, nome_arquivo))
+        if self.checkpoint and self.checkpoint.fase_concluida(fase) and caminho:
+            itens = list(iterar_registros(caminho))
+            print(f"\n↺ {fase}: {len(itens)} itens reaproveitados de {caminho}")
+            return itens
+
+        incompleta = False
+        with self.metricas.fase(fase) as medicao:
+            try:
+                itens = coletar()
+            except PaginasNaoColetadas as erro:
+                print(f"\n  ⚠ {erro}; execute novamente com --resume para completá-las")
+                itens, incompleta = erro.dados, True
+            medicao['itens'] = len(itens)
+        self.salvar_json(itens, nome_arquivo)
+        if incompleta:
+            self._fases_incompletas.append(fase)
+        elif self.checkpoint:
+            self.checkpoint.concluir_fase(fase)
+        return itens
+
+    @staticmethod
+    def _falha_definitiva(status):
+        """4xx que não muda numa nova tentativa (429 e 408 são passageiros)"""
+        return (status is not None and 400 <= status < 500 and
+                status not in LimitadorTaxa.STATUS_SOBRECARGA + (408,))
+
+    def _fase_detalhe(self, fase, itens, id_item, buscar, montar, rotulo, nome_arquivo):
+        """
+        Executa uma fase com uma requisição por item: fan-out concorrente,
+        checkpoint de cada item assim que chega e saída na ordem dos itens.
+        `buscar(item)` retorna a resposta (None em caso de falha) e
+        `montar(item, resposta)` a converte na lista de registros do item.
+        Os registros vão direto para `nome_arquivo`; retorna quantos foram escritos.
+        Itens já no checkpoint são relidos do disco na hora de escrever; itens
+        recusados de vez pela API (4xx) ficam anotados e não são pedidos de novo.
+        """
+        feitos = self.checkpoint.concluidos(fase) if self.checkpoint else set()
+        recusados = self.checkpoint.falhas_definitivas(fase) if self.checkpoint else {}
+        saida = self.abrir_saida(nome_arquivo)
+        falhas = descartados = 0
+
+        def tarefa(item):
+            chave = str(id_item(item))
+            if chave in feitos or chave in recusados:
+                return None, False, recusados.get(chave)
+            self._requisicao_local.status = None
+            resposta = buscar(item)
+            return resposta, True, self._requisicao_local.status
+
+        def ao_concluir(i, item, resultado):
+            nonlocal falhas, descartados
+            resposta, novo, status = resultado
+            print(f"  → {rotulo} {i}/{len(itens)}: {id_item(item)}", end='\r')
+            if not novo:
+                if status is None:
+                    saida.escrever_varios(self.checkpoint.registros_salvos(fase, id_item(item)))
+                else:
+                    descartados += 1
+                return
+            if resposta is None:
+                if self._falha_definitiva(status):
+                    descartados += 1
+                    if self.checkpoint:
+                        self.checkpoint.registrar_falha(fase, id_item(item), status)
+                else:
+                    falhas += 1  # Fica fora do checkpoint para ser refeito no --resume
+                return
+            registros_item = montar(item, resposta)
+            if self.checkpoint:
+                self.checkpoint.registrar(fase, id_item(item), registros_item)
+            saida.escrever_varios(registros_item)
+
+        with saida, self.metricas.fase(fase) as medicao:
+            self._executar_fan_out(itens, tarefa, ao_concluir)
+            medicao['itens'] = saida.total
+        print(f"\n  ✓ Dados salvos em {saida.caminho}" + " "*30)
+
+        if descartados:
+            print(f"  ⚠ {descartados} itens recusados pela API (4xx) e descartados")
+        if falhas:
+            print(f"\n  ⚠ {falhas} itens falharam; execute novamente com --resume para completá-los")
+            self._fases_incompletas.append(fase)
+        elif self.checkpoint:
+            self.checkpoint.concluir_fase(fase)
+        return saida.total
 
     def coletar_dados_completos(self, incluir_detalhes_deputados=True,
                                  incluir_membros_frentes=True,
                                  incluir_autores_proposicoes=True,
                                  incluir_votos_votacoes=True,
                                  max_proposicoes=3000,
-                                 max_votacoes=500):
+                                 max_votacoes=500,
+                                 retomar=False,
+                                 janela=None,
+                                 fonte='api',
+                                 dir_arquivos='arquivos_camara',
+                                 anos_arquivos=ANOS_PADRAO):
         """
         Coleta todos os dados necessários para a análise
+        Com retomar=True, continua uma coleta interrompida a partir do checkpoint;
+        fases que ficarem pendentes aparecem em `fases_incompletas`.
+        Com `janela`, proposições e votações são coletadas em janelas de datas;
+        max_proposicoes/max_votacoes=None removem o limite.
+        Com fonte='arquivos', membros de frentes, autores e votos são lidos dos
+        arquivos anuais em `dir_arquivos` em vez de uma requisição por item.
+        As fases de detalhe são gravadas em streaming; em `dados` fica só a
+        quantidade de registros de cada uma.
         """
         print("\n" + "="*70)
         print("🚀 COLETA COMPLETA DE DADOS - CÂMARA DOS DEPUTADOS")
         print("="*70)
 
+        self.checkpoint = CheckpointColeta(self.output_dir, retomar=retomar, parametros={
+            'max_proposicoes': max_proposicoes,
+            'max_votacoes': max_votacoes,
+            'janela': janela,
+            'fonte': fonte,
+        })
+
+        self._fases_incompletas = []
         dados = {}
 
         # 1. Partidos
-        dados['partidos'] = self.get_partidos()
-        self.salvar_json(dados['partidos'], 'partidos.json')
+        dados['partidos'] = self._fase_lista('partidos', 'partidos.json', self.get_partidos)
 
         # 2. Deputados básicos
-        dados['deputados'] = self.get_deputados()
-        self.salvar_json(dados['deputados'], 'deputados.json')
+        dados['deputados'] = self._fase_lista('deputados', 'deputados.json', self.get_deputados)
 
         # 3. Detalhes de deputados (opcional, mas recomendado)
         if incluir_detalhes_deputados:
             print(f"\n📊 Coletando detalhes de {len(dados['deputados'])} deputados...")
-            deputados_detalhados = []
-            for i, dep in enumerate(dados['deputados'], 1):
-                print(f"  → Deputado {i}/{len(dados['deputados'])}: {dep.get('nome', 'N/A')[:30]}", end='\r')
-                detalhes = self.get_detalhes_deputado(dep['id'])
-                if detalhes:
-                    deputados_detalhados.append(detalhes)
-
-            print(f"\n  ✓ {len(deputados_detalhados)} deputados detalhados coletados" + " "*30)
+            deputados_detalhados = self._fase_detalhe(
+                'deputados_detalhados', dados['deputados'],
+                id_item=lambda dep: dep['id'],
+                buscar=lambda dep: self.get_detalhes_deputado(dep['id'], estrito=True),
+                montar=lambda dep, detalhes: [detalhes] if detalhes else [],
+                rotulo='Deputado',
+                nome_arquivo='deputados_detalhados.json')
+
+            print(f"  ✓ {deputados_detalhados} deputados detalhados coletados")
             dados['deputados_detalhados'] = deputados_detalhados
-            self.salvar_json(deputados_detalhados, 'deputados_detalhados.json')
 
         # 4. Frentes Parlamentares
-        dados['frentes'] = self.get_frentes()
-        self.salvar_json(dados['frentes'], 'frentes.json')
+        dados['frentes'] = self._fase_lista('frentes', 'frentes.json', self.get_frentes)
 
         # 5. Membros de Frentes (relacionamento importante)
-        if incluir_membros_frentes and dados['frentes']:
+        if incluir_membros_frentes and fonte == 'arquivos':
+            print(f"\n🔗 Lendo membros de frentes de {dir_arquivos}/...")
+            dados['membros_frentes'] = self.ingerir_membros_frentes(dir_arquivos)
+            print(f"  ✓ {dados['membros_frentes']} membros de frentes lidos")
+        elif incluir_membros_frentes and dados['frentes']:
             print(f"\n🔗 Coletando membros de {len(dados['frentes'])} frentes...")
-            membros_frentes = []
-            for i, frente in enumerate(dados['frentes'], 1):
-                print(f"  → Frente {i}/{len(dados['frentes'])}: {frente.get('titulo', 'N/A')[:40]}", end='\r')
-                membros = self.get_membros_frente(frente['id'])
-                for membro in membros:
-                    membros_frentes.append({
-                        'idFrente': frente['id'],
-                        'tituloFrente': frente.get('titulo'),
-                        'idDeputado': membro.get('id'),
-                        'nomeDeputado': membro.get('nome'),
-                        'titulo': membro.get('titulo', 'Membro')
-                    })
-
-            print(f"\n  ✓ {len(membros_frentes)} membros de frentes coletados" + " "*30)
+            membros_frentes = self._fase_detalhe(
+                'membros_frentes', dados['frentes'],
+                id_item=lambda frente: frente['id'],
+                buscar=lambda frente: self.get_membros_frente(frente['id'], estrito=True),
+                montar=lambda frente, membros: [{
+                    'idFrente': frente['id'],
+                    'tituloFrente': frente.get('titulo'),
+                    'idDeputado': membro.get('id'),
+                    'nomeDeputado': membro.get('nome'),
+                    'titulo': membro.get('titulo', 'Membro')
+                } for membro in membros],
+                rotulo='Frente',
+                nome_arquivo='membros_frentes.json')
+
+            print(f"  ✓ {membros_frentes} membros de frentes coletados")
             dados['membros_frentes'] = membros_frentes
-            self.salvar_json(membros_frentes, 'membros_frentes.json')
 
         # 6. Proposições
-        dados['proposicoes'] = self.get_proposicoes(max_items=max_proposicoes)
-        self.salvar_json(dados['proposicoes'], 'proposicoes.json')
+        dados['proposicoes'] = self._fase_lista(
+            'proposicoes', 'proposicoes.json',
+            lambda: self.get_proposicoes(max_items=max_proposicoes, janela=janela))
 
         # 7. Autores de Proposições
-        if incluir_autores_proposicoes and dados['proposicoes']:
+        if incluir_autores_proposicoes and fonte == 'arquivos':
+            print(f"\n✍️  Lendo autores de proposições de {dir_arquivos}/...")
+            dados['autores_proposicoes'] = self.ingerir_autores_proposicoes(dir_arquivos, anos_arquivos)
+            print(f"  ✓ {dados['autores_proposicoes']} autores de proposições lidos")
+        elif incluir_autores_proposicoes and dados['proposicoes']:
             print(f"\n✍️  Coletando autores de {len(dados['proposicoes'])} proposições...")
-            autores_proposicoes = []
-            for i, prop in enumerate(dados['proposicoes'], 1):
-                print(f"  → Proposição {i}/{len(dados['proposicoes'])}: {prop.get('id')}", end='\r')
-                autores = self.get_autores_proposicao(prop['id'])
-                for autor in autores:
-                    autores_proposicoes.append({
-                        'idProposicao': prop['id'],
-                        'tipoProposicao': prop.get('siglaTipo'),
-                        'idAutor': autor.get('id'),
-                        'nomeAutor': autor.get('nome'),
-                        'tipo': autor.get('tipo'),
-                        'uriAutor': autor.get('uri')
-                    })
-
-            print(f"\n  ✓ {len(autores_proposicoes)} autores de proposições coletados" + " "*30)
+            autores_proposicoes = self._fase_detalhe(
+                'autores_proposicoes', dados['proposicoes'],
+                id_item=lambda prop: prop['id'],
+                buscar=lambda prop: self.get_autores_proposicao(prop['id'], estrito=True),
+                montar=lambda prop, autores: [{
+                    'idProposicao': prop['id'],
+                    'tipoProposicao': prop.get('siglaTipo'),
+                    'idAutor': autor.get('id'),
+                    'nomeAutor': autor.get('nome'),
+                    'tipo': autor.get('tipo'),
+                    'uriAutor': autor.get('uri')
+                } for autor in autores],
+                rotulo='Proposição',
+                nome_arquivo='autores_proposicoes.json')
+
+            print(f"  ✓ {autores_proposicoes} autores de proposições coletados")
             dados['autores_proposicoes'] = autores_proposicoes
-            self.salvar_json(autores_proposicoes, 'autores_proposicoes.json')
 
         # 8. Votações
-        dados['votacoes'] = self.get_votacoes(max_items=max_votacoes)
-        self.salvar_json(dados['votacoes'], 'votacoes.json')
+        dados['votacoes'] = self._fase_lista(
+            'votacoes', 'votacoes.json',
+            lambda: self.get_votacoes(max_items=max_votacoes, janela=janela))
 
         # 9. Votos individuais (MUITOS DADOS!)
-        if incluir_votos_votacoes and dados['votacoes']:
+        if incluir_votos_votacoes and fonte == 'arquivos':
+            print(f"\n🗳️  Lendo votos de {dir_arquivos}/...")
+            dados['votos'] = self.ingerir_votos(dir_arquivos, anos_arquivos)
+            print(f"  ✓ {dados['votos']} votos individuais lidos")
+        elif incluir_votos_votacoes and dados['votacoes']:
             print(f"\n🗳️  Coletando votos de {len(dados['votacoes'])} votações...")
-            todos_votos = []
-            for i, votacao in enumerate(dados['votacoes'], 1):
-                id_votacao = votacao.get('id')
-                print(f"  → Votação {i}/{len(dados['votacoes'])}: ID {id_votacao}", end='\r')
-                votos = self.get_votos_votacao(id_votacao)
-                for voto in votos:
-                    todos_votos.append({
-                        'idVotacao': id_votacao,
-                        'dataVotacao': votacao.get('data'),
-                        'idDeputado': voto.get('deputado_', {}).get('id'),
-                        'nomeDeputado': voto.get('deputado_', {}).get('nome'),
-                        'siglaPartido': voto.get('deputado_', {}).get('siglaPartido'),
-                        'siglaUf': voto.get('deputado_', {}).get('siglaUf'),
-                        'voto': voto.get('tipoVoto')
-                    })
-
-            print(f"\n  ✓ {len(todos_votos)} votos individuais coletados" + " "*30)
+            todos_votos = self._fase_detalhe(
+                'votos', dados['votacoes'],
+                id_item=lambda votacao: votacao.get('id'),
+                buscar=lambda votacao: self.get_votos_votacao(votacao.get('id'), estrito=True),
+                montar=lambda votacao, votos: [{
+                    'idVotacao': votacao.get('id'),
+                    'dataVotacao': votacao.get('data'),
+                    'idDeputado': voto.get('deputado_', {}).get('id'),
+                    'nomeDeputado': voto.get('deputado_', {}).get('nome'),
+                    'siglaPartido': voto.get('deputado_', {}).get('siglaPartido'),
+                    'siglaUf': voto.get('deputado_', {}).get('siglaUf'),
+                    'voto': voto.get('tipoVoto')
+                } for voto in votos],
+                rotulo='Votação',
+                nome_arquivo='votos.json')
+
+            print(f"  ✓ {todos_votos} votos individuais coletados")
             dados['votos'] = todos_votos
-            self.salvar_json(todos_votos, 'votos.json')
 
         # 10. Órgãos/Comissões
-        dados['orgaos'] = self.get_orgaos()
-        self.salvar_json(dados['orgaos'], 'orgaos.json')
+        dados['orgaos'] = self._fase_lista('orgaos', 'orgaos.json', self.get_orgaos)
+
+        if not self._fases_incompletas:
+            self.checkpoint.finalizar()
 
         # Resumo final
         print("\n" + "="*70)
-        print("✅ COLETA CONCLUÍDA COM SUCESSO!")
+        if self._fases_incompletas:
+            print("⚠️  COLETA INCOMPLETA!")
+            print(f"   Fases com itens pendentes: {', '.join(self._fases_incompletas)} (use --resume)")
+        else:
+            print("✅ COLETA CONCLUÍDA COM SUCESSO!")
         print("="*70)
         print(f"\n📊 RESUMO DOS DADOS COLETADOS:")
         print(f"  • Partidos: {len(dados.get('partidos', []))}")
         print(f"  • Deputados: {len(dados.get('deputados', []))}")
         if 'deputados_detalhados' in dados:
-            print(f"  • Deputados (detalhados): {len(dados['deputados_detalhados'])}")
+            print(f"  • Deputados (detalhados): {dados['deputados_detalhados']}")
         print(f"  • Frentes Parlamentares: {len(dados.get('frentes', []))}")
         if 'membros_frentes' in dados:
-            print(f"  • Membros de Frentes: {len(dados['membros_frentes'])}")
+            print(f"  • Membros de Frentes: {dados['membros_frentes']}")
         print(f"  • Proposições: {len(dados.get('proposicoes', []))}")
         if 'autores_proposicoes' in dados:
-            print(f"  • Autores de Proposições: {len(dados['autores_proposicoes'])}")
+            print(f"  • Autores de Proposições: {dados['autores_proposicoes']}")
         print(f"  • Votações: {len(dados.get('votacoes', []))}")
         if 'votos' in dados:
-            print(f"  • Votos Individuais: {len(dados['votos'])}")
+            print(f"  • Votos Individuais: {dados['votos']}")
         print(f"  • Órgãos/Comissões: {len(dados.get('orgaos', []))}")
+        conexoes = self.metricas_conexoes()
+        print(f"\n🔌 Conexões: {conexoes['conexoes_abertas']} abertas, "
+              f"{conexoes['conexoes_reutilizadas']} reutilizadas em {conexoes['requisicoes']} requisições")
+        if self.cache:
+            print(f"💾 Cache: {self.cache.acertos} acertos, {self.cache.revalidadas} revalidadas (304), "
+                  f"{self.cache.faltas} faltas")
+        print(f"⏱  Rede: {self.metricas.relatorio()['segundos_rede']:.1f}s em requisições, "
+              f"{self.metricas.tempo_espera:.1f}s aguardando o limitador, "
+              f"{self.metricas.bytes_recebidos / 1e6:.1f} MB recebidos")
         print(f"\n💾 Todos os arquivos salvos em: {self.output_dir}/")
         print("="*70 + "\n")
 
@@ -413,48 +1624,115 @@ if __name__ == "__main__":
     parser.add_argument('--output', default='dados_camara',
                         help='Diretório de saída dos arquivos JSON')
     parser.add_argument('--max-proposicoes', type=int, default=3000,
-                        help='Número máximo de proposições a coletar')
+                        help='Número máximo de proposições a coletar (0 = sem limite)')
     parser.add_argument('--max-votacoes', type=int, default=500,
-                        help='Número máximo de votações a coletar')
+                        help='Número máximo de votações a coletar (0 = sem limite)')
+    parser.add_argument('--janela', choices=['mes', 'trimestre', 'ano', 'nenhuma'],
+                        default='trimestre',
+                        help='Divide proposições e votações em janelas de datas coletadas em paralelo')
+    parser.add_argument('--concorrencia', '--concurrency', type=int, default=4,
+                        help='Número máximo de requisições de detalhe simultâneas')
+    parser.add_argument('--taxa', type=float, default=8.0,
+                        help='Requisições por segundo permitidas pelo limitador')
+    parser.add_argument('--rajada', type=int, default=16,
+                        help='Tamanho máximo de rajada do limitador (token bucket)')
+    parser.add_argument('--pool', type=int, default=None,
+                        help='Conexões keep-alive mantidas no pool (padrão: igual à concorrência)')
+    parser.add_argument('--sem-cache', action='store_true',
+                        help='Ignora o cache de respostas em disco')
+    parser.add_argument('--offline', action='store_true',
+                        help='Usa apenas respostas já presentes no cache (sem rede)')
+    parser.add_argument('--formato', choices=FORMATOS, default='json',
+                        help='Formato dos arquivos de saída (jsonl grava um registro por linha)')
+    parser.add_argument('--compressao', choices=COMPRESSOES, default=None,
+                        help='Comprime os arquivos de saída (zstd requer o pacote zstandard)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Retoma uma coleta interrompida a partir do checkpoint')
+    parser.add_argument('--cache-max-mb', type=float, default=1024,
+                        help='Tamanho máximo do cache de respostas (MB)')
+    parser.add_argument('--relatorio', default=None,
+                        help='Arquivo do relatório JSON da execução (padrão: <output>/relatorio_coleta.json)')
+    parser.add_argument('--prometheus', default=None,
+                        help='Também grava as métricas no formato texto do Prometheus neste arquivo')
+    parser.add_argument('--fonte', choices=['api', 'arquivos'], default='api',
+                        help='Origem de votos, autores e membros de frentes: API (uma requisição '
+                             'por item) ou arquivos anuais de dados abertos')
+    parser.add_argument('--dir-arquivos', default='arquivos_camara',
+                        help='Diretório com os arquivos anuais (votacoesVotos-AAAA.csv, ...)')
+    parser.add_argument('--anos', type=int, nargs='+', default=list(ANOS_PADRAO),
+                        help='Anos dos arquivos anuais a ler/baixar')
+    parser.add_argument('--baixar-arquivos', action='store_true',
+                        help='Apenas baixa os arquivos anuais para --dir-arquivos e sai')
 
     args = parser.parse_args()
 
     # Criar instância do coletor
-    coletor = ColetorDadosCamara(output_dir=args.output)
+    coletor = ColetorDadosCamara(output_dir=args.output, concorrencia=args.concorrencia,
+                                 taxa=args.taxa, rajada=args.rajada, tamanho_pool=args.pool,
+                                 usar_cache=not args.sem_cache, offline=args.offline,
+                                 cache_max_mb=args.cache_max_mb,
+                                 formato=args.formato, compressao=args.compressao)
+
+    codigo_saida = 0
+    try:
+        if args.baixar_arquivos:
+            print(f"\n📥 Baixando arquivos anuais para {args.dir_arquivos}/")
+            print("="*70)
+            coletor.baixar_arquivos_anuais(args.dir_arquivos, args.anos)
+
+        elif args.modo == 'teste':
+            # Modo teste: coleta rápida para verificar se tudo funciona
+            print("\n🧪 MODO TESTE - Coleta mínima de dados")
+            print("="*70)
+            partidos = coletor.get_partidos()
+            coletor.salvar_json(partidos, 'partidos.json')
+
+            deputados = coletor.get_deputados()[:10]  # Apenas 10
+            coletor.salvar_json(deputados, 'deputados_teste.json')
+
+            frentes = coletor.get_frentes()[:5]  # Apenas 5
+            coletor.salvar_json(frentes, 'frentes_teste.json')
+
+            print("\n✅ Teste concluído! Verifique os arquivos no diretório", args.output)
+
+        elif args.modo == 'rapido':
+            # Modo rápido: sem detalhes extras
+            coletor.coletar_dados_completos(
+                incluir_detalhes_deputados=False,
+                incluir_membros_frentes=True,
+                incluir_autores_proposicoes=True,
+                incluir_votos_votacoes=True,
+                max_proposicoes=args.max_proposicoes or None,
+                max_votacoes=args.max_votacoes or None,
+                retomar=args.resume,
+                janela=None if args.janela == 'nenhuma' else args.janela,
+                fonte=args.fonte,
+                dir_arquivos=args.dir_arquivos,
+                anos_arquivos=args.anos
+            )
 
-    if args.modo == 'teste':
-        # Modo teste: coleta rápida para verificar se tudo funciona
-        print("\n🧪 MODO TESTE - Coleta mínima de dados")
-        print("="*70)
-        partidos = coletor.get_partidos()
-        coletor.salvar_json(partidos, 'partidos.json')
-
-        deputados = coletor.get_deputados()[:10]  # Apenas 10
-        coletor.salvar_json(deputados, 'deputados_teste.json')
-
-        frentes = coletor.get_frentes()[:5]  # Apenas 5
-        coletor.salvar_json(frentes, 'frentes_teste.json')
-
-        print("\n✅ Teste concluído! Verifique os arquivos no diretório", args.output)
-
-    elif args.modo == 'rapido':
-        # Modo rápido: sem detalhes extras
-        coletor.coletar_dados_completos(
-            incluir_detalhes_deputados=False,
-            incluir_membros_frentes=True,
-            incluir_autores_proposicoes=True,
-            incluir_votos_votacoes=True,
-            max_proposicoes=args.max_proposicoes,
-            max_votacoes=args.max_votacoes
-        )
-
-    else:
-        # Modo completo: tudo!
-        coletor.coletar_dados_completos(
-            incluir_detalhes_deputados=True,
-            incluir_membros_frentes=True,
-            incluir_autores_proposicoes=True,
-            incluir_votos_votacoes=True,
-            max_proposicoes=args.max_proposicoes,
-            max_votacoes=args.max_votacoes
-        )
\ No newline at end of file
+        else:
+            # Modo completo: tudo!
+            coletor.coletar_dados_completos(
+                incluir_detalhes_deputados=True,
+                incluir_membros_frentes=True,
+                incluir_autores_proposicoes=True,
+                incluir_votos_votacoes=True,
+                max_proposicoes=args.max_proposicoes or None,
+                max_votacoes=args.max_votacoes or None,
+                retomar=args.resume,
+                janela=None if args.janela == 'nenhuma' else args.janela,
+                fonte=args.fonte,
+                dir_arquivos=args.dir_arquivos,
+                anos_arquivos=args.anos
+            )
+
+        # Coleta incompleta sai com status 1, para scripts não seguirem adiante
+        if coletor.fases_incompletas:
+            codigo_saida = 1
+
+    finally:
+        coletor.salvar_relatorio(args.relatorio, args.prometheus)
+        coletor.close()
+
+    raise SystemExit(codigo_saida)
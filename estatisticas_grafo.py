@@ -0,0 +1,115 @@
+"""
+Estatísticas do grafo em uma única consulta
+Contagens por rótulo e por tipo de relacionamento (respondidas pelo count
+store do Neo4j, ou pelo apoc.meta.stats quando o APOC está instalado) e
+distribuições de grau, como frentes por deputado, numa só ida ao servidor.
+Usado pelo importador e pelas análises.
+"""
+
+import time
+
+from neo4j.exceptions import ClientError
+
+ROTULOS = ["Deputado", "Partido", "Frente", "UF", "Proposicao", "Votacao", "TipoVoto"]
+RELACIONAMENTOS = ["FILIADO_A", "REPRESENTA", "MEMBRO_DE", "AUTOR_DE", "VOTOU"]
+
+# (nome, rótulo dos nós medidos, padrão a partir de n); COUNT { } vira leitura
+# do grau armazenado no nó, sem percorrer as relações
+GRAUS = [
+    ("Frentes por deputado (MEMBRO_DE)", "Deputado", "(n)-[:MEMBRO_DE]->()"),
+    ("Membros por frente (MEMBRO_DE)", "Frente", "(n)<-[:MEMBRO_DE]-()"),
+    ("Partidos por deputado (FILIADO_A)", "Deputado", "(n)-[:FILIADO_A]->()"),
+    ("Proposições por deputado (AUTOR_DE)", "Deputado", "(n)-[:AUTOR_DE]->()"),
+    ("Votos por deputado (VOTOU)", "Deputado", "(n)-[:VOTOU]->()"),
+]
+
+
+def _nome_cypher(nome):
+    return '`' + nome.replace('`', '``') + '`'
+
+
+class EstatisticasGrafo:
+    """Monta e executa a consulta única de estatísticas sobre um driver"""
+
+    def __init__(self, driver, rotulos=ROTULOS, relacionamentos=RELACIONAMENTOS, graus=GRAUS):
+        self.driver = driver
+        self.rotulos = list(rotulos)
+        self.relacionamentos = list(relacionamentos)
+        self.graus = list(graus)
+        self.usar_apoc = None  # Descoberto na primeira coleta
+
+    def _subconsultas_graus(self):
+        partes = []
+        for i, (_, rotulo, padrao) in enumerate(self.graus):
+            partes.append(
+                f"\nCALL {{\n"
+                f"  MATCH (n:{_nome_cypher(rotulo)})\n"
+                f"  WITH COUNT {{ {padrao} }} AS grau\n"
+                f"  RETURN {{nos: count(*), sem_relacao: sum(CASE WHEN grau = 0 THEN 1 ELSE 0 END),\n"
+                f"          minimo: min(grau), media: avg(grau), p50: percentileDisc(grau, 0.5),\n"
+                f"          p90: percentileDisc(grau, 0.9), p99: percentileDisc(grau, 0.99),\n"
+                f"          maximo: max(grau)}} AS grau_{i}\n"
+                f"}}")
+        return ''.join(partes)
+
+    def query(self, apoc=False):
+        """Consulta única: contagens (count store ou APOC) e graus"""
+        retorno = [f"grau_{i}" for i in range(len(self.graus))]
+        if apoc:
+            contagens = "CALL apoc.meta.stats() YIELD labels, relTypesCount"
+            retorno = ["labels", "relTypesCount"] + retorno
+        else:
+            # count() sem filtros sobre um rótulo ou tipo sai do count store
+            partes = [f"CALL {{ MATCH (n:{_nome_cypher(rotulo)}) RETURN count(n) AS no_{i} }}"
+                      for i, rotulo in enumerate(self.rotulos)]
+            partes += [f"CALL {{ MATCH ()-[r:{_nome_cypher(tipo)}]->() RETURN count(r) AS rel_{i} }}"
+                       for i, tipo in enumerate(self.relacionamentos)]
+            contagens = '\n'.join(partes)
+            retorno = ([f"no_{i}" for i in range(len(self.rotulos))] +
+                       [f"rel_{i}" for i in range(len(self.relacionamentos))] + retorno)
+        return f"{contagens}{self._subconsultas_graus()}\nRETURN {', '.join(retorno)}"
+
+    def _executar(self, apoc):
+        with self.driver.session() as session:
+            return dict(session.run(self.query(apoc)).single())
+
+    def coletar(self):
+        """
+        Retorna {'nos': {rótulo: n}, 'relacionamentos': {tipo: n},
+        'graus': {nome: {nos, sem_relacao, minimo, media, p50, p90, p99, maximo}},
+        'fonte': ..., 'segundos': ...}
+        """
+        inicio = time.perf_counter()
+        registro = None
+        if self.usar_apoc is not False:
+            try:
+                registro = self._executar(apoc=True)
+                self.usar_apoc = True
+            except ClientError as e:
+                if 'ProcedureNotFound' not in (e.code or ''):
+                    raise
+                self.usar_apoc = False
+        if registro is None:
+            registro = self._executar(apoc=False)
+
+        if self.usar_apoc:
+            nos = {rotulo: registro['labels'].get(rotulo, 0) for rotulo in self.rotulos}
+            relacionamentos = {tipo: registro['relTypesCount'].get(tipo, 0) for tipo in self.relacionamentos}
+        else:
+            nos = {rotulo: registro[f"no_{i}"] for i, rotulo in enumerate(self.rotulos)}
+            relacionamentos = {tipo: registro[f"rel_{i}"] for i, tipo in enumerate(self.relacionamentos)}
+        return {
+            'nos': nos,
+            'relacionamentos': relacionamentos,
+            'graus': {nome: registro[f"grau_{i}"] for i, (nome, _, _) in enumerate(self.graus)},
+            'fonte': 'apoc.meta.stats' if self.usar_apoc else 'count store',
+            'segundos': round(time.perf_counter() - inicio, 3),
+        }
+
+
+def descrever_grau(grau):
+    """Texto curto de uma distribuição de grau (None se não há nós)"""
+    if not grau or not grau.get('nos'):
+        return None
+    return (f"média {grau['media']:.1f}, mediana {grau['p50']}, p90 {grau['p90']}, "
+            f"máx {grau['maximo']} ({grau['sem_relacao']:,} de {grau['nos']:,} sem nenhuma)")
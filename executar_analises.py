@@ -2,139 +2,491 @@
 Executa as 5 consultas de análise e gera resultados
 """
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from neo4j import GraphDatabase
+from neo4j.exceptions import ClientError
+import argparse
+import hashlib
 import json
+import os
+import sqlite3
+import threading
+import time
+
+from estatisticas_grafo import EstatisticasGrafo, descrever_grau
+from importar_aura import INDICES_TEXTO
+
+DIR_CACHE = 'dados_camara/.cache_consultas'
+
+# Colunas devolvidas pela busca temática, por rótulo (n é o nó encontrado)
+COLUNAS_BUSCA = {
+    'Frente': "n.titulo AS Frente, n.idLegislatura AS Legislatura",
+    'Proposicao': "n.siglaTipo AS Tipo, n.numero AS Numero, n.ano AS Ano, n.ementa AS Ementa",
+}
+
+
+class CacheConsultas:
+    """
+    Cache dos resultados das consultas, chaveado pelo texto da query, pelos
+    parâmetros e pela versão do grafo que o importador grava a cada carga
+    (nó :Metadados). Fica em memória (LRU limitado a `max_entradas`, com
+    TTL) e, se houver `diretorio`, também num SQLite, para que execuções
+    seguidas entre duas importações não consultem o Aura de novo.
+    """
+
+    def __init__(self, diretorio=None, ttl=24 * 3600, max_entradas=256):
+        self.ttl = ttl
+        self.max_entradas = max_entradas
+        self.acertos = 0
+        self.faltas = 0
+        self._memoria = OrderedDict()  # chave -> (salvo_em, dados)
+        self._lock = threading.Lock()
+        self._conexao = None
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+            self._conexao = sqlite3.connect(os.path.join(diretorio, 'consultas.sqlite'),
+                                            check_same_thread=False)
+            self._conexao.execute("""
+                CREATE TABLE IF NOT EXISTS consultas (
+                    chave TEXT PRIMARY KEY,
+                    versao TEXT,
+                    salvo_em REAL,
+                    acessado_em REAL,
+                    dados TEXT
+                )""")
+            self._conexao.execute("CREATE INDEX IF NOT EXISTS idx_acesso ON consultas (acessado_em)")
+            self._conexao.commit()
+
+    @staticmethod
+    def chave(query, parametros, versao):
+        """Chave estável para query + parâmetros + versão do grafo"""
+        itens = sorted((str(k), repr(v)) for k, v in (parametros or {}).items())
+        return hashlib.sha256(json.dumps([query, itens, versao]).encode('utf-8')).hexdigest()
+
+    def obter(self, chave):
+        """Resultado guardado e dentro do TTL (ou None), marcando o acesso para o LRU"""
+        agora = time.time()
+        with self._lock:
+            entrada = self._memoria.get(chave)
+            if entrada is not None and agora - entrada[0] < self.ttl:
+                self._memoria.move_to_end(chave)
+                self.acertos += 1
+                return entrada[1]
+            if self._conexao is not None:
+                linha = self._conexao.execute("SELECT salvo_em, dados FROM consultas WHERE chave = ?",
+                                              (chave,)).fetchone()
+                if linha is not None and agora - linha[0] < self.ttl:
+                    self._conexao.execute("UPDATE consultas SET acessado_em = ? WHERE chave = ?",
+                                          (agora, chave))
+                    self._conexao.commit()
+                    dados = json.loads(linha[1])
+                    self._guardar_memoria(chave, linha[0], dados)
+                    self.acertos += 1
+                    return dados
+            self.faltas += 1
+            return None
+
+    def _guardar_memoria(self, chave, salvo_em, dados):
+        self._memoria[chave] = (salvo_em, dados)
+        self._memoria.move_to_end(chave)
+        while len(self._memoria) > self.max_entradas:
+            self._memoria.popitem(last=False)
+
+    def guardar(self, chave, versao, dados):
+        agora = time.time()
+        with self._lock:
+            self._guardar_memoria(chave, agora, dados)
+            if self._conexao is not None:
+                self._conexao.execute(
+                    "INSERT OR REPLACE INTO consultas VALUES (?, ?, ?, ?, ?)",
+                    (chave, versao, agora, agora, json.dumps(dados, ensure_ascii=False, default=str)))
+                # Descarte LRU no disco, com o mesmo limite da memória
+                self._conexao.execute("""
+                    DELETE FROM consultas WHERE chave IN (
+                        SELECT chave FROM consultas ORDER BY acessado_em DESC LIMIT -1 OFFSET ?)""",
+                    (self.max_entradas,))
+                self._conexao.commit()
+
+    def descartar_outras_versoes(self, versao):
+        """Remove do disco resultados de versões anteriores do grafo (nunca mais acertam)"""
+        if self._conexao is None:
+            return
+        with self._lock:
+            self._conexao.execute("DELETE FROM consultas WHERE versao IS NOT ?", (versao,))
+            self._conexao.commit()
+
+    def close(self):
+        if self._conexao is not None:
+            self._conexao.close()
+
 
 class AnalisadorDados:
-    def __init__(self):
+    def __init__(self, legislatura=None, cache=None):
+        # FILIADO_A e REPRESENTA guardam a legislatura; None considera todas
+        self.legislatura = legislatura
         self.URI = "neo4j+s://2a3ba8da.databases.neo4j.io"
         self.AUTH = ("neo4j", "N_CdGEmG4OlD7yhMOgsvkkUzHxq7Gi_-5D5kpvcMAV4")
+        # O driver é compartilhado entre as threads; cada consulta abre sua sessão
         self.driver = GraphDatabase.driver(self.URI, auth=self.AUTH)
+        self.estatisticas_grafo = EstatisticasGrafo(self.driver)
+        self.latencias = []  # (descrição, segundos) de cada consulta mostrada
+        self._local = threading.local()
+        # CacheConsultas opcional; só é usado quando o grafo tem versão gravada
+        self.cache = cache
+        self.versao = None
+        # Agregados materializados pelo importador (None = ainda não verificado)
+        self.agregados = None
         print("✓ Conectado ao Neo4j Aura\n")
 
     def close(self):
         self.driver.close()
+        if self.cache:
+            self.cache.close()
 
-    def executar_query(self, query, descricao):
+    def ler_metadados(self):
+        """
+        Lê o nó :Metadados gravado pelo importador ao fim de cada carga: a
+        versão do grafo (chave do cache) e se os agregados estão em dia
+        """
+        with self.driver.session() as session:
+            registro = session.run("MATCH (m:Metadados {chave: 'grafo'}) "
+                                   "RETURN m.versao AS versao, coalesce(m.agregados, false) AS agregados").single()
+        self.versao = registro['versao'] if registro else None
+        self.agregados = bool(registro and registro['agregados'])
+        if self.cache and self.versao:
+            self.cache.descartar_outras_versoes(self.versao)
+        return self.versao
+
+    def _usar_agregados(self):
+        """
+        As análises 1 a 4 leem os agregados materializados (numDeputados,
+        :Regiao, :PartidoRegiao) quando o importador os manteve; com
+        --legislatura, ou sem agregados, contam pelas relações
+        """
+        if self.legislatura is not None:
+            return False
+        if self.agregados is None:
+            self.ler_metadados()
+        return self.agregados
+
+    def _com_cache(self, query, parametros, executar):
+        """
+        Resultado de `executar()` passando pelo cache. Sem cache ou sem
+        versão do grafo (banco limpo, carga por fora do importador), consulta
+        sempre. Retorna (dados, veio_do_cache).
+        """
+        if self.cache is None or self.versao is None:
+            return executar(), False
+        chave = CacheConsultas.chave(query, parametros, self.versao)
+        dados = self.cache.obter(chave)
+        if dados is not None:
+            return dados, True
+        dados = executar()
+        self.cache.guardar(chave, self.versao, dados)
+        return dados, False
+
+    def _filtro_legislatura(self, relacao, prefixo='WHERE'):
+        """Filtro pela propriedade indexada idLegislatura, se houver legislatura"""
+        if self.legislatura is None:
+            return ''
+        return f"{prefixo} {relacao}.idLegislatura = $legislatura"
+
+    def _exibir(self, saida):
+        """
+        Mostra a saída agora ou, dentro de executar_em_paralelo, guarda para
+        mostrar na ordem em que as análises foram declaradas
+        """
+        adiadas = getattr(self._local, 'saidas', None)
+        if adiadas is None:
+            saida()
+        else:
+            adiadas.append(saida)
+
+    def executar_query(self, query, descricao, parametros=None):
+        def consultar():
+            with self.driver.session() as session:
+                result = session.run(query, parametros or {})
+                return [dict(record) for record in result]
+
+        inicio = time.perf_counter()
+        dados, do_cache = self._com_cache(query, parametros, consultar)
+        latencia = time.perf_counter() - inicio
+        self._exibir(lambda: self._mostrar_resultado(descricao, dados, latencia, do_cache))
+        return dados
+
+    def _mostrar_resultado(self, descricao, dados, latencia, do_cache=False):
+        self.latencias.append((descricao + (" (cache)" if do_cache else ""), latencia))
         print(f"\n{'='*70}")
         print(f"📊 {descricao}")
         print(f"{'='*70}\n")
 
-        with self.driver.session() as session:
-            result = session.run(query)
-            dados = [dict(record) for record in result]
-
-            if dados:
-                # Mostrar primeiros resultados
-                for i, row in enumerate(dados[:15], 1):
-                    print(f"{i}. ", end="")
-                    for key, value in row.items():
-                        print(f"{key}: {value} | ", end="")
-                    print()
+        if dados:
+            # Mostrar primeiros resultados
+            for i, row in enumerate(dados[:15], 1):
+                print(f"{i}. ", end="")
+                for key, value in row.items():
+                    print(f"{key}: {value} | ", end="")
+                print()
 
-                if len(dados) > 15:
-                    print(f"\n... e mais {len(dados) - 15} resultados")
-            else:
-                print("Nenhum resultado encontrado")
+            if len(dados) > 15:
+                print(f"\n... e mais {len(dados) - 15} resultados")
+        else:
+            print("Nenhum resultado encontrado")
 
-            print(f"\n✓ Total de resultados: {len(dados)}")
-            return dados
+        origem = "cache" if do_cache else f"{latencia*1000:.0f} ms"
+        print(f"\n✓ Total de resultados: {len(dados)} ({origem})")
 
     def analise1_distribuicao_partidos(self):
-        query = """
-        MATCH (p:Partido)<-[:FILIADO_A]-(d:Deputado)
-        WITH p, count(d) AS numDeputados
+        if self._usar_agregados():
+            query = """
+            MATCH (p:Partido)
+            WHERE p.numDeputados > 0
+            RETURN p.sigla AS Partido,
+                   p.nome AS NomeCompleto,
+                   p.numDeputados AS NumeroDeputados
+            ORDER BY p.numDeputados DESC
+            LIMIT 20
+            """
+            return self.executar_query(query, "ANÁLISE 1: Distribuição de Deputados por Partido")
+
+        # Um deputado pode estar filiado ao mesmo partido em várias legislaturas
+        query = f"""
+        MATCH (p:Partido)<-[f:FILIADO_A]-(d:Deputado)
+        {self._filtro_legislatura('f')}
+        WITH p, count(DISTINCT d) AS numDeputados
         RETURN p.sigla AS Partido,
                p.nome AS NomeCompleto,
                numDeputados AS NumeroDeputados
         ORDER BY numDeputados DESC
         LIMIT 20
         """
-        return self.executar_query(query, "ANÁLISE 1: Distribuição de Deputados por Partido")
+        return self.executar_query(query, "ANÁLISE 1: Distribuição de Deputados por Partido",
+                                   {'legislatura': self.legislatura})
 
     def analise2_geografia_politica(self):
-        query = """
-        MATCH (uf:UF)<-[:REPRESENTA]-(d:Deputado)
-        WITH uf, count(d) AS numDeputados
+        if self._usar_agregados():
+            query = """
+            MATCH (uf:UF)
+            WHERE uf.numDeputados > 0
+            RETURN uf.sigla AS Estado,
+                   uf.nome AS NomeEstado,
+                   uf.regiao AS Regiao,
+                   uf.numDeputados AS NumDeputados
+            ORDER BY uf.numDeputados DESC
+            """
+            return self.executar_query(query, "ANÁLISE 2: Geografia Política - Deputados por Estado")
+
+        query = f"""
+        MATCH (uf:UF)<-[r:REPRESENTA]-(d:Deputado)
+        {self._filtro_legislatura('r')}
+        WITH uf, count(DISTINCT d) AS numDeputados
         RETURN uf.sigla AS Estado,
                uf.nome AS NomeEstado,
                uf.regiao AS Regiao,
                numDeputados AS NumDeputados
         ORDER BY numDeputados DESC
         """
-        return self.executar_query(query, "ANÁLISE 2: Geografia Política - Deputados por Estado")
+        return self.executar_query(query, "ANÁLISE 2: Geografia Política - Deputados por Estado",
+                                   {'legislatura': self.legislatura})
 
     def analise3_geografia_por_regiao(self):
-        query = """
-        MATCH (uf:UF)<-[:REPRESENTA]-(d:Deputado)
-        WITH uf.regiao AS Regiao, count(d) AS numDeputados
+        if self._usar_agregados():
+            query = """
+            MATCH (r:Regiao)
+            WHERE r.numDeputados > 0
+            RETURN r.nome AS Regiao,
+                   r.numDeputados AS TotalDeputados
+            ORDER BY r.numDeputados DESC
+            """
+            return self.executar_query(query, "ANÁLISE 3: Deputados por Região")
+
+        query = f"""
+        MATCH (uf:UF)<-[r:REPRESENTA]-(d:Deputado)
+        {self._filtro_legislatura('r')}
+        WITH uf.regiao AS Regiao, count(DISTINCT d) AS numDeputados
         RETURN Regiao,
                numDeputados AS TotalDeputados
         ORDER BY numDeputados DESC
         """
-        return self.executar_query(query, "ANÁLISE 3: Deputados por Região")
+        return self.executar_query(query, "ANÁLISE 3: Deputados por Região",
+                                   {'legislatura': self.legislatura})
 
     def analise4_partidos_por_regiao(self):
-        query = """
-        MATCH (d:Deputado)-[:FILIADO_A]->(p:Partido)
-        MATCH (d)-[:REPRESENTA]->(uf:UF)
-        WITH uf.regiao AS Regiao, p.sigla AS Partido, count(d) AS numDeputados
+        if self._usar_agregados():
+            query = """
+            MATCH (pr:PartidoRegiao)
+            WHERE pr.numDeputados > 5
+            RETURN pr.regiao AS Regiao, pr.siglaPartido AS Partido, pr.numDeputados AS NumDeputados
+            ORDER BY Regiao, NumDeputados DESC
+            """
+            return self.executar_query(query, "ANÁLISE 4: Partidos com mais Deputados por Região")
+
+        # Partido e UF da mesma legislatura, para não cruzar mandatos diferentes
+        query = f"""
+        MATCH (d:Deputado)-[f:FILIADO_A]->(p:Partido)
+        MATCH (d)-[r:REPRESENTA]->(uf:UF)
+        WHERE r.idLegislatura = f.idLegislatura {self._filtro_legislatura('f', 'AND')}
+        WITH uf.regiao AS Regiao, p.sigla AS Partido, count(DISTINCT d) AS numDeputados
         WHERE numDeputados > 5
         RETURN Regiao, Partido, numDeputados AS NumDeputados
         ORDER BY Regiao, numDeputados DESC
         """
-        return self.executar_query(query, "ANÁLISE 4: Partidos com mais Deputados por Região")
+        return self.executar_query(query, "ANÁLISE 4: Partidos com mais Deputados por Região",
+                                   {'legislatura': self.legislatura})
 
-    def analise5_frentes_tematicas(self):
-        query = """
-        MATCH (f:Frente)
-        WHERE f.titulo CONTAINS 'Defesa' OR f.titulo CONTAINS 'Apoio'
-        RETURN f.titulo AS Frente,
-               f.idLegislatura AS Legislatura
-        ORDER BY f.titulo
-        LIMIT 30
+    def busca_tematica(self, termos, rotulo='Frente', limite=30, descricao=None):
+        """
+        Busca `termos` no índice de texto completo do rótulo (Frente.titulo
+        ou Proposicao.ementa, ver INDICES_TEXTO) e retorna os nós por ordem
+        de relevância, com a coluna Relevancia. Vale a sintaxe do Lucene:
+        'defesa apoio' acha qualquer um dos termos, 'saúde AND indígena'
+        exige os dois e "entre aspas" busca a frase.
+        """
+        nome, _, propriedades = next(indice for indice in INDICES_TEXTO if indice[1] == rotulo)
+        descricao = descricao or f"BUSCA TEMÁTICA em {rotulo}: {termos}"
+        query = f"""
+        CALL db.index.fulltext.queryNodes($indice, $termos, {{limit: $limite}})
+        YIELD node AS n, score
+        RETURN {COLUNAS_BUSCA[rotulo]},
+               round(score, 3) AS Relevancia
+        ORDER BY Relevancia DESC
         """
-        return self.executar_query(query, "ANÁLISE 5: Frentes Temáticas (Defesa e Apoio)")
+        try:
+            return self.executar_query(query, descricao, {'indice': nome, 'termos': termos, 'limite': limite})
+        except ClientError as e:
+            if 'no such fulltext' not in str(e).lower():
+                raise
+
+        # Grafo carregado sem os índices (ex.: neo4j-admin import): varre o
+        # rótulo, sensível a acentos e sem relevância
+        self._exibir(lambda: print(f"\n⚠ Índice {nome} não existe; rode python importar_aura.py --agregados"))
+        query = f"""
+        MATCH (n:{rotulo})
+        WHERE any(termo IN $palavras WHERE toLower(n.{propriedades[0]}) CONTAINS termo)
+        RETURN {COLUNAS_BUSCA[rotulo]},
+               null AS Relevancia
+        ORDER BY n.{propriedades[0]}
+        LIMIT $limite
+        """
+        return self.executar_query(query, descricao, {'palavras': termos.lower().split(), 'limite': limite})
+
+    def analise5_frentes_tematicas(self):
+        # Índice de texto completo: sem varrer as frentes, e sem depender de
+        # maiúsculas ou acentos
+        return self.busca_tematica('defesa apoio', 'Frente', 30,
+                                   "ANÁLISE 5: Frentes Temáticas (Defesa e Apoio)")
 
     def estatisticas_gerais(self):
-        print(f"\n{'='*70}")
-        print(f"📈 ESTATÍSTICAS GERAIS DO GRAFO")
-        print(f"{'='*70}\n")
+        # Contagens e graus numa consulta só (ver estatisticas_grafo.py)
+        inicio = time.perf_counter()
+        estatisticas, do_cache = self._com_cache('estatisticas_grafo', {}, self.estatisticas_grafo.coletar)
+        latencia = time.perf_counter() - inicio
 
-        with self.driver.session() as session:
-            # Contar nós
-            result = session.run("MATCH (d:Deputado) RETURN count(d) as count")
-            print(f"• Deputados: {result.single()['count']:,}")
+        def mostrar():
+            self.latencias.append(("ESTATÍSTICAS GERAIS DO GRAFO" + (" (cache)" if do_cache else ""),
+                                   latencia))
+            print(f"\n{'='*70}")
+            print(f"📈 ESTATÍSTICAS GERAIS DO GRAFO")
+            print(f"{'='*70}\n")
+            for rotulo, total in estatisticas['nos'].items():
+                print(f"• {rotulo}: {total:,}")
+            print()
+            for tipo, total in estatisticas['relacionamentos'].items():
+                print(f"• Relacionamentos {tipo}: {total:,}")
+            graus = [(nome, descrever_grau(grau)) for nome, grau in estatisticas['graus'].items()]
+            graus = [(nome, texto) for nome, texto in graus if texto]
+            if graus:
+                print()
+            for nome, texto in graus:
+                print(f"• {nome}: {texto}")
+            origem = "cache" if do_cache else f"{latencia*1000:.0f} ms"
+            print(f"\n✓ Via {estatisticas['fonte']} ({origem})")
 
-            result = session.run("MATCH (p:Partido) RETURN count(p) as count")
-            print(f"• Partidos: {result.single()['count']:,}")
+        self._exibir(mostrar)
+        return estatisticas
 
-            result = session.run("MATCH (f:Frente) RETURN count(f) as count")
-            print(f"• Frentes: {result.single()['count']:,}")
+    def analises(self):
+        """Estatísticas e análises na ordem em que o relatório é apresentado"""
+        return [
+            self.estatisticas_gerais,
+            self.analise1_distribuicao_partidos,
+            self.analise2_geografia_politica,
+            self.analise3_geografia_por_regiao,
+            self.analise4_partidos_por_regiao,
+            self.analise5_frentes_tematicas,
+        ]
 
-            result = session.run("MATCH (uf:UF) RETURN count(uf) as count")
-            print(f"• UFs: {result.single()['count']:,}")
+    def executar_em_paralelo(self, paralelismo=4):
+        """
+        Dispara todas as análises ao mesmo tempo, até `paralelismo` de cada
+        vez, cada uma com sua sessão sobre o driver compartilhado. As saídas
+        são mostradas na ordem declarada em analises(), então o relatório é
+        o mesmo da execução sequencial, mas leva o tempo da consulta mais
+        lenta em vez da soma de todas. Retorna os resultados na mesma ordem.
+        """
+        def executar(analise):
+            self._local.saidas = []
+            try:
+                return analise(), self._local.saidas
+            finally:
+                self._local.saidas = None
 
-            # Contar relacionamentos
-            result = session.run("MATCH ()-[r:FILIADO_A]->() RETURN count(r) as count")
-            print(f"\n• Relacionamentos FILIADO_A: {result.single()['count']:,}")
+        self.latencias = []
+        inicio = time.perf_counter()
+        self.ler_metadados()
+        with ThreadPoolExecutor(max_workers=max(1, paralelismo)) as executor:
+            futuros = [executor.submit(executar, analise) for analise in self.analises()]
+            resultados = []
+            for futuro in futuros:
+                resultado, saidas = futuro.result()
+                for saida in saidas:
+                    saida()
+                resultados.append(resultado)
+        total = time.perf_counter() - inicio
 
-            result = session.run("MATCH ()-[r:REPRESENTA]->() RETURN count(r) as count")
-            print(f"• Relacionamentos REPRESENTA: {result.single()['count']:,}")
+        print(f"\n{'='*70}")
+        print(f"⏱  LATÊNCIA POR CONSULTA (paralelismo {paralelismo})")
+        print(f"{'='*70}\n")
+        for descricao, latencia in self.latencias:
+            print(f"• {descricao}: {latencia*1000:,.0f} ms")
+        soma = sum(latencia for _, latencia in self.latencias)
+        print(f"\n✓ Relatório em {total*1000:,.0f} ms (soma das consultas: {soma*1000:,.0f} ms)")
+        if self.cache:
+            situacao = f"versão {self.versao[:8]}" if self.versao else "grafo sem versão, cache ignorado"
+            print(f"✓ Cache: {self.cache.acertos} acertos, {self.cache.faltas} faltas ({situacao})")
+        return resultados
 
 if __name__ == "__main__":
-    analisador = AnalisadorDados()
+    parser = argparse.ArgumentParser(description='Executa as análises sobre o grafo no Neo4j Aura')
+    parser.add_argument('--legislatura', type=int, default=None,
+                        help='Restringe as análises 1 a 4 a uma legislatura (ex.: 57)')
+    parser.add_argument('--paralelismo', type=int, default=4,
+                        help='Consultas executadas ao mesmo tempo (1 = uma de cada vez)')
+    parser.add_argument('--sem-cache', action='store_true',
+                        help='Consulta o Aura mesmo que o grafo não tenha mudado desde a última execução')
+    parser.add_argument('--cache-dir', default=DIR_CACHE,
+                        help='Onde guardar o cache em disco ("" = só em memória)')
+    parser.add_argument('--cache-ttl', type=float, default=24,
+                        help='Validade dos resultados em cache (horas)')
+    parser.add_argument('--buscar', default=None,
+                        help='Só faz uma busca temática pelos termos (ex.: "meio ambiente")')
+    parser.add_argument('--em', choices=sorted(COLUNAS_BUSCA), default='Frente',
+                        help='Com --buscar, onde buscar: títulos das frentes ou ementas das proposições')
+    parser.add_argument('--limite', type=int, default=30,
+                        help='Com --buscar, número máximo de resultados')
+    args = parser.parse_args()
+
+    cache = None if args.sem_cache else CacheConsultas(args.cache_dir or None, ttl=args.cache_ttl * 3600)
+    analisador = AnalisadorDados(legislatura=args.legislatura, cache=cache)
 
     try:
-        # Estatísticas gerais
-        analisador.estatisticas_gerais()
-
-        # 5 Análises
-        analisador.analise1_distribuicao_partidos()
-        analisador.analise2_geografia_politica()
-        analisador.analise3_geografia_por_regiao()
-        analisador.analise4_partidos_por_regiao()
-        analisador.analise5_frentes_tematicas()
+        if args.buscar:
+            analisador.ler_metadados()
+            analisador.busca_tematica(args.buscar, args.em, args.limite)
+        else:
+            # Estatísticas gerais e as 5 análises, disparadas em paralelo
+            analisador.executar_em_paralelo(args.paralelismo)
 
         print(f"\n{'='*70}")
         print("✅ ANÁLISES CONCLUÍDAS!")
@@ -0,0 +1,313 @@
+"""
+Exporta os dados coletados para CSVs do neo4j-admin import
+Gera arquivos de nós e relacionamentos (com cabeçalhos do neo4j-admin)
+a partir de dados_camara/, lendo tudo em streaming. As pontas dos
+relacionamentos são resolvidas aqui em Python, então a carga inicial de um
+banco vazio é feita pelo `neo4j-admin database import full` em segundos.
+"""
+
+import argparse
+import csv
+import os
+import time
+import uuid
+
+from arquivos_registros import iterar_registros, localizar_arquivo
+from importar_aura import (UFS, TIPOS_VOTO, agrupar_deputados, aprovacao_votacao, codigo_voto,
+                          id_deputado_autor, resolver_partido)
+
+
+class ExportadorAdminImport:
+    """Converte os arquivos do coletor em CSVs de nós e relacionamentos"""
+
+    def __init__(self, dados_dir='dados_camara', saida_dir='import_neo4j'):
+        self.dados_dir = dados_dir
+        self.saida_dir = saida_dir
+        self.nos = {}             # Rótulo -> caminho do CSV
+        self.relacionamentos = {}  # Tipo -> caminho do CSV
+        self.totais = {}
+        self.descartados = {}
+
+        # Só as chaves ficam em memória, para resolver as pontas dos relacionamentos
+        self.ids_partidos = set()
+        self.ids_deputados = set()
+        self.ids_frentes = set()
+        self.ids_proposicoes = set()
+        self.ids_votacoes = set()
+        self.partido_por_sigla = {}
+        self.siglas_ufs = {uf['sigla'] for uf in UFS}
+
+        os.makedirs(saida_dir, exist_ok=True)
+
+    def _registros(self, nome_arquivo):
+        """Itera os registros do arquivo (qualquer formato gerado pelo coletor)"""
+        caminho = localizar_arquivo(os.path.join(self.dados_dir, nome_arquivo))
+        if caminho is None:
+            print(f"  ⚠ Arquivo não encontrado: {nome_arquivo}")
+            return
+        yield from iterar_registros(caminho)
+
+    def _abrir(self, nome_arquivo, cabecalho):
+        """Abre um CSV de saída já com a linha de cabeçalho do neo4j-admin"""
+        arquivo = open(os.path.join(self.saida_dir, nome_arquivo), 'w', newline='', encoding='utf-8')
+        escritor = csv.writer(arquivo)
+        escritor.writerow(cabecalho)
+        return arquivo, escritor
+
+    def _concluir(self, grupo, nome, arquivo, total, descartados=0):
+        arquivo.close()
+        grupo[nome] = arquivo.name
+        self.totais[nome] = total
+        if descartados:
+            self.descartados[nome] = descartados
+        extra = f" ({descartados} sem ponta conhecida)" if descartados else ""
+        print(f"  ✓ {nome}: {total:,} linhas → {arquivo.name}{extra}")
+
+    def exportar_ufs(self):
+        arquivo, escritor = self._abrir('ufs.csv', ['sigla:ID(UF)', 'nome', 'regiao'])
+        for uf in UFS:
+            escritor.writerow([uf['sigla'], uf['nome'], uf['regiao']])
+        self._concluir(self.nos, 'UF', arquivo, len(UFS))
+
+    # A coluna :ID sem nome só serve para resolver as pontas (o neo4j-admin a
+    # trata como texto); o id vira uma propriedade inteira à parte, como na
+    # importação pelo Bolt, que faz MATCH por {id: <inteiro>}. Votacao tem ids
+    # textuais ('2300000-5') e continua com a coluna nomeada
+    def exportar_partidos(self):
+        arquivo, escritor = self._abrir('partidos.csv', [':ID(Partido)', 'id:int', 'sigla', 'nome', 'uri'])
+        for partido in self._registros('partidos.json'):
+            if partido['id'] in self.ids_partidos:
+                continue
+            self.ids_partidos.add(partido['id'])
+            self.partido_por_sigla[partido['sigla']] = partido['id']
+            escritor.writerow([partido['id'], partido['id'], partido['sigla'], partido['nome'], partido.get('uri', '')])
+        self._concluir(self.nos, 'Partido', arquivo, len(self.ids_partidos))
+
+    def exportar_deputados(self):
+        """Nós Deputado (um por id) e as relações FILIADO_A e REPRESENTA por legislatura"""
+        nos, escritor_nos = self._abrir(
+            'deputados.csv', [':ID(Deputado)', 'id:int', 'nome', 'siglaPartido', 'siglaUf', 'urlFoto', 'email',
+                              'legislaturas:int[]', 'ultimaLegislatura:int'])
+        filiados, escritor_filiados = self._abrir('filiado_a.csv', [':START_ID(Deputado)', ':END_ID(Partido)',
+                                                                    'idLegislatura:int'])
+        representa, escritor_representa = self._abrir('representa.csv', [':START_ID(Deputado)', ':END_ID(UF)',
+                                                                          'idLegislatura:int'])
+        pares_partido, pares_uf = set(), set()
+        descartados_partido = descartados_uf = 0
+
+        for dep in self._registros('deputados.json'):
+            legislatura = dep.get('idLegislatura') or 0
+            if dep.get('siglaPartido') or dep.get('uriPartido'):
+                id_partido = resolver_partido(dep, self.partido_por_sigla, self.ids_partidos)
+                if id_partido is None:
+                    descartados_partido += 1
+                elif (dep['id'], id_partido, legislatura) not in pares_partido:
+                    pares_partido.add((dep['id'], id_partido, legislatura))
+                    escritor_filiados.writerow([dep['id'], id_partido, legislatura])
+
+            uf = dep.get('siglaUf')
+            if uf:
+                if uf not in self.siglas_ufs:
+                    descartados_uf += 1
+                elif (dep['id'], uf, legislatura) not in pares_uf:
+                    pares_uf.add((dep['id'], uf, legislatura))
+                    escritor_representa.writerow([dep['id'], uf, legislatura])
+
+        # O mesmo deputado aparece uma vez por legislatura; o import exige ids únicos
+        for dep in agrupar_deputados(self._registros('deputados.json')).values():
+            self.ids_deputados.add(dep['id'])
+            escritor_nos.writerow([dep['id'], dep['id'], dep.get('nome', ''), dep.get('siglaPartido', ''),
+                                   dep.get('siglaUf', ''), dep.get('urlFoto', ''), dep.get('email') or '',
+                                   ';'.join(str(leg) for leg in dep['legislaturas']),
+                                   dep.get('idLegislatura') or ''])
+
+        self._concluir(self.nos, 'Deputado', nos, len(self.ids_deputados))
+        self._concluir(self.relacionamentos, 'FILIADO_A', filiados, len(pares_partido), descartados_partido)
+        self._concluir(self.relacionamentos, 'REPRESENTA', representa, len(pares_uf), descartados_uf)
+
+    def exportar_frentes(self):
+        arquivo, escritor = self._abrir('frentes.csv', [':ID(Frente)', 'id:int', 'titulo', 'idLegislatura:int', 'uri'])
+        for frente in self._registros('frentes.json'):
+            if frente['id'] in self.ids_frentes:
+                continue
+            self.ids_frentes.add(frente['id'])
+            escritor.writerow([frente['id'], frente['id'], frente.get('titulo', ''),
+                               frente.get('idLegislatura', 0), frente.get('uri', '')])
+        self._concluir(self.nos, 'Frente', arquivo, len(self.ids_frentes))
+
+    def exportar_membros_frentes(self):
+        arquivo, escritor = self._abrir('membro_de.csv',
+                                        [':START_ID(Deputado)', ':END_ID(Frente)', 'titulo'])
+        total = descartados = 0
+        for membro in self._registros('membros_frentes.json'):
+            # Mesmo critério do MATCH do importador: sem as duas pontas, sem relação
+            if membro['idDeputado'] not in self.ids_deputados or membro['idFrente'] not in self.ids_frentes:
+                descartados += 1
+                continue
+            escritor.writerow([membro['idDeputado'], membro['idFrente'], membro.get('titulo', 'Membro')])
+            total += 1
+        self._concluir(self.relacionamentos, 'MEMBRO_DE', arquivo, total, descartados)
+
+    def exportar_proposicoes(self):
+        """Nós Proposicao e relações AUTOR_DE (só autores que são deputados)"""
+        if (localizar_arquivo(os.path.join(self.dados_dir, 'proposicoes.json')) is None and
+                localizar_arquivo(os.path.join(self.dados_dir, 'autores_proposicoes.json')) is None):
+            print("  → proposicoes.json ausente; proposições não exportadas")
+            return
+
+        nos, escritor_nos = self._abrir('proposicoes.csv', [':ID(Proposicao)', 'id:int', 'siglaTipo',
+                                                            'numero:int', 'ano:int', 'ementa'])
+        for prop in self._registros('proposicoes.json'):
+            if prop['id'] in self.ids_proposicoes:
+                continue
+            self.ids_proposicoes.add(prop['id'])
+            escritor_nos.writerow([prop['id'], prop['id'], prop.get('siglaTipo', ''), prop.get('numero') or '',
+                                   prop.get('ano') or '', prop.get('ementa', '')])
+
+        autorias, escritor_autorias = self._abrir('autor_de.csv', [':START_ID(Deputado)', ':END_ID(Proposicao)'])
+        pares = set()
+        descartados = 0
+        for autor in self._registros('autores_proposicoes.json'):
+            id_deputado = id_deputado_autor(autor)
+            if id_deputado is None:
+                continue  # Órgãos, Senado etc. não têm nó no grafo
+            if id_deputado not in self.ids_deputados:
+                descartados += 1
+                continue
+            id_proposicao = autor['idProposicao']
+            if id_proposicao not in self.ids_proposicoes:
+                # Autorias dos arquivos anuais cobrem proposições fora de proposicoes.json
+                self.ids_proposicoes.add(id_proposicao)
+                escritor_nos.writerow([id_proposicao, id_proposicao, autor.get('tipoProposicao') or '', '', '', ''])
+            if (id_deputado, id_proposicao) not in pares:
+                pares.add((id_deputado, id_proposicao))
+                escritor_autorias.writerow([id_deputado, id_proposicao])
+
+        self._concluir(self.nos, 'Proposicao', nos, len(self.ids_proposicoes))
+        self._concluir(self.relacionamentos, 'AUTOR_DE', autorias, len(pares), descartados)
+
+    def exportar_votos(self):
+        """Nós Votacao e TipoVoto e relações VOTOU {voto}, quando votos.json existir"""
+        if localizar_arquivo(os.path.join(self.dados_dir, 'votos.json')) is None:
+            print("  → votos.json ausente; votações não exportadas")
+            return
+
+        nos, escritor_nos = self._abrir('votacoes.csv', ['id:ID(Votacao)', 'data', 'siglaOrgao',
+                                                         'descricao', 'aprovacao:boolean'])
+        for votacao in self._registros('votacoes.json'):
+            if votacao['id'] in self.ids_votacoes:
+                continue
+            self.ids_votacoes.add(votacao['id'])
+            aprovacao = aprovacao_votacao(votacao)
+            escritor_nos.writerow([votacao['id'], votacao.get('data', ''), votacao.get('siglaOrgao', ''),
+                                   votacao.get('descricao', ''),
+                                   '' if aprovacao is None else str(aprovacao).lower()])
+
+        tipos, escritor_tipos = self._abrir('tipos_voto.csv', [':ID(TipoVoto)', 'codigo:int', 'descricao'])
+        for descricao, codigo in TIPOS_VOTO.items():
+            escritor_tipos.writerow([codigo, codigo, descricao])
+        self._concluir(self.nos, 'TipoVoto', tipos, len(TIPOS_VOTO))
+
+        # O voto vai como código (ver TIPOS_VOTO), como na importação pelo Bolt
+        votos, escritor_votos = self._abrir('votou.csv', [':START_ID(Deputado)', ':END_ID(Votacao)',
+                                                          'voto:int', 'descricaoVoto'])
+        total = descartados = 0
+        for voto in self._registros('votos.json'):
+            if voto.get('idDeputado') not in self.ids_deputados:
+                descartados += 1
+                continue
+            if voto['idVotacao'] not in self.ids_votacoes:
+                # Votos lidos dos arquivos anuais cobrem votações fora de votacoes.json
+                self.ids_votacoes.add(voto['idVotacao'])
+                escritor_nos.writerow([voto['idVotacao'], voto.get('dataVotacao') or '', '', '', ''])
+            codigo, outro = codigo_voto(voto.get('voto'))
+            escritor_votos.writerow([voto['idDeputado'], voto['idVotacao'], codigo, outro or ''])
+            total += 1
+
+        self._concluir(self.nos, 'Votacao', nos, len(self.ids_votacoes))
+        self._concluir(self.relacionamentos, 'VOTOU', votos, total, descartados)
+
+    def exportar_metadados(self):
+        """Nó :Metadados com a versão do grafo (a mesma que o importador grava)"""
+        # Sem agregados: depois do import, rode `python importar_aura.py --agregados`
+        arquivo, escritor = self._abrir('metadados.csv', ['chave:ID(Metadados)', 'versao', 'atualizadoEm:datetime',
+                                                          'agregados:boolean'])
+        escritor.writerow(['grafo', uuid.uuid4().hex, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()), 'false'])
+        self._concluir(self.nos, 'Metadados', arquivo, 1)
+
+    def ler_nos(self, rotulo):
+        """Itera as linhas do CSV de um rótulo com os tipos que o neo4j-admin dá às propriedades"""
+        conversores = {'int': int, 'long': int, 'float': float, 'double': float,
+                       'boolean': lambda valor: valor.lower() == 'true'}
+        with open(self.nos[rotulo], newline='', encoding='utf-8') as arquivo:
+            leitor = csv.reader(arquivo)
+            colunas = []
+            for posicao, campo in enumerate(next(leitor)):
+                nome, _, tipo = campo.partition(':')
+                if nome:  # :ID sem nome não vira propriedade
+                    colunas.append((posicao, nome, '' if tipo.startswith('ID') else tipo))
+            for linha in leitor:
+                no = {}
+                for posicao, nome, tipo in colunas:
+                    valor = linha[posicao]
+                    if valor == '':
+                        continue
+                    if tipo.endswith('[]'):
+                        converter = conversores.get(tipo[:-2], str)
+                        no[nome] = [converter(item) for item in valor.split(';')]
+                    else:
+                        no[nome] = conversores.get(tipo, str)(valor)
+                yield no
+
+    def verificar_ids(self):
+        """Confere que os ids inteiros voltam como int, como o MATCH do importador espera"""
+        for rotulo in ('Partido', 'Deputado', 'Frente', 'Proposicao'):
+            if rotulo not in self.nos:
+                continue
+            no = next(self.ler_nos(rotulo), None)
+            if no is not None and not isinstance(no.get('id'), int):
+                raise ValueError(f"{rotulo}.id seria importado como {type(no.get('id')).__name__}, não int")
+        print("  ✓ ids de Partido, Deputado, Frente e Proposicao lidos de volta como inteiros")
+
+    def comando_import(self, banco='neo4j'):
+        """Linha de comando do neo4j-admin para carregar os CSVs gerados"""
+        partes = ['neo4j-admin database import full', '--overwrite-destination']
+        partes += [f"--nodes={rotulo}={caminho}" for rotulo, caminho in self.nos.items()]
+        partes += [f"--relationships={tipo}={caminho}" for tipo, caminho in self.relacionamentos.items()]
+        partes.append(banco)
+        return ' \\\n    '.join(partes)
+
+    def exportar_tudo(self, banco='neo4j'):
+        print("="*70)
+        print("📦 EXPORTAÇÃO PARA NEO4J-ADMIN IMPORT")
+        print("="*70)
+        inicio = time.perf_counter()
+
+        # Partidos e frentes antes dos relacionamentos que apontam para eles
+        self.exportar_ufs()
+        self.exportar_partidos()
+        self.exportar_deputados()
+        self.exportar_frentes()
+        self.exportar_membros_frentes()
+        self.exportar_proposicoes()
+        self.exportar_votos()
+        self.exportar_metadados()
+        self.verificar_ids()
+
+        print(f"\n✅ Exportação concluída em {time.perf_counter() - inicio:.1f}s")
+        print("\n💡 Com o banco parado, carregue os arquivos com:\n")
+        print(self.comando_import(banco))
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Gera CSVs para o neo4j-admin database import')
+    parser.add_argument('--dados', default='dados_camara',
+                        help='Diretório com os arquivos do coletor')
+    parser.add_argument('--saida', default='import_neo4j',
+                        help='Diretório onde os CSVs serão gravados')
+    parser.add_argument('--banco', default='neo4j',
+                        help='Nome do banco de destino no comando sugerido')
+    args = parser.parse_args()
+
+    ExportadorAdminImport(args.dados, args.saida).exportar_tudo(args.banco)
@@ -3,21 +3,485 @@ Script de Importação para Neo4j Aura
 Importa dados coletados da Câmara dos Deputados
 """
 
+import asyncio
+import hashlib
 import json
 import os
-from neo4j import GraphDatabase
+import queue
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from neo4j import AsyncGraphDatabase, GraphDatabase
+
+from arquivos_registros import iterar_registros, localizar_arquivo
+from estatisticas_grafo import EstatisticasGrafo, descrever_grau
+
+UFS = [
+    {'sigla': "AC", 'nome': "Acre", 'regiao': "Norte"},
+    {'sigla': "AL", 'nome': "Alagoas", 'regiao': "Nordeste"},
+    {'sigla': "AP", 'nome': "Amapá", 'regiao': "Norte"},
+    {'sigla': "AM", 'nome': "Amazonas", 'regiao': "Norte"},
+    {'sigla': "BA", 'nome': "Bahia", 'regiao': "Nordeste"},
+    {'sigla': "CE", 'nome': "Ceará", 'regiao': "Nordeste"},
+    {'sigla': "DF", 'nome': "Distrito Federal", 'regiao': "Centro-Oeste"},
+    {'sigla': "ES", 'nome': "Espírito Santo", 'regiao': "Sudeste"},
+    {'sigla': "GO", 'nome': "Goiás", 'regiao': "Centro-Oeste"},
+    {'sigla': "MA", 'nome': "Maranhão", 'regiao': "Nordeste"},
+    {'sigla': "MT", 'nome': "Mato Grosso", 'regiao': "Centro-Oeste"},
+    {'sigla': "MS", 'nome': "Mato Grosso do Sul", 'regiao': "Centro-Oeste"},
+    {'sigla': "MG", 'nome': "Minas Gerais", 'regiao': "Sudeste"},
+    {'sigla': "PA", 'nome': "Pará", 'regiao': "Norte"},
+    {'sigla': "PB", 'nome': "Paraíba", 'regiao': "Nordeste"},
+    {'sigla': "PR", 'nome': "Paraná", 'regiao': "Sul"},
+    {'sigla': "PE", 'nome': "Pernambuco", 'regiao': "Nordeste"},
+    {'sigla': "PI", 'nome': "Piauí", 'regiao': "Nordeste"},
+    {'sigla': "RJ", 'nome': "Rio de Janeiro", 'regiao': "Sudeste"},
+    {'sigla': "RN", 'nome': "Rio Grande do Norte", 'regiao': "Nordeste"},
+    {'sigla': "RS", 'nome': "Rio Grande do Sul", 'regiao': "Sul"},
+    {'sigla': "RO", 'nome': "Rondônia", 'regiao': "Norte"},
+    {'sigla': "RR", 'nome': "Roraima", 'regiao': "Norte"},
+    {'sigla': "SC", 'nome': "Santa Catarina", 'regiao': "Sul"},
+    {'sigla': "SP", 'nome': "São Paulo", 'regiao': "Sudeste"},
+    {'sigla': "SE", 'nome': "Sergipe", 'regiao': "Nordeste"},
+    {'sigla': "TO", 'nome': "Tocantins", 'regiao': "Norte"},
+]
+
+# Escritas por lote (UNWIND $rows AS row), compartilhadas pela importação
+# completa e pela incremental
+QUERY_UFS = """
+UNWIND $rows AS row
+MERGE (uf:UF {sigla: row.sigla})
+SET uf.nome = row.nome,
+    uf.regiao = row.regiao
+"""
+
+QUERY_PARTIDOS = """
+UNWIND $rows AS row
+MERGE (p:Partido {id: row.id})
+SET p.sigla = row.sigla,
+    p.nome = row.nome,
+    p.uri = row.uri
+"""
+
+# Um nó por deputado; partido e UF do nó são os da legislatura mais recente
+QUERY_DEPUTADOS = """
+UNWIND $rows AS row
+MERGE (d:Deputado {id: row.id})
+SET d.nome = row.nome,
+    d.siglaPartido = row.siglaPartido,
+    d.siglaUf = row.siglaUf,
+    d.urlFoto = row.urlFoto,
+    d.email = row.email,
+    d.legislaturas = row.legislaturas,
+    d.ultimaLegislatura = row.ultimaLegislatura
+"""
+
+# As pontas já chegam resolvidas para ids únicos (ver resolver_partido)
+QUERY_FILIADO_A = """
+UNWIND $rows AS row
+MATCH (d:Deputado {id: row.id})
+MATCH (p:Partido {id: row.idPartido})
+MERGE (d)-[:FILIADO_A {idLegislatura: row.idLegislatura}]->(p)
+"""
+
+QUERY_REPRESENTA = """
+UNWIND $rows AS row
+MATCH (d:Deputado {id: row.id})
+MATCH (uf:UF {sigla: row.sigla})
+MERGE (d)-[:REPRESENTA {idLegislatura: row.idLegislatura}]->(uf)
+"""
+
+# Agregados materializados das análises 1 a 4, recalculados só para as
+# chaves cujas filiações/representações mudaram (deputados distintos, como
+# nas análises; partido x região cruza FILIADO_A e REPRESENTA da mesma legislatura)
+QUERY_AGREGADOS_PARTIDOS = """
+UNWIND $rows AS row
+OPTIONAL MATCH (antigo:PartidoRegiao {idPartido: row.id})
+DETACH DELETE antigo
+WITH DISTINCT row
+MATCH (p:Partido {id: row.id})
+CALL {
+    WITH p
+    MATCH (p)<-[:FILIADO_A]-(d:Deputado)
+    RETURN count(DISTINCT d) AS total
+}
+SET p.numDeputados = total
+WITH p
+CALL {
+    WITH p
+    MATCH (p)<-[f:FILIADO_A]-(d:Deputado)-[r:REPRESENTA]->(uf:UF)
+    WHERE r.idLegislatura = f.idLegislatura
+    WITH p, uf.regiao AS regiao, count(DISTINCT d) AS numDeputados
+    MERGE (pr:PartidoRegiao {chave: toString(p.id) + '|' + regiao})
+    SET pr.idPartido = p.id,
+        pr.siglaPartido = p.sigla,
+        pr.regiao = regiao,
+        pr.numDeputados = numDeputados
+}
+"""
+
+QUERY_AGREGADOS_UFS = """
+UNWIND $rows AS row
+MATCH (uf:UF {sigla: row.sigla})
+CALL {
+    WITH uf
+    MATCH (uf)<-[:REPRESENTA]-(d:Deputado)
+    RETURN count(DISTINCT d) AS total
+}
+SET uf.numDeputados = total
+"""
+
+QUERY_AGREGADOS_REGIOES = """
+UNWIND $rows AS row
+MERGE (r:Regiao {nome: row.nome})
+WITH r
+CALL {
+    WITH r
+    MATCH (uf:UF {regiao: r.nome})
+    OPTIONAL MATCH (uf)<-[:REPRESENTA]-(d:Deputado)
+    RETURN count(DISTINCT d) AS total, count(DISTINCT uf) AS ufs
+}
+SET r.numDeputados = total,
+    r.numUFs = ufs
+"""
+
+QUERY_FRENTES = """
+UNWIND $rows AS row
+MERGE (f:Frente {id: row.id})
+SET f.titulo = row.titulo,
+    f.idLegislatura = row.idLegislatura,
+    f.uri = row.uri
+"""
+
+QUERY_MEMBROS_FRENTES = """
+UNWIND $rows AS row
+MATCH (d:Deputado {id: row.idDeputado})
+MATCH (f:Frente {id: row.idFrente})
+MERGE (d)-[r:MEMBRO_DE]->(f)
+SET r.titulo = row.titulo
+"""
+
+QUERY_PROPOSICOES = """
+UNWIND $rows AS row
+MERGE (p:Proposicao {id: row.id})
+SET p.siglaTipo = row.siglaTipo,
+    p.numero = row.numero,
+    p.ano = row.ano,
+    p.ementa = row.ementa
+"""
+
+QUERY_VOTACOES = """
+UNWIND $rows AS row
+MERGE (v:Votacao {id: row.id})
+SET v.data = row.data,
+    v.siglaOrgao = row.siglaOrgao,
+    v.descricao = row.descricao,
+    v.aprovacao = row.aprovacao
+"""
+
+QUERY_TIPOS_VOTO = """
+UNWIND $rows AS row
+MERGE (t:TipoVoto {codigo: row.codigo})
+SET t.descricao = row.descricao
+"""
+
+# Proposições/votações que só aparecem nos autores/votos (ex.: arquivos anuais)
+# são criadas com o mínimo de propriedades
+QUERY_AUTORES = """
+UNWIND $rows AS row
+MATCH (d:Deputado {id: row.idDeputado})
+MERGE (p:Proposicao {id: row.idProposicao})
+  ON CREATE SET p.siglaTipo = row.siglaTipo
+MERGE (d)-[:AUTOR_DE]->(p)
+"""
+
+QUERY_VOTOS = """
+UNWIND $rows AS row
+MATCH (d:Deputado {id: row.idDeputado})
+MERGE (v:Votacao {id: row.idVotacao})
+  ON CREATE SET v.data = row.data
+MERGE (d)-[r:VOTOU]->(v)
+SET r.voto = row.voto,
+    r.descricaoVoto = row.outro
+"""
+
+# O voto fica na relação como um código pequeno; a descrição está nos nós
+# TipoVoto. Votos fora da lista recebem 0 e guardam o texto em descricaoVoto
+TIPOS_VOTO = {
+    'Outro': 0,
+    'Sim': 1,
+    'Não': 2,
+    'Abstenção': 3,
+    'Obstrução': 4,
+    'Artigo 17': 5,
+}
+
+
+def codigo_voto(texto):
+    """Retorna (código, texto original se não for um tipo conhecido)"""
+    codigo = TIPOS_VOTO.get((texto or '').strip())
+    if codigo is None:
+        return 0, texto
+    return codigo, None
+
+
+def aprovacao_votacao(votacao):
+    """A API manda aprovacao como 1/0 (ou null); no grafo ela fica booleana"""
+    aprovacao = votacao.get('aprovacao')
+    return None if aprovacao is None else bool(aprovacao)
+
+
+def id_deputado_autor(autor):
+    """Id do deputado autor: idAutor (arquivos anuais) ou o final da uriAutor (API)"""
+    if autor.get('idAutor') is not None:
+        return autor['idAutor']
+    encontrado = re.search(r'/deputados/(\d+)', autor.get('uriAutor') or '')
+    return int(encontrado.group(1)) if encontrado else None
+
+
+# Propriedades usadas para busca/junção fora das chaves únicas; os índices
+# que faltarem são criados por garantir_indices
+INDICES_JUNCAO = [
+    ('Partido', 'sigla'),
+    ('Deputado', 'siglaPartido'),
+    ('Deputado', 'siglaUf'),
+]
+
+# Propriedades de relação usadas para filtrar por período
+INDICES_RELACOES = [
+    ('FILIADO_A', 'idLegislatura'),
+    ('REPRESENTA', 'idLegislatura'),
+]
+
+# Índices de texto completo (nome, rótulo, propriedades) das buscas temáticas;
+# o analisador do Lucene para português ignora maiúsculas, acentos e flexões
+ANALISADOR_TEXTO = 'brazilian'
+INDICES_TEXTO = [
+    ('frente_titulo_texto', 'Frente', ['titulo']),
+    ('proposicao_ementa_texto', 'Proposicao', ['ementa']),
+]
+
+
+def agrupar_deputados(registros):
+    """
+    Junta as linhas de cada deputado (deputados.json traz uma por
+    legislatura) em um registro por id. Os campos vêm da legislatura mais
+    recente (num empate, da última linha do arquivo) e `legislaturas` lista
+    todas em que o deputado aparece.
+    """
+    por_id = {}
+    for dep in registros:
+        legislatura = dep.get('idLegislatura') or 0
+        atual = por_id.get(dep['id'])
+        if atual is None:
+            atual = por_id[dep['id']] = dict(dep, legislaturas=set())
+        elif legislatura >= (atual.get('idLegislatura') or 0):
+            atual.update({chave: valor for chave, valor in dep.items() if valor not in (None, '')})
+        else:
+            # Legislatura mais antiga só preenche o que a recente deixou vazio
+            for chave, valor in dep.items():
+                if atual.get(chave) in (None, ''):
+                    atual[chave] = valor
+        if legislatura:
+            atual['legislaturas'].add(legislatura)
+    for dep in por_id.values():
+        dep['legislaturas'] = sorted(dep['legislaturas'])
+    return por_id
+
+
+def resolver_partido(dep, partido_por_sigla, ids_partidos):
+    """
+    Id do partido de um registro de deputado: pela uriPartido quando aponta
+    para um partido conhecido, senão pela sigla; None se não resolver
+    """
+    encontrado = re.search(r'/partidos/(\d+)', dep.get('uriPartido') or '')
+    if encontrado and int(encontrado.group(1)) in ids_partidos:
+        return int(encontrado.group(1))
+    return partido_por_sigla.get(dep.get('siglaPartido'))
+
+
+# Estado da última importação (hash do conteúdo de cada entidade)
+ARQUIVO_ESTADO = 'dados_camara/.estado_importacao.json'
+ARQUIVO_RELATORIO = 'dados_camara/relatorio_importacao.json'
+
+# Versão do grafo: um valor novo a cada carga, lido pelo cache das análises.
+# Aleatória (e não um contador) para não repetir depois de um --limpar.
+QUERY_VERSAO = """
+MERGE (m:Metadados {chave: 'grafo'})
+SET m.versao = $versao, m.atualizadoEm = datetime(), m.agregados = $agregados
+"""
+
+
+def em_lotes(registros, tamanho):
+    """Agrupa um iterável em listas de até `tamanho` itens, sem carregá-lo inteiro"""
+    lote = []
+    for registro in registros:
+        lote.append(registro)
+        if len(lote) >= tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def _executar_lote(tx, query, linhas):
+    """Função de transação: um UNWIND com a lista inteira de linhas"""
+    return tx.run(query, rows=linhas).consume()
+
+
+async def _executar_lote_async(tx, query, linhas):
+    """Versão de _executar_lote para o driver assíncrono"""
+    resultado = await tx.run(query, rows=linhas)
+    return await resultado.consume()
+
+
+class MetricasImportacao:
+    """
+    Instrumentação das escritas: para cada etapa, tempo de leitura dos
+    arquivos no cliente, tempo de parede de cada lote, tempos do servidor
+    (result_available_after/result_consumed_after) e contadores do resumo
+    (nós/relações criados, propriedades definidas...). A diferença entre o
+    tempo do lote e o do servidor é serialização, rede e commit.
+    """
+
+    CONTADORES = ('nodes_created', 'nodes_deleted', 'relationships_created',
+                  'relationships_deleted', 'properties_set', 'labels_added')
+
+    def __init__(self):
+        self.inicio = time.time()
+        self.etapas = {}
+        self._lock = threading.Lock()
+
+    def _etapa(self, nome):
+        if nome not in self.etapas:
+            self.etapas[nome] = {
+                'linhas': 0, 'segundos': 0.0, 'segundos_leitura': 0.0, 'segundos_escrita': 0.0,
+                'servidor_disponivel_ms': 0, 'servidor_consumido_ms': 0,
+                'contadores': dict.fromkeys(self.CONTADORES, 0), 'lotes': [],
+            }
+        return self.etapas[nome]
+
+    def medir_leitura(self, etapa, linhas):
+        """Repassa `linhas` somando o tempo gasto para produzi-las (leitura e conversão)"""
+        iterador = iter(linhas)
+        gasto = 0.0
+        try:
+            while True:
+                inicio = time.perf_counter()
+                try:
+                    linha = next(iterador)
+                finally:
+                    gasto += time.perf_counter() - inicio
+                yield linha
+        except StopIteration:
+            return
+        finally:
+            with self._lock:
+                self._etapa(etapa)['segundos_leitura'] += gasto
+
+    def registrar_lote(self, etapa, linhas, duracao, resumo):
+        """Registra um lote escrito a partir do ResultSummary devolvido pelo consume()"""
+        disponivel = resumo.result_available_after or 0
+        consumido = resumo.result_consumed_after or 0
+        with self._lock:
+            registro = self._etapa(etapa)
+            registro['segundos_escrita'] += duracao
+            registro['servidor_disponivel_ms'] += disponivel
+            registro['servidor_consumido_ms'] += consumido
+            for contador in self.CONTADORES:
+                registro['contadores'][contador] += getattr(resumo.counters, contador)
+            registro['lotes'].append([linhas, round(duracao, 4), disponivel, consumido])
+
+    def registrar_etapa(self, etapa, linhas, segundos):
+        """Tempo de parede e linhas da etapa inteira (soma se a etapa se repetir)"""
+        with self._lock:
+            registro = self._etapa(etapa)
+            registro['linhas'] += linhas
+            registro['segundos'] += segundos
+
+    @staticmethod
+    def _quantil(valores, q):
+        if not valores:
+            return None
+        ordenados = sorted(valores)
+        return ordenados[min(len(ordenados) - 1, int(q * len(ordenados)))]
+
+    def relatorio(self, extras=None):
+        """Relatório da importação como dicionário serializável em JSON"""
+        etapas = {}
+        with self._lock:
+            for nome, e in self.etapas.items():
+                servidor = (e['servidor_disponivel_ms'] + e['servidor_consumido_ms']) / 1000
+                duracoes = [lote[1] for lote in e['lotes']]
+                etapas[nome] = {
+                    'linhas': e['linhas'],
+                    'segundos': round(e['segundos'], 3),
+                    'linhas_por_segundo': round(e['linhas'] / e['segundos'], 1) if e['segundos'] else None,
+                    'segundos_leitura': round(e['segundos_leitura'], 3),
+                    'segundos_escrita': round(e['segundos_escrita'], 3),
+                    'segundos_servidor': round(servidor, 3),
+                    'segundos_cliente_rede': round(max(0.0, e['segundos_escrita'] - servidor), 3),
+                    'servidor_disponivel_ms': e['servidor_disponivel_ms'],
+                    'servidor_consumido_ms': e['servidor_consumido_ms'],
+                    'contadores': {c: n for c, n in e['contadores'].items() if n},
+                    'lote_p50_s': self._quantil(duracoes, 0.5),
+                    'lote_p95_s': self._quantil(duracoes, 0.95),
+                    'lote_max_s': max(duracoes) if duracoes else None,
+                    # [linhas, segundos, result_available_after ms, result_consumed_after ms]
+                    'lotes': list(e['lotes']),
+                }
+        relatorio = {
+            'inicio': datetime.fromtimestamp(self.inicio, timezone.utc).isoformat(),
+            'duracao_s': round(time.time() - self.inicio, 3),
+            'etapas': etapas,
+        }
+        relatorio.update(extras or {})
+        return relatorio
+
+    @staticmethod
+    def comparar(relatorio, base):
+        """
+        Compara a vazão de cada etapa com um relatório anterior (baseline).
+        Retorna [(etapa, linhas/s atual, linhas/s base, variação %)].
+        """
+        comparacao = []
+        for nome, etapa in relatorio['etapas'].items():
+            anterior = base.get('etapas', {}).get(nome)
+            if not anterior or not anterior.get('linhas_por_segundo') or not etapa['linhas_por_segundo']:
+                continue
+            variacao = (etapa['linhas_por_segundo'] / anterior['linhas_por_segundo'] - 1) * 100
+            comparacao.append((nome, etapa['linhas_por_segundo'], anterior['linhas_por_segundo'],
+                               round(variacao, 1)))
+        return comparacao
+
 
 class ImportadorNeo4jAura:
     """Importa dados JSON para Neo4j Aura"""
 
-    def __init__(self, uri=None, username=None, password=None):
+    def __init__(self, uri=None, username=None, password=None, tamanho_lote=1000, workers=1,
+                 arquivo_estado=ARQUIVO_ESTADO, driver=None, driver_async=None):
         """Inicializa conexão com Neo4j Aura"""
         # Configurações do seu Neo4j Aura - Instance02
         self.URI = uri or "neo4j+s://2a3ba8da.databases.neo4j.io"
         self.AUTH = (username or "neo4j", password or "N_CdGEmG4OlD7yhMOgsvkkUzHxq7Gi_-5D5kpvcMAV4")  # username, password
 
+        # Linhas enviadas por transação (UNWIND $rows)
+        self.tamanho_lote = max(1, tamanho_lote)
+        # Threads (cada uma com sua sessão) que escrevem relacionamentos em paralelo
+        self.workers = max(1, workers)
+        self.arquivo_estado = arquivo_estado
+        self.etapas = []
+        self.nao_resolvidos = {}
+        self.registros_lidos = {}
+        self.metricas = MetricasImportacao()
+        self.ultimas_estatisticas = None
+
         print("Conectando ao Neo4j Aura...")
-        self.driver = GraphDatabase.driver(self.URI, auth=self.AUTH)
+        self.driver = driver or GraphDatabase.driver(self.URI, auth=self.AUTH)
+        # Driver assíncrono do pipeline (--async), criado só quando usado
+        self.driver_async = driver_async
 
         # Testar conexão
         try:
@@ -32,21 +496,272 @@ class ImportadorNeo4jAura:
         self.driver.close()
         print("\n✓ Conexão fechada")
 
-    def limpar_banco(self):
-        """CUIDADO: Remove todos os dados do banco"""
+    @staticmethod
+    def _nome_cypher(nome):
+        """Escapa um rótulo/tipo para interpolar na query (`Nome`)"""
+        return '`' + nome.replace('`', '``') + '`'
+
+    def limpar_banco(self, rotulos=None, tamanho_lote=10000):
+        """
+        CUIDADO: Remove os dados do banco (ou só os nós de `rotulos`)
+
+        Apaga primeiro as relações e depois os nós, em transações de até
+        `tamanho_lote` linhas (CALL {} IN TRANSACTIONS), para não estourar
+        a memória de transação do Aura. Constraints e índices são mantidos.
+        A limpeza completa apaga também o nó :Metadados; a parcial grava uma
+        nova versão do grafo, para o cache das análises não servir resultados
+        do grafo anterior.
+        """
+        parcial = bool(rotulos)
+        # CALL {} IN TRANSACTIONS só roda em transação implícita (session.run)
         with self.driver.session() as session:
-            print("⚠️  Limpando banco de dados...")
-            session.run("MATCH (n) DETACH DELETE n")
-            print("✓ Banco limpo\n")
+            print("⚠️  Limpando banco de dados" + (f" ({', '.join(rotulos)})..." if rotulos else "..."))
+            inicio = time.perf_counter()
+
+            if rotulos:
+                passos_relacoes = [(f"relações de {rotulo}", query) for rotulo in rotulos for query in (
+                    f"MATCH (:{self._nome_cypher(rotulo)})-[r]->() "
+                    f"CALL {{ WITH r DELETE r }} IN TRANSACTIONS OF $lote ROWS",
+                    f"MATCH (:{self._nome_cypher(rotulo)})<-[r]-() "
+                    f"CALL {{ WITH r DELETE r }} IN TRANSACTIONS OF $lote ROWS")]
+            else:
+                tipos = [registro['relationshipType']
+                         for registro in session.run("CALL db.relationshipTypes()")]
+                passos_relacoes = [(tipo, f"MATCH ()-[r:{self._nome_cypher(tipo)}]->() "
+                                          f"CALL {{ WITH r DELETE r }} IN TRANSACTIONS OF $lote ROWS")
+                                   for tipo in tipos]
+                # O último passo (None) pega nós que ficaram sem rótulo
+                rotulos = [registro['label'] for registro in session.run("CALL db.labels()")] + [None]
+
+            relacoes = 0
+            for descricao, query in passos_relacoes:
+                removidas = session.run(query, lote=tamanho_lote).consume().counters.relationships_deleted
+                relacoes += removidas
+                if removidas:
+                    print(f"  → {descricao}: {removidas:,} relações removidas")
+
+            nos = 0
+            for rotulo in rotulos:
+                padrao = f"(n:{self._nome_cypher(rotulo)})" if rotulo else "(n)"
+                query = f"MATCH {padrao} CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF $lote ROWS"
+                removidos = session.run(query, lote=tamanho_lote).consume().counters.nodes_deleted
+                nos += removidos
+                if removidos:
+                    print(f"  → {rotulo or 'sem rótulo'}: {removidos:,} nós removidos")
+
+            print(f"✓ Banco limpo: {nos:,} nós e {relacoes:,} relações em "
+                  f"{time.perf_counter() - inicio:.1f}s (constraints e índices mantidos)\n")
+        # O estado da importação incremental não vale mais para o banco limpo
+        if os.path.exists(self.arquivo_estado):
+            os.remove(self.arquivo_estado)
+        if parcial:
+            # Os agregados podem contar nós que acabaram de ser removidos
+            self.registrar_versao(agregados=False)
 
     def carregar_json(self, arquivo):
-        """Carrega arquivo JSON"""
-        if not os.path.exists(arquivo):
+        """Carrega arquivo JSON inteiro (prefira iterar_json para arquivos grandes)"""
+        return list(self.iterar_json(arquivo))
+
+    def iterar_json(self, arquivo):
+        """
+        Lê os registros em streaming, um por vez. Aceita o .json pedido ou
+        as variantes geradas pelo coletor (.jsonl, .jsonl.gz, .jsonl.zst)
+        """
+        caminho = localizar_arquivo(arquivo)
+        if caminho is None:
             print(f"  ⚠ Arquivo não encontrado: {arquivo}")
-            return []
+            return
+        yield from iterar_registros(caminho)
 
-        with open(arquivo, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def escrever_em_lotes(self, etapa, query, linhas, rotulo=None):
+        """
+        Envia `linhas` em lotes de `tamanho_lote` para `query` (que deve
+        começar com UNWIND $rows AS row), um lote por transação gerenciada.
+        Registra a vazão da etapa e retorna o número de linhas escritas.
+        """
+        total = 0
+        inicio = time.perf_counter()
+        with self.driver.session() as session:
+            for lote in em_lotes(self.metricas.medir_leitura(etapa, linhas), self.tamanho_lote):
+                inicio_lote = time.perf_counter()
+                resumo = session.execute_write(_executar_lote, query, lote)
+                self.metricas.registrar_lote(etapa, len(lote), time.perf_counter() - inicio_lote, resumo)
+                total += len(lote)
+                print(f"  → {total} {rotulo or etapa} processados", end='\r')
+        self._registrar_etapa(etapa, total, time.perf_counter() - inicio)
+        return total
+
+    def escrever_particionado(self, etapa, query, linhas, particao, rotulo=None):
+        """
+        Como escrever_em_lotes, mas distribui as linhas entre `workers`
+        threads, cada uma com sua sessão. `particao(linha)` escolhe a ponta
+        da relação usada como chave (ex.: idDeputado): linhas com a mesma
+        chave vão sempre para o mesmo worker, que fica dono desses nós. A
+        outra ponta ainda pode ser travada por mais de um worker; os
+        deadlocks e erros transitórios que isso causar são repetidos pelo
+        execute_write.
+        """
+        if self.workers == 1:
+            return self.escrever_em_lotes(etapa, query, linhas, rotulo)
+
+        filas = [queue.Queue(maxsize=4) for _ in range(self.workers)]
+        buffers = [[] for _ in range(self.workers)]
+        erros = []
+        total = 0
+        lock = threading.Lock()
+
+        def worker(fila):
+            nonlocal total
+            with self.driver.session() as session:
+                while True:
+                    lote = fila.get()
+                    if lote is None:
+                        return
+                    if erros:
+                        continue  # Só esvazia a fila para o produtor não travar
+                    try:
+                        inicio_lote = time.perf_counter()
+                        resumo = session.execute_write(_executar_lote, query, lote)
+                    except Exception as e:
+                        erros.append(e)
+                        continue
+                    self.metricas.registrar_lote(etapa, len(lote), time.perf_counter() - inicio_lote, resumo)
+                    with lock:
+                        total += len(lote)
+                        print(f"  → {total} {rotulo or etapa} processados", end='\r')
+
+        inicio = time.perf_counter()
+        threads = [threading.Thread(target=worker, args=(fila,), daemon=True) for fila in filas]
+        for thread in threads:
+            thread.start()
+        try:
+            for linha in self.metricas.medir_leitura(etapa, linhas):
+                i = hash(particao(linha)) % self.workers
+                buffers[i].append(linha)
+                if len(buffers[i]) >= self.tamanho_lote:
+                    filas[i].put(buffers[i])
+                    buffers[i] = []
+                if erros:
+                    break
+            for i, buffer in enumerate(buffers):
+                if buffer and not erros:
+                    filas[i].put(buffer)
+        finally:
+            for fila in filas:
+                fila.put(None)
+            for thread in threads:
+                thread.join()
+        if erros:
+            raise erros[0]
+
+        self._registrar_etapa(etapa, total, time.perf_counter() - inicio)
+        return total
+
+    def _produzir_lotes(self, loop, linhas, filas, particao, erros):
+        """
+        Roda numa thread: lê e decodifica as linhas e entrega lotes às filas
+        do pipeline assíncrono. O put espera vaga na fila, então a leitura
+        nunca fica mais que alguns lotes à frente da escrita.
+        """
+        buffers = [[] for _ in filas]
+        for linha in linhas:
+            i = hash(particao(linha)) % len(filas) if particao else 0
+            buffers[i].append(linha)
+            if len(buffers[i]) >= self.tamanho_lote:
+                asyncio.run_coroutine_threadsafe(filas[i].put(buffers[i]), loop).result()
+                buffers[i] = []
+            if erros:
+                return
+        for i, buffer in enumerate(buffers):
+            if buffer:
+                asyncio.run_coroutine_threadsafe(filas[i].put(buffer), loop).result()
+
+    async def escrever_async(self, etapa, query, linhas, particao=None, rotulo=None):
+        """
+        Versão assíncrona de escrever_em_lotes/escrever_particionado: a
+        leitura e o agrupamento em lotes rodam numa thread e alimentam filas
+        limitadas, esvaziadas por `workers` tarefas de escrita (cada uma com
+        sua AsyncSession). Com `particao`, cada tarefa tem sua fila e recebe
+        sempre as mesmas chaves; sem ela, todas disputam uma fila só.
+        """
+        n_filas = self.workers if particao else 1
+        filas = [asyncio.Queue(maxsize=4 * self.workers) for _ in range(n_filas)]
+        escritores = [filas[i % n_filas] for i in range(self.workers)]
+        erros = []
+        total = 0
+
+        async def escritor(fila):
+            nonlocal total
+            async with self.driver_async.session() as session:
+                while True:
+                    lote = await fila.get()
+                    if lote is None:
+                        return
+                    if erros:
+                        continue  # Só esvazia a fila para o produtor não travar
+                    try:
+                        inicio_lote = time.perf_counter()
+                        resumo = await session.execute_write(_executar_lote_async, query, lote)
+                    except Exception as e:
+                        erros.append(e)
+                        continue
+                    self.metricas.registrar_lote(etapa, len(lote), time.perf_counter() - inicio_lote, resumo)
+                    total += len(lote)
+                    print(f"  → {total} {rotulo or etapa} processados", end='\r')
+
+        inicio = time.perf_counter()
+        tarefas = [asyncio.create_task(escritor(fila)) for fila in escritores]
+        try:
+            await asyncio.to_thread(self._produzir_lotes, asyncio.get_running_loop(),
+                                    self.metricas.medir_leitura(etapa, linhas), filas, particao, erros)
+        finally:
+            for fila in escritores:
+                await fila.put(None)
+            await asyncio.gather(*tarefas)
+        if erros:
+            raise erros[0]
+
+        return self._registrar_etapa(etapa, total, time.perf_counter() - inicio)
+
+    def _registrar_etapa(self, etapa, linhas, segundos):
+        """Guarda linhas e linhas/s de uma etapa para o resumo final"""
+        self.metricas.registrar_etapa(etapa, linhas, segundos)
+        self.etapas.append({
+            'etapa': etapa,
+            'linhas': linhas,
+            'segundos': round(segundos, 3),
+            'linhas_por_segundo': round(linhas / segundos, 1) if segundos else None,
+        })
+        return self.etapas[-1]
+
+    def salvar_relatorio(self, caminho=ARQUIVO_RELATORIO, baseline=None):
+        """
+        Grava o relatório JSON das escritas (ver MetricasImportacao). Com
+        `baseline` (um relatório anterior), mostra e anexa a variação de
+        vazão de cada etapa.
+        """
+        relatorio = self.metricas.relatorio({'tamanho_lote': self.tamanho_lote, 'workers': self.workers,
+                                             'grafo': self.ultimas_estatisticas})
+        if baseline:
+            with open(baseline, 'r', encoding='utf-8') as f:
+                comparacao = MetricasImportacao.comparar(relatorio, json.load(f))
+            relatorio['comparacao_baseline'] = {'arquivo': baseline, 'etapas': {
+                nome: {'linhas_por_segundo': atual, 'baseline': base, 'variacao_pct': variacao}
+                for nome, atual, base, variacao in comparacao}}
+            print(f"📏 Vazão comparada com {baseline}:")
+            for nome, atual, base, variacao in comparacao:
+                alerta = "  ⚠" if variacao <= -20 else ""
+                print(f"  • {nome}: {atual:,.0f} linhas/s (antes {base:,.0f}, {variacao:+.1f}%){alerta}")
+        os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+        print(f"📈 Relatório da importação salvo em {caminho}")
+        return relatorio
+
+    def _vazao(self):
+        """Texto com a vazão da última etapa registrada"""
+        etapa = self.etapas[-1]
+        return f"{etapa['segundos']:.1f}s, {etapa['linhas_por_segundo'] or 0:,.0f} linhas/s"
 
     def criar_constraints(self):
         """Cria constraints e índices"""
@@ -57,7 +772,12 @@ class ImportadorNeo4jAura:
                 "CREATE CONSTRAINT deputado_id IF NOT EXISTS FOR (d:Deputado) REQUIRE d.id IS UNIQUE",
                 "CREATE CONSTRAINT partido_id IF NOT EXISTS FOR (p:Partido) REQUIRE p.id IS UNIQUE",
                 "CREATE CONSTRAINT frente_id IF NOT EXISTS FOR (f:Frente) REQUIRE f.id IS UNIQUE",
-                "CREATE CONSTRAINT uf_sigla IF NOT EXISTS FOR (uf:UF) REQUIRE uf.sigla IS UNIQUE"
+                "CREATE CONSTRAINT uf_sigla IF NOT EXISTS FOR (uf:UF) REQUIRE uf.sigla IS UNIQUE",
+                "CREATE CONSTRAINT proposicao_id IF NOT EXISTS FOR (p:Proposicao) REQUIRE p.id IS UNIQUE",
+                "CREATE CONSTRAINT votacao_id IF NOT EXISTS FOR (v:Votacao) REQUIRE v.id IS UNIQUE",
+                "CREATE CONSTRAINT tipo_voto_codigo IF NOT EXISTS FOR (t:TipoVoto) REQUIRE t.codigo IS UNIQUE",
+                "CREATE CONSTRAINT regiao_nome IF NOT EXISTS FOR (r:Regiao) REQUIRE r.nome IS UNIQUE",
+                "CREATE CONSTRAINT partido_regiao_chave IF NOT EXISTS FOR (pr:PartidoRegiao) REQUIRE pr.chave IS UNIQUE"
             ]
 
             for constraint in constraints:
@@ -71,197 +791,541 @@ class ImportadorNeo4jAura:
                         print(f"  ⚠ {str(e)}")
             print()
 
+    def garantir_indices(self):
+        """
+        Cria os índices que faltam nas propriedades de junção (INDICES_JUNCAO)
+        e os de texto completo (INDICES_TEXTO), e informa quais foram
+        criados. Constraints de unicidade já contam como índice da propriedade.
+        """
+        with self.driver.session() as session:
+            print("🔎 Verificando índices de junção e de texto...")
+            existentes = set()  # (rótulo ou tipo, primeira propriedade)
+            textos = set()      # Nomes dos índices de texto completo
+            for registro in session.run("SHOW INDEXES YIELD name, type, labelsOrTypes, properties"):
+                if registro['type'] == 'FULLTEXT':
+                    textos.add(registro['name'])
+                    continue
+                for rotulo in registro['labelsOrTypes'] or []:
+                    if registro['properties']:
+                        existentes.add((rotulo, registro['properties'][0]))
+
+            criados = []
+            for rotulo, propriedade in INDICES_JUNCAO:
+                if (rotulo, propriedade) in existentes:
+                    print(f"  → {rotulo}.{propriedade}: índice já existe")
+                    continue
+                nome = f"{rotulo.lower()}_{propriedade.lower()}"
+                session.run(f"CREATE INDEX {nome} IF NOT EXISTS "
+                            f"FOR (n:{self._nome_cypher(rotulo)}) ON (n.{self._nome_cypher(propriedade)})")
+                criados.append(f"{rotulo}.{propriedade}")
+                print(f"  ✓ {rotulo}.{propriedade}: índice criado (não existia)")
+
+            for tipo, propriedade in INDICES_RELACOES:
+                if (tipo, propriedade) in existentes:
+                    print(f"  → [:{tipo}].{propriedade}: índice já existe")
+                    continue
+                nome = f"{tipo.lower()}_{propriedade.lower()}"
+                session.run(f"CREATE INDEX {nome} IF NOT EXISTS "
+                            f"FOR ()-[r:{self._nome_cypher(tipo)}]-() ON (r.{self._nome_cypher(propriedade)})")
+                criados.append(f"[:{tipo}].{propriedade}")
+                print(f"  ✓ [:{tipo}].{propriedade}: índice criado (não existia)")
+
+            for nome, rotulo, propriedades in INDICES_TEXTO:
+                campos = ', '.join(f"n.{self._nome_cypher(p)}" for p in propriedades)
+                descricao = f"{rotulo}.{'/'.join(propriedades)} (texto)"
+                if nome in textos:
+                    print(f"  → {descricao}: índice já existe")
+                    continue
+                session.run(f"CREATE FULLTEXT INDEX {nome} IF NOT EXISTS "
+                            f"FOR (n:{self._nome_cypher(rotulo)}) ON EACH [{campos}] "
+                            f"OPTIONS {{indexConfig: {{`fulltext.analyzer`: '{ANALISADOR_TEXTO}'}}}}")
+                criados.append(descricao)
+                print(f"  ✓ {descricao}: índice criado (não existia)")
+            print()
+            return criados
+
     def criar_ufs(self):
         """Cria nós de UFs brasileiras"""
         print("🗺️  Criando UFs...")
 
-        with self.driver.session() as session:
-            query = """
-            CREATE
-              (uf1:UF {sigla: "AC", nome: "Acre", regiao: "Norte"}),
-              (uf2:UF {sigla: "AL", nome: "Alagoas", regiao: "Nordeste"}),
-              (uf3:UF {sigla: "AP", nome: "Amapá", regiao: "Norte"}),
-              (uf4:UF {sigla: "AM", nome: "Amazonas", regiao: "Norte"}),
-              (uf5:UF {sigla: "BA", nome: "Bahia", regiao: "Nordeste"}),
-              (uf6:UF {sigla: "CE", nome: "Ceará", regiao: "Nordeste"}),
-              (uf7:UF {sigla: "DF", nome: "Distrito Federal", regiao: "Centro-Oeste"}),
-              (uf8:UF {sigla: "ES", nome: "Espírito Santo", regiao: "Sudeste"}),
-              (uf9:UF {sigla: "GO", nome: "Goiás", regiao: "Centro-Oeste"}),
-              (uf10:UF {sigla: "MA", nome: "Maranhão", regiao: "Nordeste"}),
-              (uf11:UF {sigla: "MT", nome: "Mato Grosso", regiao: "Centro-Oeste"}),
-              (uf12:UF {sigla: "MS", nome: "Mato Grosso do Sul", regiao: "Centro-Oeste"}),
-              (uf13:UF {sigla: "MG", nome: "Minas Gerais", regiao: "Sudeste"}),
-              (uf14:UF {sigla: "PA", nome: "Pará", regiao: "Norte"}),
-              (uf15:UF {sigla: "PB", nome: "Paraíba", regiao: "Nordeste"}),
-              (uf16:UF {sigla: "PR", nome: "Paraná", regiao: "Sul"}),
-              (uf17:UF {sigla: "PE", nome: "Pernambuco", regiao: "Nordeste"}),
-              (uf18:UF {sigla: "PI", nome: "Piauí", regiao: "Nordeste"}),
-              (uf19:UF {sigla: "RJ", nome: "Rio de Janeiro", regiao: "Sudeste"}),
-              (uf20:UF {sigla: "RN", nome: "Rio Grande do Norte", regiao: "Nordeste"}),
-              (uf21:UF {sigla: "RS", nome: "Rio Grande do Sul", regiao: "Sul"}),
-              (uf22:UF {sigla: "RO", nome: "Rondônia", regiao: "Norte"}),
-              (uf23:UF {sigla: "RR", nome: "Roraima", regiao: "Norte"}),
-              (uf24:UF {sigla: "SC", nome: "Santa Catarina", regiao: "Sul"}),
-              (uf25:UF {sigla: "SP", nome: "São Paulo", regiao: "Sudeste"}),
-              (uf26:UF {sigla: "SE", nome: "Sergipe", regiao: "Nordeste"}),
-              (uf27:UF {sigla: "TO", nome: "Tocantins", regiao: "Norte"})
-            """
-            session.run(query)
-            print("✓ 27 UFs criadas\n")
+        total = self.escrever_em_lotes('ufs', QUERY_UFS, UFS, 'UFs')
+        print(f"✓ {total} UFs criadas" + " "*20 + "\n")
+
+    def linhas_partidos(self, arquivo='dados_camara/partidos.json'):
+        return ({
+            'id': partido['id'],
+            'sigla': partido['sigla'],
+            'nome': partido['nome'],
+            'uri': partido.get('uri', '')
+        } for partido in self.iterar_json(arquivo))
+
+    def linhas_deputados(self, arquivo='dados_camara/deputados.json'):
+        """Uma linha por deputado (as linhas por legislatura são agrupadas antes)"""
+        return ({
+            'id': dep['id'],
+            'nome': dep.get('nome', ''),
+            'siglaPartido': dep.get('siglaPartido', ''),
+            'siglaUf': dep.get('siglaUf', ''),
+            'urlFoto': dep.get('urlFoto', ''),
+            'email': dep.get('email', ''),
+            'legislaturas': dep['legislaturas'],
+            'ultimaLegislatura': dep.get('idLegislatura')
+        } for dep in agrupar_deputados(self._contar('deputados', self.iterar_json(arquivo))).values())
+
+    def _contar(self, nome, registros):
+        """Repassa os registros contando quantos foram lidos (self.registros_lidos)"""
+        self.registros_lidos[nome] = 0
+        for registro in registros:
+            self.registros_lidos[nome] += 1
+            yield registro
+
+    def linhas_filiados(self, arquivo='dados_camara/deputados.json',
+                        arquivo_partidos='dados_camara/partidos.json'):
+        """
+        Pares (deputado, partido) por legislatura, já resolvidos para o id do partido, para
+        que o MATCH use só a constraint de id. Registros sem partido
+        conhecido são contados em self.nao_resolvidos['FILIADO_A'].
+        """
+        partido_por_sigla = {p['sigla']: p['id'] for p in self.iterar_json(arquivo_partidos)}
+        ids_partidos = set(partido_por_sigla.values())
+        self.nao_resolvidos['FILIADO_A'] = 0
+        for dep in self.iterar_json(arquivo):
+            if not dep.get('siglaPartido') and not dep.get('uriPartido'):
+                continue
+            id_partido = resolver_partido(dep, partido_por_sigla, ids_partidos)
+            if id_partido is None:
+                self.nao_resolvidos['FILIADO_A'] += 1
+                continue
+            # 0 = legislatura desconhecida (MERGE não aceita propriedade nula)
+            yield {'id': dep['id'], 'idPartido': id_partido, 'idLegislatura': dep.get('idLegislatura') or 0}
+
+    def linhas_representa(self, arquivo='dados_camara/deputados.json'):
+        """Pares (deputado, UF) por legislatura; a sigla é a chave única da UF"""
+        siglas = {uf['sigla'] for uf in UFS}
+        self.nao_resolvidos['REPRESENTA'] = 0
+        for dep in self.iterar_json(arquivo):
+            if not dep.get('siglaUf'):
+                continue
+            if dep['siglaUf'] not in siglas:
+                self.nao_resolvidos['REPRESENTA'] += 1
+                continue
+            yield {'id': dep['id'], 'sigla': dep['siglaUf'], 'idLegislatura': dep.get('idLegislatura') or 0}
+
+    def linhas_frentes(self, arquivo='dados_camara/frentes.json'):
+        return ({
+            'id': frente['id'],
+            'titulo': frente.get('titulo', ''),
+            'idLegislatura': frente.get('idLegislatura', 0),
+            'uri': frente.get('uri', '')
+        } for frente in self.iterar_json(arquivo))
+
+    def linhas_membros_frentes(self, arquivo='dados_camara/membros_frentes.json'):
+        return ({
+            'idDeputado': membro['idDeputado'],
+            'idFrente': membro['idFrente'],
+            'titulo': membro.get('titulo', 'Membro')
+        } for membro in self.iterar_json(arquivo))
+
+    def linhas_proposicoes(self, arquivo='dados_camara/proposicoes.json'):
+        return ({
+            'id': prop['id'],
+            'siglaTipo': prop.get('siglaTipo', ''),
+            'numero': prop.get('numero'),
+            'ano': prop.get('ano'),
+            'ementa': prop.get('ementa', '')
+        } for prop in self.iterar_json(arquivo))
+
+    def linhas_votacoes(self, arquivo='dados_camara/votacoes.json'):
+        return ({
+            'id': votacao['id'],
+            'data': votacao.get('data'),
+            'siglaOrgao': votacao.get('siglaOrgao'),
+            'descricao': votacao.get('descricao'),
+            'aprovacao': aprovacao_votacao(votacao)
+        } for votacao in self.iterar_json(arquivo))
+
+    def linhas_tipos_voto(self):
+        return iter([{'codigo': codigo, 'descricao': descricao} for descricao, codigo in TIPOS_VOTO.items()])
+
+    def linhas_autores(self, arquivo='dados_camara/autores_proposicoes.json'):
+        """Só autores que são deputados (órgãos, Senado etc. não têm nó no grafo)"""
+        for autor in self.iterar_json(arquivo):
+            id_deputado = id_deputado_autor(autor)
+            if id_deputado is not None:
+                yield {
+                    'idDeputado': id_deputado,
+                    'idProposicao': autor['idProposicao'],
+                    'siglaTipo': autor.get('tipoProposicao')
+                }
+
+    def linhas_votos(self, arquivo='dados_camara/votos.json'):
+        for voto in self.iterar_json(arquivo):
+            if voto.get('idDeputado') is None:
+                continue
+            codigo, outro = codigo_voto(voto.get('voto'))
+            yield {
+                'idDeputado': voto['idDeputado'],
+                'idVotacao': voto['idVotacao'],
+                'data': voto.get('dataVotacao'),
+                'voto': codigo,
+                'outro': outro
+            }
 
     def importar_partidos(self, arquivo='dados_camara/partidos.json'):
         """Importa partidos"""
         print(f"📋 Importando partidos...")
-        partidos = self.carregar_json(arquivo)
 
-        if not partidos:
-            return
+        total = self.escrever_em_lotes('partidos', QUERY_PARTIDOS, self.linhas_partidos(arquivo))
 
-        with self.driver.session() as session:
-            for partido in partidos:
-                query = """
-                MERGE (p:Partido {id: $id})
-                SET p.sigla = $sigla,
-                    p.nome = $nome,
-                    p.uri = $uri
-                """
-                session.run(query,
-                    id=partido['id'],
-                    sigla=partido['sigla'],
-                    nome=partido['nome'],
-                    uri=partido.get('uri', ''))
-
-            print(f"✓ {len(partidos)} partidos importados\n")
+        print(f"✓ {total} partidos importados ({self._vazao()})" + " "*20 + "\n")
 
     def importar_deputados(self, arquivo='dados_camara/deputados.json'):
         """Importa deputados"""
         print(f"👤 Importando deputados...")
-        deputados = self.carregar_json(arquivo)
 
-        if not deputados:
+        # Importar deputados
+        total = self.escrever_em_lotes('deputados', QUERY_DEPUTADOS, self.linhas_deputados(arquivo))
+
+        if not total:
             return
 
-        with self.driver.session() as session:
-            # Importar deputados
-            for i, dep in enumerate(deputados, 1):
-                query = """
-                MERGE (d:Deputado {id: $id})
-                SET d.nome = $nome,
-                    d.siglaPartido = $siglaPartido,
-                    d.siglaUf = $siglaUf,
-                    d.urlFoto = $urlFoto,
-                    d.email = $email
-                """
-                session.run(query,
-                    id=dep['id'],
-                    nome=dep.get('nome', ''),
-                    siglaPartido=dep.get('siglaPartido', ''),
-                    siglaUf=dep.get('siglaUf', ''),
-                    urlFoto=dep.get('urlFoto', ''),
-                    email=dep.get('email', ''))
-
-                if i % 100 == 0:
-                    print(f"  → {i}/{len(deputados)} deputados processados", end='\r')
-
-            print(f"✓ {len(deputados)} deputados importados" + " "*20)
-
-            # Criar relacionamentos FILIADO_A
-            print("  Criando relacionamentos FILIADO_A...")
-            query_partido = """
-            MATCH (d:Deputado)
-            WHERE d.siglaPartido IS NOT NULL AND d.siglaPartido <> ''
-            MATCH (p:Partido {sigla: d.siglaPartido})
-            MERGE (d)-[:FILIADO_A]->(p)
-            """
-            result = session.run(query_partido)
-            print("  ✓ Relacionamentos FILIADO_A criados")
-
-            # Criar relacionamentos REPRESENTA
-            print("  Criando relacionamentos REPRESENTA...")
-            query_uf = """
-            MATCH (d:Deputado)
-            WHERE d.siglaUf IS NOT NULL AND d.siglaUf <> ''
-            MATCH (uf:UF {sigla: d.siglaUf})
-            MERGE (d)-[:REPRESENTA]->(uf)
-            """
-            result = session.run(query_uf)
-            print("  ✓ Relacionamentos REPRESENTA criados\n")
+        print(f"✓ {total} deputados importados de {self.registros_lidos.get('deputados', total)} registros "
+              f"por legislatura ({self._vazao()})" + " "*20)
+
+        # Criar relacionamentos FILIADO_A (um worker por grupo de partidos)
+        print("  Criando relacionamentos FILIADO_A...")
+        self.escrever_particionado('filiado_a', QUERY_FILIADO_A, self.linhas_filiados(arquivo),
+                                   particao=lambda linha: linha['idPartido'], rotulo='filiações')
+        print(f"  ✓ Relacionamentos FILIADO_A criados ({self._vazao()})" + " "*20)
+        if self.nao_resolvidos.get('FILIADO_A'):
+            print(f"  ⚠ {self.nao_resolvidos['FILIADO_A']} registros com partido desconhecido")
+
+        # Criar relacionamentos REPRESENTA (um worker por grupo de UFs)
+        print("  Criando relacionamentos REPRESENTA...")
+        self.escrever_particionado('representa', QUERY_REPRESENTA, self.linhas_representa(arquivo),
+                                   particao=lambda linha: linha['sigla'], rotulo='representações')
+        print(f"  ✓ Relacionamentos REPRESENTA criados ({self._vazao()})" + " "*20)
+        if self.nao_resolvidos.get('REPRESENTA'):
+            print(f"  ⚠ {self.nao_resolvidos['REPRESENTA']} registros com UF desconhecida")
+        print()
 
     def importar_frentes(self, arquivo='dados_camara/frentes.json'):
         """Importa frentes"""
         print(f"🤝 Importando frentes...")
-        frentes = self.carregar_json(arquivo)
 
-        if not frentes:
-            return
+        total = self.escrever_em_lotes('frentes', QUERY_FRENTES, self.linhas_frentes(arquivo))
 
-        with self.driver.session() as session:
-            for frente in frentes:
-                query = """
-                MERGE (f:Frente {id: $id})
-                SET f.titulo = $titulo,
-                    f.idLegislatura = $idLegislatura,
-                    f.uri = $uri
-                """
-                session.run(query,
-                    id=frente['id'],
-                    titulo=frente.get('titulo', ''),
-                    idLegislatura=frente.get('idLegislatura', 0),
-                    uri=frente.get('uri', ''))
-
-            print(f"✓ {len(frentes)} frentes importadas\n")
+        print(f"✓ {total} frentes importadas ({self._vazao()})" + " "*20 + "\n")
 
     def importar_membros_frentes(self, arquivo='dados_camara/membros_frentes.json'):
         """Importa relacionamentos deputado-frente"""
         print(f"🔗 Importando membros de frentes...")
-        membros = self.carregar_json(arquivo)
 
-        if not membros:
+        # Particionar por deputado, a ponta que membros, autorias e votos compartilham
+        total = self.escrever_particionado('membros_frentes', QUERY_MEMBROS_FRENTES,
+                                           self.linhas_membros_frentes(arquivo),
+                                           particao=lambda linha: linha['idDeputado'], rotulo='membros')
+
+        if not total:
             print("  ⚠ Arquivo não encontrado (execute coleta completa)\n")
             return
 
+        print(f"✓ {total} relacionamentos MEMBRO_DE criados ({self._vazao()})" + " "*20 + "\n")
+
+    def importar_proposicoes(self, arquivo='dados_camara/proposicoes.json'):
+        """Importa proposições"""
+        print(f"📜 Importando proposições...")
+
+        total = self.escrever_em_lotes('proposicoes', QUERY_PROPOSICOES, self.linhas_proposicoes(arquivo))
+
+        print(f"✓ {total} proposições importadas ({self._vazao()})" + " "*20 + "\n")
+
+    def importar_votacoes(self, arquivo='dados_camara/votacoes.json'):
+        """Importa votações e os tipos de voto"""
+        print(f"🗳️  Importando votações...")
+
+        self.escrever_em_lotes('tipos_voto', QUERY_TIPOS_VOTO, self.linhas_tipos_voto(), 'tipos de voto')
+        total = self.escrever_em_lotes('votacoes', QUERY_VOTACOES, self.linhas_votacoes(arquivo))
+
+        print(f"✓ {total} votações importadas ({self._vazao()})" + " "*20 + "\n")
+
+    def importar_autores(self, arquivo='dados_camara/autores_proposicoes.json'):
+        """Importa relacionamentos deputado-proposição (AUTOR_DE)"""
+        print(f"✍️  Importando autores de proposições...")
+
+        # Particionar por deputado: cada worker fica dono de um grupo de deputados
+        total = self.escrever_particionado('autores', QUERY_AUTORES, self.linhas_autores(arquivo),
+                                           particao=lambda linha: linha['idDeputado'], rotulo='autorias')
+
+        print(f"✓ {total} relacionamentos AUTOR_DE criados ({self._vazao()})" + " "*20 + "\n")
+
+    def importar_votos(self, arquivo='dados_camara/votos.json'):
+        """Importa votos individuais (VOTOU {voto}); centenas de milhares de relações"""
+        print(f"🗳️  Importando votos...")
+
+        # Particionar por deputado: os ~513 deputados aparecem em todas as votações,
+        # então dividir por votação faria todos os workers travarem os mesmos nós
+        total = self.escrever_particionado('votos', QUERY_VOTOS, self.linhas_votos(arquivo),
+                                           particao=lambda linha: linha['idDeputado'], rotulo='votos')
+
+        print(f"✓ {total} relacionamentos VOTOU criados ({self._vazao()})" + " "*20 + "\n")
+
+    def _entidades(self):
+        """
+        Entidades da importação incremental, na ordem de escrita (nós antes
+        das relações). `chave` são os campos que identificam a linha e
+        `remover` apaga as linhas que sumiram do snapshot.
+        """
+        return [
+            {'nome': 'UF', 'linhas': lambda: iter(UFS), 'chave': ('sigla',), 'query': QUERY_UFS,
+             'remover': "UNWIND $rows AS row MATCH (n:UF {sigla: row.sigla}) DETACH DELETE n"},
+            {'nome': 'Partido', 'linhas': self.linhas_partidos, 'chave': ('id',), 'query': QUERY_PARTIDOS,
+             'remover': "UNWIND $rows AS row MATCH (n:Partido {id: row.id}) DETACH DELETE n"},
+            {'nome': 'Deputado', 'linhas': self.linhas_deputados, 'chave': ('id',), 'query': QUERY_DEPUTADOS,
+             'remover': "UNWIND $rows AS row MATCH (n:Deputado {id: row.id}) DETACH DELETE n"},
+            {'nome': 'Frente', 'linhas': self.linhas_frentes, 'chave': ('id',), 'query': QUERY_FRENTES,
+             'remover': "UNWIND $rows AS row MATCH (n:Frente {id: row.id}) DETACH DELETE n"},
+            {'nome': 'Proposicao', 'linhas': self.linhas_proposicoes, 'chave': ('id',),
+             'query': QUERY_PROPOSICOES,
+             'remover': "UNWIND $rows AS row MATCH (n:Proposicao {id: row.id}) DETACH DELETE n"},
+            {'nome': 'TipoVoto', 'linhas': self.linhas_tipos_voto, 'chave': ('codigo',),
+             'query': QUERY_TIPOS_VOTO,
+             'remover': "UNWIND $rows AS row MATCH (n:TipoVoto {codigo: row.codigo}) DETACH DELETE n"},
+            {'nome': 'Votacao', 'linhas': self.linhas_votacoes, 'chave': ('id',), 'query': QUERY_VOTACOES,
+             'remover': "UNWIND $rows AS row MATCH (n:Votacao {id: row.id}) DETACH DELETE n"},
+            {'nome': 'FILIADO_A', 'linhas': self.linhas_filiados, 'chave': ('id', 'idPartido', 'idLegislatura'),
+             'query': QUERY_FILIADO_A, 'particao': lambda linha: linha['idPartido'],
+             'remover': """
+             UNWIND $rows AS row
+             MATCH (:Deputado {id: row.id})-[r:FILIADO_A {idLegislatura: row.idLegislatura}]->
+                   (:Partido {id: row.idPartido})
+             DELETE r
+             """},
+            {'nome': 'REPRESENTA', 'linhas': self.linhas_representa, 'chave': ('id', 'sigla', 'idLegislatura'),
+             'query': QUERY_REPRESENTA, 'particao': lambda linha: linha['sigla'],
+             'remover': """
+             UNWIND $rows AS row
+             MATCH (:Deputado {id: row.id})-[r:REPRESENTA {idLegislatura: row.idLegislatura}]->
+                   (:UF {sigla: row.sigla})
+             DELETE r
+             """},
+            {'nome': 'MEMBRO_DE', 'linhas': self.linhas_membros_frentes, 'chave': ('idDeputado', 'idFrente'),
+             'query': QUERY_MEMBROS_FRENTES, 'particao': lambda linha: linha['idDeputado'],
+             'remover': """
+             UNWIND $rows AS row
+             MATCH (:Deputado {id: row.idDeputado})-[r:MEMBRO_DE]->(:Frente {id: row.idFrente})
+             DELETE r
+             """},
+            {'nome': 'AUTOR_DE', 'linhas': self.linhas_autores, 'chave': ('idDeputado', 'idProposicao'),
+             'query': QUERY_AUTORES, 'particao': lambda linha: linha['idDeputado'],
+             'remover': """
+             UNWIND $rows AS row
+             MATCH (:Deputado {id: row.idDeputado})-[r:AUTOR_DE]->(:Proposicao {id: row.idProposicao})
+             DELETE r
+             """},
+            {'nome': 'VOTOU', 'linhas': self.linhas_votos, 'chave': ('idDeputado', 'idVotacao'),
+             'query': QUERY_VOTOS, 'particao': lambda linha: linha['idDeputado'],
+             'remover': """
+             UNWIND $rows AS row
+             MATCH (:Deputado {id: row.idDeputado})-[r:VOTOU]->(:Votacao {id: row.idVotacao})
+             DELETE r
+             """},
+        ]
+
+    @staticmethod
+    def _chave(entidade, linha):
+        return json.dumps([linha[campo] for campo in entidade['chave']], ensure_ascii=False)
+
+    @staticmethod
+    def _hash(linha):
+        conteudo = json.dumps(linha, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(conteudo.encode('utf-8')).hexdigest()[:16]
+
+    def calcular_estado(self):
+        """
+        Hash do conteúdo de cada entidade no snapshot atual dos arquivos
+        ({entidade: {chave: hash}}). Linhas repetidas de uma mesma chave
+        ficam com a última, como no SET da importação.
+        """
+        estado = {}
+        for entidade in self._entidades():
+            estado[entidade['nome']] = {self._chave(entidade, linha): self._hash(linha)
+                                        for linha in entidade['linhas']()}
+        return estado
+
+    def carregar_estado(self):
+        if not os.path.exists(self.arquivo_estado):
+            return {}
+        with open(self.arquivo_estado, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def salvar_estado(self, estado):
+        """Grava o estado de forma atômica (um arquivo parcial nunca substitui o anterior)"""
+        os.makedirs(os.path.dirname(self.arquivo_estado) or '.', exist_ok=True)
+        temporario = self.arquivo_estado + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(estado, f, ensure_ascii=False)
+        os.replace(temporario, self.arquivo_estado)
+
+    def importar_incremental(self, dry_run=False):
+        """
+        Compara o snapshot atual com o estado da última importação e envia
+        só o que mudou: linhas novas ou alteradas (MERGE/SET) e linhas que
+        sumiram (DELETE). Com dry_run=True apenas mostra o tamanho do diff.
+        """
+        print("="*70)
+        print("🔁 IMPORTAÇÃO INCREMENTAL" + (" (dry-run)" if dry_run else ""))
+        print("="*70)
+        print()
+
+        anterior = self.carregar_estado()
+        if not anterior:
+            print("  → Nenhum estado anterior: todas as linhas serão tratadas como novas\n")
+        atual = self.calcular_estado()
+        entidades = self._entidades()
+
+        diffs = {}
+        print("📐 Diferenças em relação à última importação:")
+        for entidade in entidades:
+            nome = entidade['nome']
+            antes, agora = anterior.get(nome, {}), atual[nome]
+            novos = {chave for chave in agora if chave not in antes}
+            alterados = {chave for chave, h in agora.items() if chave in antes and antes[chave] != h}
+            removidos = [chave for chave in antes if chave not in agora]
+            diffs[nome] = (novos | alterados, removidos)
+            print(f"  • {nome}: {len(novos):,} novos, {len(alterados):,} alterados, "
+                  f"{len(removidos):,} removidos ({len(agora):,} no snapshot)")
+        total = sum(len(escrever) + len(remover) for escrever, remover in diffs.values())
+        print(f"\n  Total: {total:,} linhas a enviar\n")
+
+        if dry_run or not total:
+            return diffs
+
+        self.criar_constraints()
+        self.garantir_indices()
+
+        # Remoções primeiro (relações antes dos nós), depois inserções/alterações
+        for entidade in reversed(entidades):
+            removidos = diffs[entidade['nome']][1]
+            if removidos:
+                linhas = (dict(zip(entidade['chave'], json.loads(chave))) for chave in removidos)
+                feitas = self.escrever_em_lotes(f"remover_{entidade['nome']}", entidade['remover'], linhas)
+                print(f"  ✓ {entidade['nome']}: {feitas} removidos ({self._vazao()})" + " "*20)
+
+        for entidade in entidades:
+            escrever = diffs[entidade['nome']][0]
+            if not escrever:
+                continue
+            linhas = (linha for linha in entidade['linhas']() if self._chave(entidade, linha) in escrever)
+            etapa = f"atualizar_{entidade['nome']}"
+            if entidade.get('particao'):
+                feitas = self.escrever_particionado(etapa, entidade['query'], linhas, entidade['particao'])
+            else:
+                feitas = self.escrever_em_lotes(etapa, entidade['query'], linhas)
+            print(f"  ✓ {entidade['nome']}: {feitas} linhas escritas ({self._vazao()})" + " "*20)
+
+        # Grafo sem agregados (ex.: carga pelo neo4j-admin): calcula todos
+        if self._agregados_no_grafo():
+            self.atualizar_agregados(*self._agregados_afetados(diffs, atual))
+        else:
+            self.atualizar_agregados()
+
+        self.salvar_estado(atual)
+        self.registrar_versao()
+        print(f"\n✅ Estado salvo em {self.arquivo_estado}\n")
+        return diffs
+
+    def _agregados_afetados(self, diffs, atual):
+        """
+        Partidos e UFs cujos agregados mudam com um diff incremental: os das
+        filiações/representações novas, alteradas ou removidas, os partidos
+        alterados e os partidos atuais dos deputados que mudaram de UF
+        """
+        def chaves(nome):
+            escrever, remover = diffs.get(nome, ((), ()))
+            return [json.loads(chave) for chave in list(escrever) + list(remover)]
+
+        partidos = {id_partido for _, id_partido, _ in chaves('FILIADO_A')}
+        partidos |= {id_partido for id_partido, in chaves('Partido')}
+        representa = chaves('REPRESENTA')
+        deputados = {id_deputado for id_deputado, _, _ in representa}
+        for chave in atual.get('FILIADO_A', {}):
+            id_deputado, id_partido, _ = json.loads(chave)
+            if id_deputado in deputados:
+                partidos.add(id_partido)
+        return partidos, {sigla for _, sigla, _ in representa}
+
+    def atualizar_agregados(self, ids_partidos=None, siglas_ufs=None):
+        """
+        Recalcula os agregados materializados: numDeputados em Partido e UF,
+        nós Regiao e PartidoRegiao. Sem argumentos, recalcula todos; com os
+        conjuntos de _agregados_afetados, só os que mudaram.
+        """
+        if ids_partidos is None:
+            ids_partidos = {partido['id'] for partido in self.linhas_partidos()}
+        if siglas_ufs is None:
+            siglas_ufs = {uf['sigla'] for uf in UFS}
+        regiao_por_uf = {uf['sigla']: uf['regiao'] for uf in UFS}
+        regioes = sorted({regiao_por_uf[sigla] for sigla in siglas_ufs if sigla in regiao_por_uf})
+        if not ids_partidos and not siglas_ufs:
+            return
+
+        print("🧮 Atualizando agregados das análises...")
+        self.escrever_em_lotes('agregados_partidos', QUERY_AGREGADOS_PARTIDOS,
+                               ({'id': id_partido} for id_partido in sorted(ids_partidos)), 'partidos')
+        self.escrever_em_lotes('agregados_ufs', QUERY_AGREGADOS_UFS,
+                               ({'sigla': sigla} for sigla in sorted(siglas_ufs)), 'UFs')
+        self.escrever_em_lotes('agregados_regioes', QUERY_AGREGADOS_REGIOES,
+                               ({'nome': nome} for nome in regioes), 'regiões')
+        print(f"✓ Agregados: {len(ids_partidos)} partidos, {len(siglas_ufs)} UFs, "
+              f"{len(regioes)} regiões" + " "*20 + "\n")
+
+    def _agregados_no_grafo(self):
+        """Indica se a última carga deixou os agregados calculados (ver registrar_versao)"""
         with self.driver.session() as session:
-            for membro in membros:
-                query = """
-                MATCH (d:Deputado {id: $idDeputado})
-                MATCH (f:Frente {id: $idFrente})
-                MERGE (d)-[r:MEMBRO_DE]->(f)
-                SET r.titulo = $titulo
-                """
-                session.run(query,
-                    idDeputado=membro['idDeputado'],
-                    idFrente=membro['idFrente'],
-                    titulo=membro.get('titulo', 'Membro'))
-
-            print(f"✓ {len(membros)} relacionamentos MEMBRO_DE criados\n")
+            registro = session.run("MATCH (m:Metadados {chave: 'grafo'}) "
+                                   "RETURN coalesce(m.agregados, false) AS agregados").single()
+        return bool(registro and registro['agregados'])
+
+    def registrar_versao(self, agregados=True):
+        """
+        Grava uma nova versão do grafo (nó :Metadados) depois de uma carga
+        bem-sucedida; resultados em cache das análises da versão anterior
+        deixam de valer. `agregados` indica que os agregados estão em dia.
+        """
+        versao = uuid.uuid4().hex
+        with self.driver.session() as session:
+            session.run(QUERY_VERSAO, versao=versao, agregados=agregados).consume()
+        print(f"🔖 Versão do grafo: {versao[:8]}")
+        return versao
 
     def estatisticas(self):
-        """Mostra estatísticas do grafo"""
+        """Mostra estatísticas do grafo (uma consulta só, ver estatisticas_grafo.py)"""
         print("="*70)
         print("📊 ESTATÍSTICAS DO GRAFO")
         print("="*70)
 
-        with self.driver.session() as session:
-            # Contar nós
-            print("\n📍 Nós:")
-            tipos = ["Deputado", "Partido", "Frente", "UF"]
-            for tipo in tipos:
-                query = f"MATCH (n:{tipo}) RETURN count(n) as count"
-                result = session.run(query)
-                count = result.single()['count']
-                print(f"  • {tipo}: {count:,}")
-
-            # Contar relacionamentos
-            print("\n🔗 Relacionamentos:")
-            rels = ["FILIADO_A", "REPRESENTA", "MEMBRO_DE"]
-            for rel in rels:
-                query = f"MATCH ()-[r:{rel}]->() RETURN count(r) as count"
-                result = session.run(query)
-                count = result.single()['count']
-                if count > 0:
-                    print(f"  • {rel}: {count:,}")
+        estatisticas = EstatisticasGrafo(self.driver).coletar()
 
+        print("\n📍 Nós:")
+        for tipo, count in estatisticas['nos'].items():
+            print(f"  • {tipo}: {count:,}")
+
+        print("\n🔗 Relacionamentos:")
+        for rel, count in estatisticas['relacionamentos'].items():
+            if count > 0:
+                print(f"  • {rel}: {count:,}")
+
+        print("\n📐 Distribuição de grau:")
+        for nome, grau in estatisticas['graus'].items():
+            texto = descrever_grau(grau)
+            if texto:
+                print(f"  • {nome}: {texto}")
+
+        print(f"\n  (via {estatisticas['fonte']}, {estatisticas['segundos']*1000:.0f} ms)")
         print("\n" + "="*70 + "\n")
+        self.ultimas_estatisticas = estatisticas
+        return estatisticas
 
     def importar_tudo(self):
         """Importa todos os dados disponíveis"""
@@ -271,14 +1335,37 @@ class ImportadorNeo4jAura:
         print()
 
         self.criar_constraints()
+        self.garantir_indices()
         self.criar_ufs()
         self.importar_partidos()
         self.importar_deputados()
         self.importar_frentes()
         self.importar_membros_frentes()
+        self.importar_proposicoes()
+        self.importar_votacoes()
+        self.importar_autores()
+        self.importar_votos()
 
+        self._concluir_importacao()
+
+    def _concluir_importacao(self):
+        """Agregados, estatísticas, estado incremental e resumo de vazão ao fim da carga"""
+        self.atualizar_agregados()
         self.estatisticas()
 
+        # Ponto de partida para as próximas importações incrementais
+        self.salvar_estado(self.calcular_estado())
+        self.registrar_versao()
+
+        print(f"⏱  Vazão por etapa (lotes de {self.tamanho_lote}, {self.workers} workers):")
+        tempos = self.metricas.relatorio()['etapas']
+        for etapa in self.etapas:
+            tempo = tempos[etapa['etapa']]
+            print(f"  • {etapa['etapa']}: {etapa['linhas']:,} linhas em {etapa['segundos']:.1f}s "
+                  f"({etapa['linhas_por_segundo'] or 0:,.0f} linhas/s) | leitura {tempo['segundos_leitura']:.1f}s, "
+                  f"servidor {tempo['segundos_servidor']:.1f}s, cliente/rede {tempo['segundos_cliente_rede']:.1f}s")
+        print()
+
         print("✅ IMPORTAÇÃO CONCLUÍDA COM SUCESSO!")
         print("="*70)
         print("\n💡 Próximos passos:")
@@ -286,19 +1373,141 @@ class ImportadorNeo4jAura:
         print("  2. Execute: MATCH (n) RETURN n LIMIT 25")
         print("  3. Visualize seu grafo!\n")
 
+    async def _importar_etapas_async(self):
+        """
+        Etapas do pipeline assíncrono. Os nós não dependem uns dos outros e
+        são escritos ao mesmo tempo; as relações vêm depois, uma etapa por
+        vez (todas tocam os nós Deputado e disputariam os mesmos locks).
+        """
+        nos = [
+            ('ufs', QUERY_UFS, iter(UFS), 'UFs'),
+            ('partidos', QUERY_PARTIDOS, self.linhas_partidos(), 'partidos'),
+            ('deputados', QUERY_DEPUTADOS, self.linhas_deputados(), 'deputados'),
+            ('frentes', QUERY_FRENTES, self.linhas_frentes(), 'frentes'),
+            ('proposicoes', QUERY_PROPOSICOES, self.linhas_proposicoes(), 'proposições'),
+            ('tipos_voto', QUERY_TIPOS_VOTO, self.linhas_tipos_voto(), 'tipos de voto'),
+            ('votacoes', QUERY_VOTACOES, self.linhas_votacoes(), 'votações'),
+        ]
+        print(f"📦 Importando nós ({len(nos)} etapas em paralelo)...")
+        # Deixa todas as etapas terminarem antes de propagar um erro
+        etapas = await asyncio.gather(*(self.escrever_async(etapa, query, linhas, rotulo=rotulo)
+                                        for etapa, query, linhas, rotulo in nos), return_exceptions=True)
+        for erro in etapas:
+            if isinstance(erro, BaseException):
+                raise erro
+        for etapa in etapas:
+            print(f"  ✓ {etapa['etapa']}: {etapa['linhas']:,} linhas ({etapa['segundos']:.1f}s)" + " "*20)
+        print()
+
+        relacoes = [
+            ('filiado_a', 'FILIADO_A', QUERY_FILIADO_A, self.linhas_filiados(),
+             lambda linha: linha['idPartido'], 'filiações'),
+            ('representa', 'REPRESENTA', QUERY_REPRESENTA, self.linhas_representa(),
+             lambda linha: linha['sigla'], 'representações'),
+            ('membros_frentes', 'MEMBRO_DE', QUERY_MEMBROS_FRENTES, self.linhas_membros_frentes(),
+             lambda linha: linha['idDeputado'], 'membros'),
+            ('autores', 'AUTOR_DE', QUERY_AUTORES, self.linhas_autores(),
+             lambda linha: linha['idDeputado'], 'autorias'),
+            ('votos', 'VOTOU', QUERY_VOTOS, self.linhas_votos(),
+             lambda linha: linha['idDeputado'], 'votos'),
+        ]
+        print("🔗 Importando relacionamentos...")
+        for etapa, tipo, query, linhas, particao, rotulo in relacoes:
+            await self.escrever_async(etapa, query, linhas, particao, rotulo)
+            print(f"  ✓ {tipo}: {self._vazao()}" + " "*20)
+            if self.nao_resolvidos.get(tipo):
+                print(f"  ⚠ {self.nao_resolvidos[tipo]} registros sem ponta conhecida")
+        print()
+
+    async def _executar_async(self):
+        criado_aqui = self.driver_async is None
+        if criado_aqui:
+            self.driver_async = AsyncGraphDatabase.driver(self.URI, auth=self.AUTH)
+        try:
+            await self.driver_async.verify_connectivity()
+            await self._importar_etapas_async()
+        finally:
+            if criado_aqui:
+                await self.driver_async.close()
+                self.driver_async = None
+
+    def importar_tudo_async(self):
+        """
+        Como importar_tudo, mas com o pipeline assíncrono (AsyncGraphDatabase):
+        a leitura dos arquivos e as escritas se sobrepõem, e as etapas de nós
+        rodam em paralelo. `workers` é o número de tarefas de escrita por etapa.
+        """
+        print("="*70)
+        print(f"🚀 IMPORTAÇÃO PARA NEO4J AURA (assíncrona, {self.workers} escritores por etapa)")
+        print("="*70)
+        print()
+
+        self.criar_constraints()
+        self.garantir_indices()
+
+        inicio = time.perf_counter()
+        asyncio.run(self._executar_async())
+        print(f"⏱  Pipeline assíncrono concluído em {time.perf_counter() - inicio:.1f}s\n")
+
+        self._concluir_importacao()
+
 
 if __name__ == "__main__":
+    import argparse
     import sys
 
+    parser = argparse.ArgumentParser(description='Importa os dados coletados para o Neo4j Aura')
+    parser.add_argument('--limpar', action='store_true',
+                        help='Remove todos os dados antes de importar (padrão quando não há argumentos)')
+    parser.add_argument('--tamanho-lote', type=int, default=1000,
+                        help='Linhas enviadas por transação (UNWIND)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Sessões paralelas para os relacionamentos (particionados por nó)')
+    parser.add_argument('--rotulos', nargs='+', default=None,
+                        help='Com --limpar, remove só os nós destes rótulos (ex.: Deputado Frente)')
+    parser.add_argument('--lote-limpeza', type=int, default=10000,
+                        help='Linhas apagadas por transação na limpeza (CALL {} IN TRANSACTIONS)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Envia só o que mudou desde a última importação (sem limpar o banco)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Com --incremental, apenas mostra o tamanho do diff')
+    parser.add_argument('--async', dest='assincrono', action='store_true',
+                        help='Pipeline assíncrono: leitura e escrita sobrepostas, nós em paralelo')
+    parser.add_argument('--agregados', action='store_true',
+                        help='Só cria os índices e recalcula os agregados das análises (ex.: depois do neo4j-admin import)')
+    parser.add_argument('--relatorio', default=ARQUIVO_RELATORIO,
+                        help='Onde gravar o relatório JSON das escritas (tempos e contadores por etapa)')
+    parser.add_argument('--baseline', default=None,
+                        help='Relatório de uma importação anterior para comparar a vazão por etapa')
+    args = parser.parse_args()
+    if args.agregados and (args.limpar or args.incremental or args.dry_run or args.assincrono):
+        parser.error('--agregados não pode ser combinado com outras operações')
+    if args.limpar and (args.incremental or args.dry_run):
+        parser.error('--limpar não pode ser usado com --incremental/--dry-run')
+    if args.assincrono and (args.incremental or args.dry_run):
+        parser.error('--async vale só para a importação completa')
+
     try:
-        importador = ImportadorNeo4jAura()
+        importador = ImportadorNeo4jAura(tamanho_lote=args.tamanho_lote, workers=args.workers)
 
-        # Limpar banco automaticamente se for passado --limpar
-        if '--limpar' in sys.argv or len(sys.argv) == 1:
-            importador.limpar_banco()
+        if args.agregados:
+            # O neo4j-admin import não cria índices; aproveita para criá-los
+            importador.criar_constraints()
+            importador.garantir_indices()
+            importador.atualizar_agregados()
+            importador.registrar_versao()
+        elif args.incremental or args.dry_run:
+            importador.importar_incremental(dry_run=args.dry_run)
+        else:
+            # Limpar banco automaticamente se for passado --limpar
+            if args.limpar or len(sys.argv) == 1:
+                importador.limpar_banco(args.rotulos, args.lote_limpeza)
 
-        # Importar tudo
-        importador.importar_tudo()
+            # Importar tudo
+            if args.assincrono:
+                importador.importar_tudo_async()
+            else:
+                importador.importar_tudo()
 
     except Exception as e:
         print(f"\n❌ Erro: {str(e)}")
@@ -309,6 +1518,11 @@ if __name__ == "__main__":
         print("  4. Os arquivos JSON existem em dados_camara/")
 
     finally:
+        try:
+            if importador.etapas and not args.dry_run:
+                importador.salvar_relatorio(args.relatorio, args.baseline)
+        except NameError:
+            pass
         try:
             importador.close()
         except:
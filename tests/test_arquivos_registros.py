@@ -0,0 +1,23 @@
+import io
+import json
+
+import pytest
+
+from arquivos_registros import _iterar_array_json
+
+NUMEROS = [1.5, 2, -3.25, 1e-07, 6.02e+23, 0, -0.5, 123456789, 10.0, 4]
+
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 2, 3, 4, 5, 7, 11])
+@pytest.mark.parametrize('texto', [
+    '[1.5, 2]',
+    '[1.5,2,-3.25,1E-7,6.02e+23]',
+    json.dumps(NUMEROS),
+    json.dumps(NUMEROS, indent=2),
+    json.dumps({'links': [{'rel': 'self'}], 'dados': NUMEROS}),
+])
+def test_numeros_cortados_entre_blocos(texto, tamanho_bloco):
+    esperado = json.loads(texto)
+    if isinstance(esperado, dict):
+        esperado = esperado['dados']
+    assert list(_iterar_array_json(io.StringIO(texto), tamanho_bloco=tamanho_bloco)) == esperado